@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for github3.py.
+
+Each module holds classes in the style of airspeed velocity: ``setup`` is
+run before timing, every ``time_*`` method is timed and ``teardown`` is run
+afterwards. A ``setup`` raising :class:`NotImplementedError` skips the
+benchmark, e.g., because an optional dependency is missing. Classes may declare
+``params`` and ``param_names``; ``setup`` and every ``time_*`` method then
+receive one combination of parameters at a time.
+
+Run every benchmark with ``python -m benchmarks`` (see ``--help``) or with
+``asv run``. A single module can also be run directly, e.g.,
+``python -m benchmarks.timestamps``.
+
+Nothing here talks to GitHub: the fixtures in ``tests/json`` and the
+responses recorded in ``tests/cassettes`` are replayed from memory.
+"""
+import base64
+import glob
+import itertools
+import json
+import os
+import timeit
+import zlib
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+import github3
+
+TESTS = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'tests')
+FIXTURES = os.path.join(TESTS, 'json')
+UNIT_FIXTURES = os.path.join(TESTS, 'unit', 'json')
+CASSETTES = os.path.join(TESTS, 'cassettes')
+
+
+def _load_directory(directory):
+    fixtures = {}
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if not os.path.isfile(path):
+            continue
+        with open(path) as fd:
+            try:
+                fixtures[name] = json.load(fd)
+            except ValueError:
+                continue
+    return fixtures
+
+
+def load_fixtures():
+    """Return the decoded JSON of every fixture in ``tests/json``."""
+    return _load_directory(FIXTURES)
+
+
+def load_unit_fixtures():
+    """Return the decoded JSON of every fixture in ``tests/unit/json``."""
+    return _load_directory(UNIT_FIXTURES)
+
+
+def load_cassette(name):
+    """Return the interactions recorded in ``tests/cassettes/<name>.json``."""
+    with open(os.path.join(CASSETTES, name + '.json')) as fd:
+        return json.load(fd)['http_interactions']
+
+
+def cassette_names():
+    """Return the names of every cassette in ``tests/cassettes``."""
+    return sorted(os.path.splitext(os.path.basename(path))[0]
+                  for path in glob.glob(os.path.join(CASSETTES, '*.json')))
+
+
+def recorded_response(interaction):
+    """Build a :class:`requests.Response` from a recorded interaction.
+
+    Cassettes recorded by older and newer versions of Betamax are both
+    understood. The body is stored decompressed.
+    """
+    recorded = interaction['response']
+    headers = CaseInsensitiveDict()
+    for key, value in recorded['headers'].items():
+        headers[key] = ', '.join(value) if isinstance(value, list) else value
+
+    body = recorded['body']
+    if body.get('base64_string'):
+        content = base64.b64decode(body['base64_string'])
+    else:
+        content = (body.get('string') or '').encode('utf-8')
+    if 'gzip' in headers.get('Content-Encoding', ''):
+        content = zlib.decompress(content, 16 + zlib.MAX_WBITS)
+        del headers['Content-Encoding']
+
+    response = requests.Response()
+    status = recorded.get('status', {})
+    response.status_code = recorded.get('status_code') or status.get('code')
+    response.reason = status.get('message')
+    response.headers = headers
+    response.url = recorded.get('url') or interaction['request']['uri']
+    response.encoding = 'utf-8'
+    response._content = content
+    # Lets iter_content, i.e., streaming, read the body from memory
+    response._content_consumed = True
+    return response
+
+
+class ReplayAdapter(BaseAdapter):
+
+    """A transport adapter answering requests with recorded responses.
+
+    Responses are looked up by method and URL. The URL's query string is
+    ignored when there is no exact match.
+    """
+
+    def __init__(self, interactions=()):
+        super(ReplayAdapter, self).__init__()
+        self.responses = {}
+        for interaction in interactions:
+            self.add(interaction['request']['method'],
+                     interaction['request']['uri'],
+                     recorded_response(interaction))
+
+    def add(self, method, url, response):
+        """Answer ``method`` requests to ``url`` with ``response``."""
+        self.responses[(method.upper(), url)] = response
+        self.responses.setdefault((method.upper(), url.split('?')[0]),
+                                  response)
+
+    def send(self, request, **kwargs):
+        key = (request.method, request.url)
+        if key not in self.responses:
+            key = (request.method, request.url.split('?')[0])
+        recorded = self.responses[key]
+        response = requests.Response()
+        response.__dict__.update(recorded.__dict__)
+        response.headers = CaseInsensitiveDict(recorded.headers)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def replay_session(adapter):
+    """Return a :class:`GitHub <github3.github.GitHub>` using ``adapter``."""
+    gh = github3.GitHub()
+    gh.session.mount('https://', adapter)
+    gh.session.mount('http://', adapter)
+    return gh
+
+
+def _parameters(benchmark):
+    params = getattr(benchmark, 'params', None)
+    if not params:
+        return [()]
+    if not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def run(benchmark, number=20, repeat=5):
+    """Time every ``time_*`` method of ``benchmark``.
+
+    :returns: dictionary mapping names like ``Class.time_method(param)`` to
+        the best time of one call in seconds
+    """
+    results = {}
+    instance = benchmark()
+    for name in sorted(dir(instance)):
+        if not name.startswith('time_'):
+            continue
+        for params in _parameters(benchmark):
+            setup = getattr(instance, 'setup', None)
+            if setup is not None:
+                try:
+                    setup(*params)
+                except NotImplementedError:
+                    continue
+            method = getattr(instance, name)
+            try:
+                best = min(timeit.repeat(lambda: method(*params),
+                                         number=number,
+                                         repeat=repeat)) / number
+            finally:
+                teardown = getattr(instance, 'teardown', None)
+                if teardown is not None:
+                    teardown(*params)
+            key = '{0}.{1}'.format(benchmark.__name__, name)
+            if params:
+                key += '({0})'.format(', '.join(str(p) for p in params))
+            results[key] = best
+    return results
+
+
+def report(benchmark, number=20):
+    """Time every ``time_*`` method of ``benchmark`` and print the results."""
+    for key, best in sorted(run(benchmark, number).items()):
+        print('{0}: {1:.3f} ms'.format(key, best * 1000))
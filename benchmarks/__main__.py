@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""Run the benchmarks, store their results and compare them to earlier runs.
+
+Examples::
+
+    # Run everything and store the results
+    python -m benchmarks --save before.json
+    # ... change github3.py ...
+    python -m benchmarks --compare before.json
+
+Comparing exits with a non-zero status if a benchmark got slower by more than
+``--threshold``.
+"""
+from __future__ import print_function
+
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import platform
+import re
+import subprocess
+import sys
+
+import benchmarks
+
+
+def discover():
+    """Return every benchmark class of every module in this package."""
+    classes = []
+    for _, name, _ in pkgutil.iter_modules(benchmarks.__path__):
+        if name.startswith('_'):
+            continue
+        module = importlib.import_module('benchmarks.' + name)
+        for _, cls in sorted(inspect.getmembers(module, inspect.isclass)):
+            if cls.__module__ != module.__name__:
+                continue
+            if any(attr.startswith('time_') for attr in dir(cls)):
+                classes.append(cls)
+    return classes
+
+
+def git_commit():
+    try:
+        output = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(benchmarks.TESTS)
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('utf-8').strip()
+
+
+def compare(previous, results, threshold):
+    """Print the ratio of every result to ``previous``.
+
+    :returns: names of the benchmarks slower by more than ``threshold``
+    """
+    regressions = []
+    for name, seconds in sorted(results.items()):
+        before = previous.get(name)
+        if not before:
+            print('{0}: {1:.3f} ms (new)'.format(name, seconds * 1000))
+            continue
+        ratio = seconds / before
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print('{0}: {1:.3f} ms -> {2:.3f} ms ({3:.2f}x){4}'.format(
+            name, before * 1000, seconds * 1000, ratio, flag
+        ))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20,
+                        help='calls per timing, the best of 5 is kept')
+    parser.add_argument('--filter', default='',
+                        help='only run benchmarks whose name matches this '
+                             'regular expression')
+    parser.add_argument('--save', metavar='PATH',
+                        help='store the results as JSON in PATH')
+    parser.add_argument('--compare', metavar='PATH',
+                        help='compare the results to those saved in PATH')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='slowdown reported as a regression when '
+                             'comparing, default: 0.1, i.e., 10%%')
+    args = parser.parse_args(argv)
+
+    pattern = re.compile(args.filter)
+    results = {}
+    for cls in discover():
+        if not pattern.search(cls.__name__):
+            continue
+        results.update(benchmarks.run(cls, args.number))
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as fd:
+            previous = json.load(fd)['results']
+        regressions = compare(previous, results, args.threshold)
+    else:
+        for name, seconds in sorted(results.items()):
+            print('{0}: {1:.3f} ms'.format(name, seconds * 1000))
+
+    if args.save:
+        with open(args.save, 'w') as fd:
+            json.dump({
+                'commit': git_commit(),
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'results': results,
+            }, fd, indent=2, sort_keys=True)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks comparing the JSON codecs on the recorded cassettes."""
+import json
+
+from github3 import codec
+
+from . import cassette_names, load_cassette, recorded_response, report
+
+
+def response_bodies():
+    """Return the JSON response bodies recorded in ``tests/cassettes``."""
+    bodies = []
+    for name in cassette_names():
+        for interaction in load_cassette(name):
+            content = recorded_response(interaction).content
+            try:
+                json.loads(content.decode('utf-8'))
+            except ValueError:
+                continue
+            bodies.append(content)
+    return bodies
+
+
+class CodecBenchmarks(object):
+
+    """Decode and re-encode every recorded response body.
+
+    This class times the standard library's codec, :func:`benchmarks`
+    creates a sub-class for every other installed codec.
+    """
+
+    codec_class = codec.JSONCodec
+
+    def setup(self):
+        self.codec = self.codec_class()
+        self.bodies = response_bodies()
+        self.documents = [self.codec.loads(b) for b in self.bodies]
+
+    def time_loads(self):
+        for body in self.bodies:
+            self.codec.loads(body)
+
+    def time_dumps(self):
+        for document in self.documents:
+            self.codec.dumps(document)
+
+
+def benchmarks():
+    """Return a benchmark class for every installed codec."""
+    classes = [CodecBenchmarks]
+    for instance in codec.available_codecs():
+        if type(instance) is codec.JSONCodec:
+            continue
+        name = '{0}Benchmarks'.format(instance.__class__.__name__)
+        classes.append(type(str(name), (CodecBenchmarks,),
+                            {'codec_class': instance.__class__}))
+    return classes
+
+
+for _benchmark in benchmarks()[1:]:
+    globals()[_benchmark.__name__] = _benchmark
+
+
+if __name__ == '__main__':
+    for benchmark in benchmarks():
+        report(benchmark)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for creating events and reading their payloads."""
+from github3.events import Event
+from github3.session import GitHubSession
+
+from . import load_cassette, recorded_response, report
+
+CASSETTES = ['GitHub_all_events', 'Organization_all_events']
+
+
+def recorded_events():
+    """Return every event recorded in the event listing cassettes."""
+    events = []
+    for name in CASSETTES:
+        for interaction in load_cassette(name):
+            json = recorded_response(interaction).json()
+            if isinstance(json, list):
+                events.extend(e for e in json if 'type' in e)
+    return events
+
+
+class EventHandling(object):
+
+    """Create an :class:`Event <github3.events.Event>` for every recorded
+    event."""
+
+    def setup(self):
+        self.events = recorded_events()
+        self.session = GitHubSession()
+
+    def time_construct(self):
+        for json in self.events:
+            Event(json, self.session)
+
+    def time_construct_and_read_payload(self):
+        """Create the events and convert every member of their payloads."""
+        for json in self.events:
+            event = Event(json, self.session)
+            for key in event.payload:
+                event.payload[key]
+
+    def time_construct_and_read_actor(self):
+        for json in self.events:
+            Event(json, self.session).actor.login
+
+
+if __name__ == '__main__':
+    report(EventHandling)
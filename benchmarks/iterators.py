@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for paginating through listings and search results."""
+import json
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from . import (ReplayAdapter, load_cassette, load_unit_fixtures,
+               replay_session, report)
+
+USERS_URL = 'https://api.github.com/users'
+PAGES = 10
+PER_PAGE = 100
+
+
+def page_response(url, items, next_url=None, last_url=None):
+    """Build a 200 response holding ``items`` with GitHub's Link header."""
+    links = []
+    if next_url:
+        links.append('<{0}>; rel="next"'.format(next_url))
+    if last_url:
+        links.append('<{0}>; rel="last"'.format(last_url))
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.encoding = 'utf-8'
+    response.headers = CaseInsensitiveDict({
+        'Content-Type': 'application/json; charset=utf-8',
+    })
+    if links:
+        response.headers['Link'] = ', '.join(links)
+    response._content = json.dumps(items).encode('utf-8')
+    response._content_consumed = True
+    return response
+
+
+def paginated_users(pages=PAGES, per_page=PER_PAGE):
+    """Return a :class:`ReplayAdapter` serving ``pages`` pages of users."""
+    user = load_unit_fixtures()['user_example']
+    adapter = ReplayAdapter()
+    last_url = '{0}?per_page={1}&page={2}'.format(USERS_URL, per_page, pages)
+    for page in range(1, pages + 1):
+        url = '{0}?per_page={1}&page={2}'.format(USERS_URL, per_page, page)
+        items = [dict(user, id=(page - 1) * per_page + i)
+                 for i in range(per_page)]
+        next_url = None
+        if page < pages:
+            next_url = '{0}?per_page={1}&page={2}'.format(
+                USERS_URL, per_page, page + 1
+            )
+        adapter.add('GET', USERS_URL if page == 1 else url,
+                    page_response(url, items, next_url, last_url))
+    return adapter
+
+
+class Pagination(object):
+
+    """Iterate over 10 pages of 100 users with each iterator mode."""
+
+    params = ['models', 'raw', 'compact', 'stream', 'prefetch']
+    param_names = ['mode']
+
+    def setup(self, mode):
+        self.gh = replay_session(paginated_users())
+
+    def time_all_users(self, mode):
+        iterator = self.gh.all_users()
+        if mode == 'prefetch':
+            iterator.prefetch = 4
+        elif mode != 'models':
+            setattr(iterator, mode, True)
+        for _ in iterator:
+            pass
+
+
+class SearchIteration(object):
+
+    """Iterate over the recorded results of a repository search."""
+
+    params = [False, True]
+    param_names = ['stream']
+
+    def setup(self, stream):
+        self.gh = replay_session(
+            ReplayAdapter(load_cassette('GitHub_search_repositories'))
+        )
+
+    def time_search_repositories(self, stream):
+        iterator = self.gh.search_repositories('github3 language:python')
+        iterator.stream = stream
+        for result in iterator:
+            result.repository.full_name
+
+
+if __name__ == '__main__':
+    report(Pagination, number=5)
+    report(SearchIteration, number=5)
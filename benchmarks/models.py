@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for constructing models from the ``tests/unit/json``
+fixtures."""
+from github3 import events, gists, git, issues, orgs, pulls, repos, users
+from github3.models import lazy_attribute_names
+from github3.session import GitHubSession
+
+from . import load_unit_fixtures, report
+
+#: Model name mapped to the fixture and class used to construct it
+MODELS = {
+    'Event': ('event_example', events.Event),
+    'Gist': ('gist_example', gists.Gist),
+    'Issue': ('issue_example', issues.Issue),
+    'Organization': ('org_example', orgs.Organization),
+    'PullRequest': ('pull_request_example', pulls.PullRequest),
+    'RepoCommit': ('commit_example', repos.commit.RepoCommit),
+    'Repository': ('repo_example', repos.Repository),
+    'ShortUser': ('user_example', users.ShortUser),
+    'Tree': ('tree_example', git.Tree),
+    'User': ('user_example', users.User),
+}
+
+
+class ModelConstruction(object):
+
+    """Construct 100 instances of each model from its fixture."""
+
+    params = sorted(MODELS)
+    param_names = ['model']
+
+    def setup(self, model):
+        fixture, self.cls = MODELS[model]
+        self.json = load_unit_fixtures()[fixture]
+        self.session = GitHubSession()
+
+    def time_construct(self, model):
+        for _ in range(100):
+            self.cls(self.json, self.session)
+
+    def time_construct_and_read(self, model):
+        """Construct the models and read every attribute set from JSON."""
+        names = lazy_attribute_names(self.cls)
+        for _ in range(100):
+            instance = self.cls(self.json, self.session)
+            for name in names:
+                getattr(instance, name)
+
+    def time_as_json(self, model):
+        instance = self.cls(self.json, self.session)
+        for _ in range(100):
+            instance.as_json()
+
+
+if __name__ == '__main__':
+    report(ModelConstruction, number=5)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks measuring end-to-end throughput against the stand-in server.
+
+Unlike the other benchmarks, these send real HTTP requests, to a
+:class:`StandInServer <github3.standin.StandInServer>` on localhost.
+"""
+import os
+
+from github3.batch import run_batch
+from github3.poller import EventPoller
+from github3.standin import StandInServer
+
+from . import CASSETTES, load_unit_fixtures, report
+
+USERS = 1000
+
+
+class _Server(object):
+
+    def setup(self, *params):
+        user = load_unit_fixtures()['user_example']
+        self.server = StandInServer(rate_limit=10 ** 9)
+        self.server.add('/users', [dict(user, id=i) for i in range(USERS)])
+        self.server.add_cassette(
+            os.path.join(CASSETTES, 'GitHub_repository.json')
+        )
+        self.server.start()
+        self.gh = self.server.github()
+
+    def teardown(self, *params):
+        self.server.stop()
+
+
+class HTTPPagination(_Server):
+
+    """Paginate through 1000 users over HTTP."""
+
+    params = [30, 100]
+    param_names = ['per_page']
+
+    def time_all_users(self, per_page):
+        for _ in self.gh.all_users(per_page=per_page):
+            pass
+
+
+class HTTPRetrieval(_Server):
+
+    """Retrieve a single repository 100 times over HTTP."""
+
+    def time_repository(self):
+        for _ in range(100):
+            self.gh.repository('sigmavirus24', 'github3.py')
+
+
+class BatchLookups(_Server):
+
+    """Retrieve 20 repositories, each answered after 5ms, in one batch."""
+
+    params = [1, 10]
+    param_names = ['workers']
+
+    def setup(self, workers):
+        super(BatchLookups, self).setup(workers)
+        self.server.latency = 0.005
+
+    def time_repositories_for(self, workers):
+        pairs = [('sigmavirus24', 'github3.py')] * 20
+        for _ in self.gh.repositories_for(pairs, workers=workers):
+            pass
+
+
+class EventPolling(_Server):
+
+    """Poll the unchanged event feeds of 500 repositories once."""
+
+    params = [1, 10]
+    param_names = ['workers']
+
+    def setup(self, workers):
+        super(EventPolling, self).setup(workers)
+        event = {'id': '1', 'type': 'WatchEvent', 'payload': {}}
+        self.poller = EventPoller(self.gh, workers=workers)
+        for i in range(500):
+            path = '/repos/owner/repository{0}/events'.format(i)
+            self.server.add(path, [event])
+            feed = self.poller.watch(self.server.url + path)
+            self.poller.poll(feed)
+
+    def time_poll(self, workers):
+        feeds = self.poller.feeds
+        for _ in run_batch(self.poller.poll, feeds, workers=workers):
+            pass
+
+
+if __name__ == '__main__':
+    report(HTTPPagination, number=5)
+    report(HTTPRetrieval, number=5)
+    report(BatchLookups, number=5)
+    report(EventPolling, number=5)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for decoding the timestamps GitHub returns."""
+from datetime import datetime
+
+from github3 import models, utils
+
+from . import load_fixtures, report
+
+
+def find_timestamps(json, found):
+    """Collect every value of a ``*_at`` key in ``json``."""
+    if isinstance(json, dict):
+        for key, value in json.items():
+            if key.endswith('_at') and value:
+                found.append(value)
+            else:
+                find_timestamps(value, found)
+    elif isinstance(json, list):
+        for value in json:
+            find_timestamps(value, found)
+    return found
+
+
+class TimestampDecoding(object):
+
+    """Decode every timestamp found in the ``tests/json`` fixtures."""
+
+    def setup(self):
+        timestamps = []
+        for fixture in load_fixtures().values():
+            find_timestamps(fixture, timestamps)
+        self.timestamps = [t for t in timestamps
+                           if len(t) == 20 and t.endswith('Z')]
+
+    def time_strptime(self):
+        """The decoding used before ``utils.parse_timestamp``."""
+        for timestamp in self.timestamps:
+            datetime.strptime(timestamp, utils.TIMESTAMP_FORMAT).replace(
+                tzinfo=utils.UTC()
+            )
+
+    def time_parse_timestamp(self):
+        """Decoding without any help from the memo."""
+        for timestamp in self.timestamps:
+            utils._timestamp_memo.clear()
+            utils.parse_timestamp(timestamp)
+
+    def time_parse_timestamp_memo(self):
+        """Decoding timestamps that were seen before."""
+        for timestamp in self.timestamps:
+            utils.parse_timestamp(timestamp)
+
+    def time_github_core_strptime(self):
+        """Decoding through the models' ``GitHubCore._strptime``."""
+        for timestamp in self.timestamps:
+            utils._timestamp_memo.clear()
+            models.GitHubCore._strptime(timestamp)
+
+
+if __name__ == '__main__':
+    report(TimestampDecoding)
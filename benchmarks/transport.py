@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks comparing transport adapters on concurrent requests.
+
+Repositories are retrieved from many threads at once from a
+:class:`StandInServer <github3.standin.StandInServer>` that adds a little
+latency to every response, like a fan-out over many repositories would.
+The stand-in speaks HTTP/1.1 only, so these benchmarks measure connection
+pooling rather than HTTP/2 multiplexing.
+"""
+import os
+
+from concurrent import futures
+
+from github3.standin import StandInServer
+from github3.transport import transport_for
+
+from . import CASSETTES, report
+
+REQUESTS = 200
+THREADS = 32
+
+TRANSPORTS = {
+    'requests': ('requests', {}),
+    'requests-pool': ('requests', {'pool_maxsize': THREADS}),
+    'httpx': ('httpx', {'http2': False, 'pool_maxsize': THREADS}),
+}
+
+
+class ConcurrentRequests(object):
+
+    """Retrieve a repository 200 times from 32 threads."""
+
+    params = sorted(TRANSPORTS)
+    param_names = ['transport']
+
+    def setup(self, transport):
+        name, options = TRANSPORTS[transport]
+        try:
+            adapter = transport_for(name, **options)
+        except ImportError:
+            raise NotImplementedError('{0} is not installed'.format(name))
+        self.server = StandInServer(rate_limit=10 ** 9, latency=0.002)
+        self.server.add_cassette(
+            os.path.join(CASSETTES, 'GitHub_repository.json')
+        )
+        self.server.start()
+        self.gh = self.server.github()
+        self.gh.session.use_transport(adapter)
+        self.executor = futures.ThreadPoolExecutor(THREADS)
+
+    def teardown(self, transport):
+        self.executor.shutdown()
+        self.gh.session.close()
+        self.server.stop()
+
+    def time_repositories(self, transport):
+        def repository(_):
+            return self.gh.repository('sigmavirus24', 'github3.py')
+
+        list(self.executor.map(repository, range(REQUESTS)))
+
+
+if __name__ == '__main__':
+    report(ConcurrentRequests, number=3)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for building API URLs."""
+from github3.session import GitHubSession, Route
+
+from . import report
+
+ISSUE = Route('repos/{owner}/{repo}/issues/{number}')
+
+
+class URLBuilding(object):
+
+    """Build the URLs of 1000 issues of one repository."""
+
+    def setup(self):
+        self.session = GitHubSession()
+        self.numbers = list(range(1000))
+
+    def time_build_url_cached(self):
+        """Every URL was built, and cached, before."""
+        for _ in self.numbers:
+            self.session.build_url('repos', 'sigmavirus24', 'github3.py',
+                                   'issues', 1)
+
+    def time_build_url_uncached(self):
+        """Every URL is new, i.e., the cache only adds overhead."""
+        self.session.url_cache.clear()
+        for number in self.numbers:
+            self.session.build_url('repos', 'sigmavirus24', 'github3.py',
+                                   'issues', number)
+
+    def time_build_route(self):
+        for number in self.numbers:
+            self.session.build_route(ISSUE, owner='sigmavirus24',
+                                     repo='github3.py', number=number)
+
+
+if __name__ == '__main__':
+    report(URLBuilding)
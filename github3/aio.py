@@ -0,0 +1,507 @@
+# -*- coding: utf-8 -*-
+"""
+github3.aio
+===========
+
+This module provides an asyncio transport for github3.py. It lets a single
+process drive hundreds of concurrent requests without dedicating a thread to
+each one.
+
+It requires Python 3.5 or newer and the optional ``aiohttp`` dependency::
+
+    pip install github3.py[async]
+
+Responses are converted to :class:`requests.Response` objects so that the
+existing ``_json``, ``_boolean`` and ``error_for`` behaviour applies
+unchanged, and the iterators yield the same model classes as their
+synchronous counterparts.
+
+"""
+import asyncio
+import functools
+import time
+
+from logging import getLogger
+
+import aiohttp
+import requests
+from requests.compat import urlparse, urlencode
+from requests.structures import CaseInsensitiveDict
+
+from . import exceptions
+from . import models
+from . import structs
+from .cache import CacheEntry, cache_key
+from .metrics import RequestEvent
+from .ratelimit import is_exhausted, resource_for
+from .session import GitHubSession, requires_2fa
+
+__logs__ = getLogger(__package__)
+
+
+class AsyncGitHubSession(object):
+
+    """An asyncio counterpart to :class:`GitHubSession
+    <github3.session.GitHubSession>`.
+
+    Headers, authentication, the base URL and the two-factor authentication
+    callback are taken from the synchronous session it is built from, so the
+    usual login methods can be used before creating it. Its token pool, rate
+    limit tracker and policy, retry engine, response cache and request hooks
+    are used the same way they are for synchronous requests::
+
+        gh = github3.login(token='...')
+        async with AsyncGitHubSession(gh.session) as session:
+            async for issue in session.iterate(repo.issues()):
+                ...
+
+    :param session: (optional), the :class:`GitHubSession
+        <github3.session.GitHubSession>` to take configuration from and to
+        attach to the models that are yielded
+    :param int limit: (optional), maximum number of simultaneous connections,
+        default: 100
+    """
+
+    def __init__(self, session=None, limit=100):
+        if hasattr(session, 'session'):
+            # i.e. session is actually a GitHubCore instance
+            session = session.session
+        elif session is None:
+            session = GitHubSession()
+        #: The synchronous session models are bound to
+        self.session = session
+        #: Maximum number of simultaneous connections
+        self.limit = limit
+        self.request_counter = 0
+        self._client = None
+
+    @property
+    def headers(self):
+        return self.session.headers
+
+    @property
+    def auth(self):
+        return self.session.auth
+
+    @property
+    def base_url(self):
+        return self.session.base_url
+
+    def build_url(self, *args, **kwargs):
+        """Builds a new API url from scratch."""
+        return self.session.build_url(*args, **kwargs)
+
+    def has_auth(self):
+        return self.session.has_auth()
+
+    def _get_client(self):
+        if self._client is None or self._client.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit)
+            self._client = aiohttp.ClientSession(connector=connector)
+        return self._client
+
+    @staticmethod
+    def _build_response(method, url, status, reason, headers, body):
+        """Build a :class:`requests.Response` from a finished request."""
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers)
+        response.url = url
+        response._content = body
+        response.request = requests.Request(method.upper(), url).prepare()
+        return response
+
+    async def _send(self, method, url, params=None, data=None, headers=None,
+                    **kwargs):
+        request_headers = dict(self.headers)
+        request_headers.update(headers or {})
+        auth = None
+        if self.auth:
+            auth = aiohttp.BasicAuth(*self.auth)
+        if params:
+            params = dict((k, str(v)) for k, v in params.items()
+                          if v is not None)
+        client = self._get_client()
+        async with client.request(method.upper(), url, params=params,
+                                  data=data, headers=request_headers,
+                                  auth=auth, **kwargs) as resp:
+            body = await resp.read()
+            return self._build_response(method, str(resp.url), resp.status,
+                                        resp.reason, resp.headers, body)
+
+    async def request(self, method, url, **kwargs):
+        """Send a request and return a :class:`requests.Response`."""
+        hooks = self.session.request_hooks
+        if not hooks:
+            return await self._request(method, url, **kwargs)
+
+        start = time.time()
+        try:
+            response = await self._request(method, url, **kwargs)
+        except Exception as exc:
+            self.session._emit(RequestEvent(
+                method, url, elapsed=time.time() - start, exception=exc
+            ))
+            raise
+        self.session._emit(RequestEvent(method, url, response,
+                                        time.time() - start))
+        return response
+
+    async def _request(self, method, url, **kwargs):
+        session = self.session
+        resource = resource_for(url)
+        tried = set()
+        while True:
+            tracker = session.rate_limits
+            if session.token_pool is not None:
+                token = session.token_pool.acquire(resource, tried)
+                tried.add(token)
+                tracker = session.token_pool.tracker(token)
+                headers = dict(kwargs.get('headers') or {})
+                headers['Authorization'] = 'token {0}'.format(token)
+                kwargs['headers'] = headers
+
+            policy = session.rate_limit_policy
+            if policy is not None:
+                # RateLimitPolicy.wait would block the event loop
+                delay = policy.delay(tracker, resource, time.time())
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            tracker.consume(resource)
+
+            response = await self._send_with_retries(method, url, kwargs)
+            self.request_counter += 1
+            tracker.update(response, resource)
+            if tracker is not session.rate_limits:
+                session.rate_limits.update(response, resource)
+
+            if not (session.token_pool is not None and
+                    is_exhausted(response) and
+                    len(tried) < len(session.token_pool)):
+                break
+            __logs__.info('Token exhausted its %s budget, failing over',
+                          resource)
+
+        cb = session.two_factor_auth_cb
+        if requires_2fa(response) and cb:
+            headers = dict(kwargs.pop('headers', None) or {})
+            headers['X-GitHub-OTP'] = str(cb())
+            new_response = await self._send(method, url, headers=headers,
+                                            **kwargs)
+            new_response.history.append(response)
+            response = new_response
+        return response
+
+    async def _send_with_retries(self, method, url, kwargs):
+        engine = self.session.retry
+        if engine is None:
+            return await self._send_cached(method, url, **kwargs)
+
+        # The same steps as RetryEngine.send without blocking the event loop
+        policy = engine.policy_for(url)
+        engine.stats._record_request()
+        attempt = 0
+        while True:
+            try:
+                response = await self._send_cached(method, url, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                reason = policy.error_reason(method, _requests_error(exc))
+                if reason is None:
+                    raise
+                if attempt >= policy.total:
+                    engine.stats._record_exhausted()
+                    raise
+                delay = policy.delay(attempt)
+            else:
+                reason = policy.response_reason(method, response)
+                if reason is None:
+                    response.retries = attempt
+                    return response
+                if attempt >= policy.total:
+                    engine.stats._record_exhausted()
+                    response.retries = attempt
+                    return response
+                delay = policy.delay(attempt, response)
+
+            engine.stats._record_retry(reason)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _send_cached(self, method, url, params=None, headers=None,
+                           **kwargs):
+        cache = self.session.cache
+        request_headers = dict(self.headers)
+        request_headers.update(headers or {})
+        if (cache is None or method.upper() != 'GET' or
+                'If-None-Match' in request_headers or
+                'If-Modified-Since' in request_headers):
+            # Requests made conditional by the caller expect to see the 304
+            return await self._send(method, url, params=params,
+                                    headers=headers, **kwargs)
+
+        key = cache_key(requests.Request(
+            'GET', url, params=params, headers=request_headers,
+            auth=self.auth
+        ).prepare())
+        entry = cache.get(key)
+        if entry is not None:
+            headers = dict(headers or {})
+            headers.update(entry.conditional_headers())
+
+        response = await self._send(method, url, params=params,
+                                    headers=headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            __logs__.debug('Serving %s from the cache', url)
+            response = entry.to_response(response)
+        elif response.status_code == 200 and (
+                response.headers.get('ETag') or
+                response.headers.get('Last-Modified')):
+            cache.set(key, CacheEntry.from_response(response))
+        return response
+
+    async def delete(self, url, **kwargs):
+        return await self.request('delete', url, **kwargs)
+
+    async def get(self, url, **kwargs):
+        return await self.request('get', url, **kwargs)
+
+    async def patch(self, url, **kwargs):
+        return await self.request('patch', url, **kwargs)
+
+    async def post(self, url, data=None, **kwargs):
+        return await self.request('post', url, data=data, **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request('put', url, **kwargs)
+
+    def iterate(self, iterator):
+        """Return the asynchronous twin of a synchronous iterator.
+
+        :param iterator: the :class:`GitHubIterator
+            <github3.structs.GitHubIterator>` returned by a method such as
+            :meth:`Repository.issues <github3.repos.repo.Repository.issues>`
+        :returns: :class:`AsyncGitHubIterator` or
+            :class:`AsyncSearchIterator`
+        """
+        klass = AsyncGitHubIterator
+        if isinstance(iterator, structs.SearchIterator):
+            klass = AsyncSearchIterator
+        return klass.from_iterator(iterator, self)
+
+    async def close(self):
+        """Close the underlying connection pool."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+class AsyncGitHubIterator(models.GitHubCore):
+
+    """The asynchronous twin of :class:`GitHubIterator
+    <github3.structs.GitHubIterator>`.
+
+    It is used with ``async for`` and yields the same model classes. Models
+    are bound to the synchronous session so their methods keep working as
+    usual.
+
+    When it is given a synchronous session, the iterator creates its own
+    :class:`AsyncGitHubSession` and closes it once iteration ends. Iterators
+    that may be abandoned early should be closed with :meth:`aclose` or used
+    as asynchronous context managers::
+
+        async with AsyncGitHubIterator(-1, url, ShortUser, gh) as users:
+            async for user in users:
+                ...
+    """
+
+    def __init__(self, count, url, cls, session, params=None, etag=None,
+                 headers=None):
+        self._owns_session = not isinstance(session, AsyncGitHubSession)
+        if self._owns_session:
+            session = AsyncGitHubSession(session)
+        #: The :class:`AsyncGitHubSession` used to make requests
+        self.async_session = session
+        models.GitHubCore.__init__(self, {}, session.session)
+        #: Original number of items requested
+        self.original = count
+        #: Number of items left in the iterator
+        self.count = count
+        #: URL the class used to make it's first GET
+        self.url = url
+        #: Last URL that was requested
+        self.last_url = None
+        self._api = self.url
+        #: Class for constructing an item to return
+        self.cls = cls
+        #: Parameters of the query string
+        self.params = params or {}
+        self._remove_none(self.params)
+        #: The ETag Header value returned by GitHub
+        self.etag = None
+        #: Headers generated for the GET request
+        self.headers = headers or {}
+        #: The last response seen
+        self.last_response = None
+        #: Last status code received
+        self.last_status = 0
+
+        if etag:
+            self.headers.update({'If-None-Match': etag})
+
+        self.path = urlparse(self.url).path
+        self._generator = None
+
+    @classmethod
+    def from_iterator(cls, iterator, session):
+        """Build an asynchronous iterator from a synchronous one.
+
+        :param iterator: the :class:`GitHubIterator
+            <github3.structs.GitHubIterator>` to copy
+        :param session: the :class:`AsyncGitHubSession` to use
+        """
+        return cls(iterator.original, iterator.url, iterator.cls, session,
+                   dict(iterator.params), None, dict(iterator.headers))
+
+    def _repr(self):
+        return '<AsyncGitHubIterator [{0}, {1}]>'.format(self.count,
+                                                         self.path)
+
+    async def _request_async(self, method, *args, **kwargs):
+        try:
+            request_method = getattr(self.async_session, method)
+            return await request_method(*args, **kwargs)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+            raise exceptions.ConnectionError(exc)
+        except aiohttp.ClientError as exc:
+            raise exceptions.TransportError(exc)
+
+    async def _iterate(self):
+        try:
+            self.last_url, params = self.url, dict(self.params)
+            headers = self.headers
+
+            if 0 < self.count <= 100 and self.count != -1:
+                params['per_page'] = self.count
+
+            if 'per_page' not in params and self.count == -1:
+                params['per_page'] = 100
+
+            cls = self.cls
+            if issubclass(self.cls, models.GitHubCore):
+                cls = functools.partial(self.cls, session=self.session)
+
+            while (self.count == -1 or self.count > 0) and self.last_url:
+                response = await self._request_async(
+                    'get', self.last_url, params=params, headers=headers
+                )
+                self.last_response = response
+                self.last_status = response.status_code
+                if params:
+                    params = None  # rel_next already has the params
+
+                if not self.etag and response.headers.get('ETag'):
+                    self.etag = response.headers.get('ETag')
+
+                json = self._get_json(response)
+
+                if json is None:
+                    break
+
+                # languages returns a single dict. We want the items.
+                if isinstance(json, dict):
+                    if issubclass(self.cls, models.GitHubCore):
+                        raise exceptions.UnprocessableResponseBody(
+                            "GitHub's API returned a body that could not be"
+                            " handled", json
+                        )
+                    json.pop('ETag', None)
+                    json.pop('Last-Modified', None)
+                    json = json.items()
+
+                for i in json:
+                    yield cls(i)
+                    self.count -= 1 if self.count > 0 else 0
+                    if self.count == 0:
+                        break
+
+                rel_next = response.links.get('next', {})
+                self.last_url = rel_next.get('url', '')
+        finally:
+            if self._owns_session:
+                await self.async_session.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._generator is None:
+            self._generator = self._iterate()
+        return await self._generator.__anext__()
+
+    async def aclose(self):
+        """Stop iterating and close the session the iterator created."""
+        if self._generator is not None:
+            await self._generator.aclose()
+            self._generator = None
+        if self._owns_session:
+            await self.async_session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    def _get_json(self, response):
+        return self._json(response, 200)
+
+    def refresh(self, conditional=False):
+        self.count = self.original
+        if conditional:
+            self.headers['If-None-Match'] = self.etag
+        self.etag = None
+        self._generator = None
+        return self
+
+
+class AsyncSearchIterator(AsyncGitHubIterator):
+
+    """The asynchronous twin of :class:`SearchIterator
+    <github3.structs.SearchIterator>`."""
+
+    def __init__(self, count, url, cls, session, params=None, etag=None,
+                 headers=None):
+        super(AsyncSearchIterator, self).__init__(count, url, cls, session,
+                                                  params, etag, headers)
+        #: Total count returned by GitHub
+        self.total_count = 0
+        #: Items array returned in the last request
+        self.items = []
+
+    def _repr(self):
+        return '<AsyncSearchIterator [{0}, {1}?{2}]>'.format(
+            self.count, self.path, urlencode(self.params)
+        )
+
+    def _get_json(self, response):
+        json = self._json(response, 200)
+        self.total_count = json.get('total_count', self.total_count)
+        self.items = json.get('items', [])
+        return json.get('items')
+
+
+def _requests_error(exc):
+    """Return the :mod:`requests` exception matching an aiohttp failure, so
+    that retry policies can classify it."""
+    if isinstance(exc, asyncio.TimeoutError):
+        return requests.exceptions.Timeout(exc)
+    if isinstance(exc, aiohttp.ClientConnectionError):
+        return requests.exceptions.ConnectionError(exc)
+    return requests.exceptions.RequestException(exc)
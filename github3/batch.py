@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+github3.batch
+=============
+
+This module runs many independent lookups, e.g., one per repository,
+concurrently. It powers :meth:`GitHub.repositories_for
+<github3.github.GitHub.repositories_for>`, :meth:`GitHub.users_for
+<github3.github.GitHub.users_for>` and :meth:`GitHub.issues_for
+<github3.github.GitHub.issues_for>`.
+
+"""
+import collections
+
+from concurrent import futures
+
+#: Default number of lookups running at once
+DEFAULT_WORKERS = 10
+
+
+class BatchResult(object):
+
+    """The outcome of a single lookup in a batch.
+
+    A lookup either produced a :attr:`result` (None if GitHub answered with
+    a ``404``) or raised an :attr:`exception`. Exceptions do not stop the
+    rest of the batch.
+    """
+
+    __slots__ = ('key', 'result', 'exception')
+
+    def __init__(self, key, result=None, exception=None):
+        #: The item of the input the lookup was made for, e.g.,
+        #: ``('sigmavirus24', 'github3.py')``
+        self.key = key
+        #: What the lookup returned
+        self.result = result
+        #: The exception the lookup raised, if any
+        self.exception = exception
+
+    def __repr__(self):
+        outcome = self.exception if self.exception is not None else (
+            self.result
+        )
+        return '<BatchResult [{0!r}: {1!r}]>'.format(self.key, outcome)
+
+    @property
+    def ok(self):
+        """Whether the lookup succeeded and found something."""
+        return self.exception is None and self.result is not None
+
+
+def run_batch(function, keys, workers=DEFAULT_WORKERS, ordered=True):
+    """Call ``function`` for every key, up to ``workers`` at a time.
+
+    Keys are consumed lazily and only a few more calls than ``workers`` are
+    queued at any time, so ``keys`` may be a long-running generator. When the
+    returned generator is closed before it is exhausted, lookups that have
+    not started are cancelled.
+
+    :param function: callable receiving one key
+    :param keys: iterable of keys
+    :param int workers: (optional), maximum number of concurrent calls,
+        default: 10
+    :param bool ordered: (optional), yield results in the order of ``keys``
+        (True, the default) or as soon as they are available (False)
+    :returns: generator of :class:`BatchResult`
+    """
+    if workers < 1:
+        raise ValueError('workers must be at least 1')
+    keys = iter(keys)
+    executor = futures.ThreadPoolExecutor(max_workers=workers)
+    pending = collections.deque()
+    queued = 2 * workers
+
+    def fill():
+        while len(pending) < queued:
+            try:
+                key = next(keys)
+            except StopIteration:
+                return
+            pending.append((key, executor.submit(function, key)))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                key, future = pending.popleft()
+                futures.wait([future])
+            else:
+                done, _ = futures.wait([f for _, f in pending],
+                                       return_when=futures.FIRST_COMPLETED)
+                key, future = next((k, f) for k, f in pending if f in done)
+                pending.remove((key, future))
+            fill()
+            yield _result(key, future)
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _result(key, future):
+    exception = future.exception()
+    if exception is not None:
+        return BatchResult(key, exception=exception)
+    return BatchResult(key, future.result())
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+github3.cache
+=============
+
+This module provides the response caches that can be attached to a
+:class:`GitHubSession <github3.session.GitHubSession>`. When a cache is
+present the session automatically turns ``GET`` requests into `conditional
+requests`_ and serves the stored body when GitHub answers with
+``304 Not Modified``. GitHub does not count those responses against the rate
+limit.
+
+.. _conditional requests:
+    https://developer.github.com/v3/#conditional-requests
+
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+def cache_key(request):
+    """Compute the cache key for a prepared request.
+
+    Responses are keyed by the URL, the ``Accept`` header and the identity of
+    the credentials used. Credentials are hashed so they are never stored.
+
+    :param request: the request about to be sent
+    :type request: :class:`requests.PreparedRequest`
+    :returns: hexadecimal digest
+    :rtype: str
+    """
+    authorization = request.headers.get('Authorization') or ''
+    identity = hashlib.sha256(authorization.encode('utf-8')).hexdigest()
+    parts = [request.url, request.headers.get('Accept') or '', identity]
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+class CacheEntry(object):
+
+    """A stored response body and the validators needed to revalidate it."""
+
+    def __init__(self, url, headers, body):
+        #: URL the response was retrieved from
+        self.url = url
+        #: Headers of the stored response
+        self.headers = CaseInsensitiveDict(headers)
+        #: Raw body of the stored response
+        self.body = body
+
+    @property
+    def etag(self):
+        return self.headers.get('ETag')
+
+    @property
+    def last_modified(self):
+        return self.headers.get('Last-Modified')
+
+    @classmethod
+    def from_response(cls, response):
+        """Build an entry from a successful response."""
+        return cls(response.url, dict(response.headers), response.content)
+
+    def conditional_headers(self):
+        """Return the headers used to revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def to_response(self, not_modified):
+        """Build the response served in place of a ``304 Not Modified``.
+
+        Headers sent with the ``304`` (e.g., the rate limit headers) take
+        precedence over the stored ones.
+
+        :param not_modified: the ``304`` response GitHub sent
+        :returns: :class:`requests.Response` with a ``200`` status
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.headers.update(not_modified.headers)
+        response._content = self.body
+        response.url = self.url
+        response.request = not_modified.request
+        response.connection = getattr(not_modified, 'connection', None)
+        response.elapsed = not_modified.elapsed
+        response.history = [not_modified]
+        response.from_cache = True
+        return response
+
+
+class DictCache(object):
+
+    """A cache kept in memory for the lifetime of the process."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(object):
+
+    """A cache persisted in a SQLite database.
+
+    The database can be shared between processes and survives restarts which
+    makes periodic re-scans of the same resources almost free.
+
+    :param str path: path of the database file. It is created if it does not
+        exist.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                ' key TEXT PRIMARY KEY,'
+                ' url TEXT,'
+                ' headers TEXT,'
+                ' body BLOB'
+                ')'
+            )
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT url, headers, body FROM responses WHERE key = ?',
+                (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        url, headers, body = row
+        return CacheEntry(url, json.loads(headers), bytes(body))
+
+    def set(self, key, entry):
+        headers = json.dumps(dict(entry.headers))
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO responses (key, url, headers, body) '
+                'VALUES (?, ?, ?, ?)',
+                (key, entry.url, headers, sqlite3.Binary(entry.body))
+            )
+
+    def delete(self, key):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM responses WHERE key = ?',
+                                     (key,))
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM responses')
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
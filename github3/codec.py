@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+github3.codec
+=============
+
+This module contains the JSON codecs that can be attached to a
+:class:`GitHubSession <github3.session.GitHubSession>`. A codec decodes
+response bodies straight from ``response.content`` and encodes request
+bodies and :meth:`as_json <github3.models.GitHubCore.as_json>` output::
+
+    from github3.codec import fastest_codec
+
+    gh.session.codec = fastest_codec()
+
+"""
+import json
+
+
+class JSONCodec(object):
+
+    """A codec using the standard library's :mod:`json` module.
+
+    Sub-classes wrapping other libraries override :meth:`loads` and
+    :meth:`dumps`.
+    """
+
+    #: Name used by :func:`codec_for`
+    name = 'json'
+
+    def __repr__(self):
+        return '<{0} [{1}]>'.format(self.__class__.__name__, self.name)
+
+    def loads(self, data):
+        """Decode ``data``.
+
+        :param data: JSON document as UTF-8 encoded bytes or text
+        :returns: the decoded document
+        """
+        if isinstance(data, bytes) and not isinstance(data, str):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+    def dumps(self, obj):
+        """Encode ``obj`` as a JSON document.
+
+        :returns: the document as text
+        :rtype: str
+        """
+        return json.dumps(obj)
+
+
+class UJSONCodec(JSONCodec):
+
+    """A codec using `ujson <https://pypi.org/project/ujson/>`_."""
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+    def dumps(self, obj):
+        # ujson escapes forward slashes by default, json does not
+        return self._ujson.dumps(obj, escape_forward_slashes=False)
+
+
+class OrjsonCodec(JSONCodec):
+
+    """A codec using `orjson <https://pypi.org/project/orjson/>`_."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj).decode('utf-8')
+
+
+#: Every known codec, fastest first
+CODECS = [OrjsonCodec, UJSONCodec, JSONCodec]
+
+
+def codec_for(name):
+    """Return an instance of the codec called ``name``.
+
+    :param str name: ``'orjson'``, ``'ujson'`` or ``'json'``
+    :raises: ValueError if no codec has that name
+    :raises: ImportError if the library the codec wraps is not installed
+    """
+    for codec in CODECS:
+        if codec.name == name:
+            return codec()
+    raise ValueError('Unknown JSON codec: {0}'.format(name))
+
+
+def available_codecs():
+    """Return an instance of every codec whose library is installed."""
+    codecs = []
+    for codec in CODECS:
+        try:
+            codecs.append(codec())
+        except ImportError:
+            continue
+    return codecs
+
+
+def fastest_codec():
+    """Return the fastest codec whose library is installed."""
+    return available_codecs()[0]
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+github3.compact
+===============
+
+This module contains compact, read-only representations of the objects that
+listing endpoints return in very large numbers. They use ``__slots__``
+instead of an instance dictionary, keep only the most commonly used
+attributes and can drop the raw JSON entirely. They are produced by a
+:class:`GitHubIterator <github3.structs.GitHubIterator>` whose ``compact``
+attribute is set::
+
+    events = gh.all_events()
+    events.compact = True
+    events.keep_json = False
+    recent = list(events)
+
+Compact objects have no API methods. Use their ``url`` to retrieve the full
+object when one is needed.
+
+"""
+from __future__ import unicode_literals
+
+from .models import GitHubCore
+
+
+class CompactModel(object):
+
+    """The base class for compact representations.
+
+    :param dict json: the JSON GitHub returned for the object
+    :param bool keep_json: (optional), keep ``json`` available as
+        ``_json_data``, default: True
+    """
+
+    __slots__ = ('_json_data',)
+
+    def __init__(self, json, keep_json=True):
+        self._json_data = json if keep_json else None
+        self._update_attributes(json)
+
+    def _update_attributes(self, json):
+        pass
+
+    def _repr(self):
+        return '<{0} [{1}]>'.format(self.__class__.__name__, self.id)
+
+    def __repr__(self):
+        return self._repr()
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.id == other.id
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.__class__, self.id))
+
+    def __getstate__(self):
+        return dict((name, getattr(self, name)) for name in self._slots())
+
+    def __setstate__(self, state):
+        for name in self._slots():
+            setattr(self, name, state.get(name))
+
+    @classmethod
+    def _slots(cls):
+        names = []
+        for klass in reversed(cls.__mro__):
+            names.extend(getattr(klass, '__slots__', ()))
+        return names
+
+    def as_dict(self):
+        """Return the compact attributes as a dictionary.
+
+        Nested compact objects are converted as well.
+        """
+        result = {}
+        for name in self._slots():
+            if name == '_json_data':
+                continue
+            value = getattr(self, name)
+            if isinstance(value, CompactModel):
+                value = value.as_dict()
+            result[name] = value
+        return result
+
+
+def _compact(cls, json):
+    """Return ``cls(json)`` without the raw JSON or None if json is empty."""
+    if json:
+        return cls(json, keep_json=False)
+    return None
+
+
+class CompactUser(CompactModel):
+
+    """Compact counterpart of :class:`ShortUser <github3.users.ShortUser>`."""
+
+    __slots__ = ('id', 'login', 'type', 'site_admin', 'avatar_url',
+                 'html_url', 'url')
+
+    def _update_attributes(self, user):
+        #: Unique ID of the account
+        self.id = user.get('id')
+        #: Login name of the account
+        self.login = user.get('login')
+        #: ``'User'`` or ``'Organization'``
+        self.type = user.get('type')
+        #: Whether the account is a GitHub administrator
+        self.site_admin = user.get('site_admin')
+        #: URL of the avatar
+        self.avatar_url = user.get('avatar_url')
+        #: URL of the account on GitHub
+        self.html_url = user.get('html_url')
+        #: API URL of the account
+        self.url = user.get('url')
+
+    def _repr(self):
+        return '<CompactUser [{0}]>'.format(self.login)
+
+
+class CompactEvent(CompactModel):
+
+    """Compact counterpart of :class:`Event <github3.events.Event>`.
+
+    The payload is kept as the dictionary GitHub returned.
+    """
+
+    __slots__ = ('id', 'type', 'actor', 'repo', 'org', 'public',
+                 'created_at', 'payload')
+
+    def _update_attributes(self, event):
+        #: Unique id of the event
+        self.id = event.get('id')
+        #: Event type, e.g., ``'PushEvent'``
+        self.type = event.get('type')
+        #: :class:`CompactUser` who caused the event
+        self.actor = _compact(CompactUser, event.get('actor'))
+        repo = event.get('repo')
+        #: ``tuple(owner, repository_name)``
+        self.repo = tuple(repo['name'].split('/')) if repo else None
+        org = event.get('org')
+        #: Login of the organization or None
+        self.org = org.get('login') if org else None
+        #: Whether the event is public
+        self.public = event.get('public')
+        #: datetime object representing when the event was created
+        self.created_at = GitHubCore._strptime(event.get('created_at'))
+        #: Payload of the event as a dictionary
+        self.payload = event.get('payload')
+
+    def _repr(self):
+        return '<CompactEvent [{0}]>'.format(self.type)
+
+
+class CompactIssue(CompactModel):
+
+    """Compact counterpart of :class:`Issue <github3.issues.issue.Issue>`."""
+
+    __slots__ = ('id', 'number', 'title', 'state', 'locked', 'user',
+                 'assignee', 'labels', 'milestone', 'comments_count',
+                 'is_pull_request', 'created_at', 'updated_at', 'closed_at',
+                 'html_url', 'url')
+
+    def _update_attributes(self, issue):
+        #: Unique ID of the issue
+        self.id = issue.get('id')
+        #: Issue number
+        self.number = issue.get('number')
+        #: Title of the issue
+        self.title = issue.get('title')
+        #: State of the issue, e.g., open, closed
+        self.state = issue.get('state')
+        #: Locked status
+        self.locked = issue.get('locked')
+        #: :class:`CompactUser` who opened the issue
+        self.user = _compact(CompactUser, issue.get('user'))
+        #: :class:`CompactUser` the issue is assigned to
+        self.assignee = _compact(CompactUser, issue.get('assignee'))
+        #: Tuple of the names of the issue's labels
+        self.labels = tuple(label.get('name')
+                            for label in issue.get('labels') or ())
+        milestone = issue.get('milestone')
+        #: Number of the issue's milestone or None
+        self.milestone = milestone.get('number') if milestone else None
+        #: Number of comments on the issue
+        self.comments_count = issue.get('comments')
+        #: Whether the issue is a pull request
+        self.is_pull_request = 'pull_request' in issue
+        #: datetime object representing when the issue was created
+        self.created_at = GitHubCore._strptime(issue.get('created_at'))
+        #: datetime object representing when the issue was last updated
+        self.updated_at = GitHubCore._strptime(issue.get('updated_at'))
+        #: datetime object representing when the issue was closed
+        self.closed_at = GitHubCore._strptime(issue.get('closed_at'))
+        #: URL to view the issue on GitHub
+        self.html_url = issue.get('html_url')
+        #: API URL of the issue
+        self.url = issue.get('url')
+
+    def _repr(self):
+        return '<CompactIssue [#{0}]>'.format(self.number)
+
+
+class CompactRepositorySearchResult(CompactModel):
+
+    """Compact counterpart of :class:`RepositorySearchResult
+    <github3.search.RepositorySearchResult>`.
+
+    The repository's attributes are stored on the result itself.
+    """
+
+    __slots__ = ('score', 'id', 'name', 'full_name', 'owner', 'description',
+                 'private', 'fork', 'language', 'default_branch', 'size',
+                 'stargazers_count', 'forks_count', 'open_issues_count',
+                 'created_at', 'updated_at', 'pushed_at', 'html_url', 'url')
+
+    def _update_attributes(self, result):
+        #: Score of the result
+        self.score = result.get('score')
+        #: Unique ID of the repository
+        self.id = result.get('id')
+        #: Name of the repository
+        self.name = result.get('name')
+        #: Full name as login/name
+        self.full_name = result.get('full_name')
+        #: :class:`CompactUser` owning the repository
+        self.owner = _compact(CompactUser, result.get('owner'))
+        #: Description of the repository
+        self.description = result.get('description')
+        #: Whether the repository is private
+        self.private = result.get('private')
+        #: Whether the repository is a fork
+        self.fork = result.get('fork')
+        #: Main language of the repository
+        self.language = result.get('language')
+        #: Default branch of the repository
+        self.default_branch = result.get('default_branch')
+        #: Size of the repository
+        self.size = result.get('size')
+        #: Number of stargazers
+        self.stargazers_count = result.get('stargazers_count')
+        #: Number of forks
+        self.forks_count = result.get('forks_count')
+        #: Number of open issues
+        self.open_issues_count = result.get('open_issues_count')
+        #: datetime object representing when the repository was created
+        self.created_at = GitHubCore._strptime(result.get('created_at'))
+        #: datetime object representing when the repository was last updated
+        self.updated_at = GitHubCore._strptime(result.get('updated_at'))
+        #: datetime object representing when the repository was last pushed
+        self.pushed_at = GitHubCore._strptime(result.get('pushed_at'))
+        #: URL of the repository on GitHub
+        self.html_url = result.get('html_url')
+        #: API URL of the repository
+        self.url = result.get('url')
+
+    def _repr(self):
+        return '<CompactRepositorySearchResult [{0}]>'.format(self.full_name)
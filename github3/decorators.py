@@ -32,15 +32,7 @@ def requires_auth(func):
         if hasattr(self, 'session') and self.session.has_auth():
             return func(self, *args, **kwargs)
         else:
-<<<<<<< HEAD
-<<<<<<< HEAD
-            from .models import GitHubError
-=======
-            from github3.exceptions import error_for
->>>>>>> Use new error classes
-=======
             from .exceptions import error_for
->>>>>>> addresses #248
             # Mock a 401 response
             r = generate_fake_error_response(
                 '{"message": "Requires authentication"}'
@@ -61,15 +53,7 @@ def requires_basic_auth(func):
         if hasattr(self, 'session') and self.session.auth:
             return func(self, *args, **kwargs)
         else:
-<<<<<<< HEAD
-<<<<<<< HEAD
-            from .models import GitHubError
-=======
-            from github3.exceptions import error_for
->>>>>>> Use new error classes
-=======
             from .exceptions import error_for
->>>>>>> addresses #248
             # Mock a 401 response
             r = generate_fake_error_response(
                 '{"message": "Requires username/password authentication"}'
@@ -91,15 +75,7 @@ def requires_app_credentials(func):
         if client_id and client_secret:
             return func(self, *args, **kwargs)
         else:
-<<<<<<< HEAD
-<<<<<<< HEAD
-            from .models import GitHubError
-=======
-            from github3.exceptions import error_for
->>>>>>> Use new error classes
-=======
             from .exceptions import error_for
->>>>>>> addresses #248
             # Mock a 401 response
             r = generate_fake_error_response(
                 '{"message": "Requires username/password authentication"}'
@@ -8,9 +8,9 @@ This module contains the class(es) related to Events
 """
 from __future__ import unicode_literals
 
-import copy
-
-from .models import GitHubCore
+from .compact import CompactEvent
+from .models import (GitHubCore, LazyAttribute, lazy_class_attribute,
+                     lazy_strptime_attribute)
 
 
 class EventUser(GitHubCore):
@@ -32,6 +32,117 @@ class EventUser(GitHubCore):
         return self._instance_or_null(users.User, json)
 
 
+class EventPayload(dict):
+
+    """The payload of an event.
+
+    This is a regular dictionary, so it can be serialized and modified in
+    place. Values that have a richer representation, e.g., the
+    ``pull_request`` of a ``PullRequestEvent``, are converted the first time
+    they are read. The JSON GitHub returned is never modified.
+
+    Indexing, :meth:`get`, :meth:`items`, :meth:`values`, ``dict(payload)``
+    and ``**payload`` all return converted values. On Python 2, the last
+    two copy the values as they are stored; use :meth:`copy` instead.
+
+    :param dict payload: the payload GitHub returned
+    :param str event_type: type of the event, e.g., ``'PushEvent'``
+    :param session: the event the payload belongs to
+    """
+
+    def __init__(self, payload, event_type, session=None):
+        super(EventPayload, self).__init__(payload)
+        self._payload = payload
+        self._handler = _payload_handlers.get(event_type, identity)
+        self._session = session
+        self._pending = set()
+        if self._handler is not identity:
+            self._pending.update(payload)
+
+    def __getitem__(self, key):
+        value = super(EventPayload, self).__getitem__(key)
+        if key in self._pending:
+            # Handlers only replace top-level keys, so a one item dictionary
+            # is all they need to see
+            value = self._handler({key: value}, self._session)[key]
+            super(EventPayload, self).__setitem__(key, value)
+            self._pending.discard(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._pending.discard(key)
+        super(EventPayload, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._pending.discard(key)
+        super(EventPayload, self).__delitem__(key)
+
+    def __iter__(self):
+        # Defining __iter__ stops dict() and ** from copying the stored
+        # values directly, so they go through __getitem__
+        return super(EventPayload, self).__iter__()
+
+    def __eq__(self, other):
+        self._convert()
+        return super(EventPayload, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<EventPayload [{0}]>'.format(', '.join(sorted(self)))
+
+    def _convert(self):
+        for key in list(self._pending):
+            self[key]
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super(EventPayload, self).pop(key, *default)
+
+    def popitem(self):
+        key = next(iter(self))
+        return key, self.pop(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        self._pending.clear()
+        super(EventPayload, self).clear()
+
+    def items(self):
+        self._convert()
+        return super(EventPayload, self).items()
+
+    def values(self):
+        self._convert()
+        return super(EventPayload, self).values()
+
+    def copy(self):
+        """Return a regular dictionary with every value converted."""
+        self._convert()
+        return dict(self)
+
+    def as_dict(self):
+        """Return the payload exactly as GitHub returned it."""
+        return self._payload
+
+
 class Event(GitHubCore):
 
     """The :class:`Event <Event>` object. It structures and handles the data
@@ -51,30 +162,41 @@ class Event(GitHubCore):
 
     """
 
-    def _update_attributes(self, event):
-        # If we don't copy this, then we end up altering _json_data which we do
-        # not want to do:
-        event = copy.deepcopy(event)
+    _compact_class = CompactEvent
+
+    #: :class:`User <github3.users.User>` object representing the actor.
+    actor = lazy_class_attribute('actor', EventUser, bind=False)
+
+    #: datetime object representing when the event was created.
+    created_at = lazy_strptime_attribute('created_at')
 
+    @LazyAttribute
+    def org(self, event):
+        """:class:`Organization <github3.orgs.Organization>` the event
+        happened in, if any."""
         from .orgs import Organization
-        #: :class:`User <github3.users.User>` object representing the actor.
-        self.actor = self._class_attribute(event, 'actor', EventUser)
-        #: datetime object representing when the event was created.
-        self.created_at = self._strptime_attribute(event, 'created_at')
+        return self._class_attribute(event, 'org', Organization)
+
+    @LazyAttribute
+    def payload(self, event):
+        """:class:`EventPayload` dictionary of the payload. Payload
+        structure is defined by type_.
+
+        .. _type: http://developer.github.com/v3/events/types
+        """
+        payload = self._get_attribute(event, 'payload')
+        if payload is None:
+            return None
+        return EventPayload(payload, self.type, self)
+
+    def _update_attributes(self, event):
+        self._reset_lazy_attributes(event)
 
         #: Unique id of the event
         self.id = self._get_attribute(event, 'id')
 
-        #: List all possible types of Events
-        self.org = self._class_attribute(event, 'org', Organization)
-
         #: Event type https://developer.github.com/v3/activity/events/types/
         self.type = self._get_attribute(event, 'type')
-        handler = _payload_handlers.get(self.type, identity)
-
-        #: Dictionary with the payload. Payload structure is defined by type_.
-        #  _type: http://developer.github.com/v3/events/types
-        self.payload = self._class_attribute(event, 'payload', handler, self)
 
         #: Return ``tuple(owner, repository_name)``
         self.repo = self._get_attribute(event, 'repo')
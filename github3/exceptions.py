@@ -145,6 +145,23 @@ class UnavailableForLegalReasons(ResponseError):
     pass
 
 
+class GraphQLError(ResponseError):
+    """Exception class for errors GitHub reports for a GraphQL query.
+
+    GraphQL queries are answered with ``200 OK`` even when parts of them
+    failed; the failures are described by :attr:`errors`.
+    """
+
+    def __init__(self, resp, errors=None):
+        super(GraphQLError, self).__init__(resp)
+        if errors is not None:
+            self.errors = errors
+        if self.errors:
+            self.msg = '; '.join(
+                error.get('message', '') for error in self.errors
+            )
+
+
 error_classes = {
     400: BadRequest,
     401: AuthenticationFailed,
@@ -9,7 +9,6 @@ See also: http://developer.github.com/v3/git/
 """
 from __future__ import unicode_literals
 
-from json import dumps
 from base64 import b64decode
 from .models import GitHubCore, BaseCommit
 from .decorators import requires_auth
@@ -132,7 +131,7 @@ class Reference(GitHubCore):
 
         """
         data = {'sha': sha, 'force': force}
-        json = self._json(self._patch(self._api, data=dumps(data)), 200)
+        json = self._json(self._patch(self._api, data=self._dumps(data)), 200)
         if json:
             self._update_attributes(json)
             return True
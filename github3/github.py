@@ -8,26 +8,34 @@ This module contains the main GitHub session object.
 """
 from __future__ import unicode_literals
 
-import json
-
 from .auths import Authorization
+from .batch import DEFAULT_WORKERS, run_batch
 from .decorators import (requires_auth, requires_basic_auth,
                                 requires_app_credentials)
 from .events import Event
+from .exceptions import GraphQLError
 from .gists import Gist
+from .graphql import CHUNK_SIZE, LANGUAGES
 from .issues import Issue, issue_params
 from .models import GitHubCore
 from .orgs import Membership, Organization, Team
 from .pulls import PullRequest
 from .repos.repo import Repository, repo_issue_params
+from .session import Route
 from .search import (CodeSearchResult, IssueSearchResult,
                             RepositorySearchResult, UserSearchResult)
+from .sharding import DEFAULT_WORKERS as SEARCH_WORKERS, ShardedSearch
 from .structs import SearchIterator
-from . import users
+from . import graphql, users
 from .notifications import Thread
 from .licenses import License
 from uritemplate import URITemplate
 
+_issue_route = Route('repos/{owner}/{repo}/issues/{number}')
+_pull_request_route = Route('repos/{owner}/{repo}/pulls/{number}')
+_repository_route = Route('repos/{owner}/{repo}')
+_user_route = Route('users/{login}')
+
 
 class GitHub(GitHubCore):
 
@@ -349,7 +357,7 @@ class GitHub(GitHubCore):
         :returns: bool
         """
         url = self._build_url('user', 'emails')
-        return self._boolean(self._delete(url, data=json.dumps(addresses)),
+        return self._boolean(self._delete(url, data=self._dumps(addresses)),
                              204, 404)
 
     @requires_auth
@@ -573,6 +581,110 @@ class GitHub(GitHubCore):
         url = self._build_url('gitignore', 'templates')
         return self._json(self._get(url), 200) or []
 
+    @requires_auth
+    def graphql(self, query, variables=None):
+        """Run a query against GitHub's GraphQL API.
+
+        :param str query: (required), the GraphQL query
+        :param dict variables: (optional), values of the query's variables
+        :returns: dict -- the ``data`` of the response
+        :raises: :class:`GraphQLError <github3.exceptions.GraphQLError>` if
+            GitHub reported any errors
+        """
+        response, document = graphql.execute(self, query, variables)
+        if document.get('errors'):
+            raise GraphQLError(response)
+        return document['data']
+
+    @requires_auth
+    def hydrate_issues(self, refs, chunk_size=CHUNK_SIZE, workers=1):
+        """Retrieve many issues with a few GraphQL queries.
+
+        :param refs: iterable of ``(owner, repository, number)`` tuples
+        :param int chunk_size: (optional), number of issues per query,
+            default: 50
+        :param int workers: (optional), number of queries sent at once,
+            default: 1
+        :returns: generator of :class:`BatchResult
+            <github3.batch.BatchResult>` whose ``result`` is an
+            :class:`Issue <github3.issues.Issue>`
+        """
+        return graphql.hydrate(self, graphql.ISSUES, refs, chunk_size,
+                               workers)
+
+    @requires_auth
+    def hydrate_pull_requests(self, refs, chunk_size=CHUNK_SIZE,
+                              workers=1):
+        """Retrieve many pull requests with a few GraphQL queries.
+
+        :param refs: iterable of ``(owner, repository, number)`` tuples
+        :param int chunk_size: (optional), number of pull requests per
+            query, default: 50
+        :param int workers: (optional), number of queries sent at once,
+            default: 1
+        :returns: generator of :class:`BatchResult
+            <github3.batch.BatchResult>` whose ``result`` is a
+            :class:`PullRequest <github3.pulls.PullRequest>`
+        """
+        return graphql.hydrate(self, graphql.PULL_REQUESTS, refs, chunk_size,
+                               workers)
+
+    @requires_auth
+    def hydrate_repositories(self, pairs, languages=LANGUAGES,
+                             chunk_size=CHUNK_SIZE, workers=1):
+        """Retrieve many repositories and their summaries with a few GraphQL
+        queries.
+
+        Besides the usual attributes, every repository has
+
+        - ``open_pull_requests_count``, the number of open pull requests,
+        - ``recent_release``, the :class:`Release
+          <github3.repos.release.Release>` :meth:`Repository.latest_release
+          <github3.repos.Repository.latest_release>` returns, or None,
+        - ``top_languages``, a list of ``(language, bytes)`` tuples of the
+          ``languages`` most used languages.
+
+        Getting the same with REST takes four requests per repository::
+
+            pairs = [('sigmavirus24', 'github3.py'), ('requests', 'requests')]
+            for result in gh.hydrate_repositories(pairs):
+                if result.ok:
+                    repository = result.result
+                    print(repository, repository.open_pull_requests_count)
+
+        :param pairs: iterable of ``(owner, repository)`` tuples
+        :param int languages: (optional), number of languages to fetch for
+            every repository, default: 5
+        :param int chunk_size: (optional), number of repositories per query,
+            default: 50
+        :param int workers: (optional), number of queries sent at once,
+            default: 1
+        :returns: generator of :class:`BatchResult
+            <github3.batch.BatchResult>` whose ``result`` is a
+            :class:`Repository <github3.repos.Repository>`
+        """
+        return graphql.hydrate(self, graphql.REPOSITORIES, pairs, chunk_size,
+                               workers, languages=languages)
+
+    @requires_auth
+    def hydrate_users(self, logins, chunk_size=CHUNK_SIZE,
+                      workers=1):
+        """Retrieve many users with a few GraphQL queries.
+
+        Organizations are not users in GraphQL and are not found.
+
+        :param logins: iterable of user names
+        :param int chunk_size: (optional), number of users per query,
+            default: 50
+        :param int workers: (optional), number of queries sent at once,
+            default: 1
+        :returns: generator of :class:`BatchResult
+            <github3.batch.BatchResult>` whose ``result`` is a
+            :class:`User <github3.users.User>`
+        """
+        return graphql.hydrate(self, graphql.USERS, logins, chunk_size,
+                               workers)
+
     @requires_auth
     def is_following(self, username):
         """Check if the authenticated user is following login.
@@ -611,8 +723,8 @@ class GitHub(GitHubCore):
         """
         json = None
         if username and repository and int(number) > 0:
-            url = self._build_url('repos', username, repository, 'issues',
-                                  str(number))
+            url = self._build_route(_issue_route, owner=username,
+                                    repo=repository, number=number)
             json = self._json(self._get(url), 200)
         return self._instance_or_null(Issue, json)
 
@@ -652,6 +764,28 @@ class GitHub(GitHubCore):
         params = issue_params(filter, state, labels, sort, direction, since)
         return self._iter(int(number), url, Issue, params, etag)
 
+    def issues_for(self, refs, workers=DEFAULT_WORKERS, ordered=True):
+        """Retrieve many issues concurrently.
+
+        ::
+
+            refs = [('sigmavirus24', 'github3.py', 1), ...]
+            for result in gh.issues_for(refs):
+                if result.ok:
+                    print(result.result.title)
+
+        :param refs: iterable of ``(owner, repository, number)`` tuples
+        :param int workers: (optional), maximum number of concurrent
+            requests, default: 10
+        :param bool ordered: (optional), yield results in the order of
+            ``refs`` (True, the default) or as they complete (False)
+        :returns: generator of :class:`BatchResult
+            <github3.batch.BatchResult>` whose ``result`` is an
+            :class:`Issue <github3.issues.Issue>`
+        """
+        return run_batch(lambda ref: self.issue(*ref), refs, workers,
+                         ordered)
+
     def issues_on(self, username, repository, milestone=None, state=None,
                   assignee=None, mentioned=None, labels=None, sort=None,
                   direction=None, since=None, number=-1, etag=None):
@@ -759,6 +893,25 @@ class GitHub(GitHubCore):
         # The Session method handles None for free.
         self.session.two_factor_auth_callback(two_factor_callback)
 
+    @requires_auth
+    def mark_notifications(self, last_read=''):
+        """Mark all of the user's notifications as read.
+
+        :param str last_read: (optional), Describes the last point that
+            notifications were checked. Anything updated since this time will
+            not be updated. Default: Now. Expected in ISO 8601 format:
+            ``YYYY-MM-DDTHH:MM:SSZ``. Example: "2012-10-09T23:39:01Z".
+        :returns: bool
+        """
+        url = self._build_url('notifications')
+        mark = {'read': True}
+        if last_read:
+            mark['last_read_at'] = last_read
+        response = self._put(url, data=self._dumps(mark))
+        # GitHub answers 202 when it marks the notifications asynchronously
+        return (self._boolean(response, 205, 404) or
+                self._boolean(response, 202, 404))
+
     def markdown(self, text, mode='', context='', raw=False):
         """Render an arbitrary markdown document.
 
@@ -1019,8 +1172,8 @@ class GitHub(GitHubCore):
         """
         json = None
         if int(number) > 0:
-            url = self._build_url('repos', owner, repository, 'pulls',
-                                  str(number))
+            url = self._build_route(_pull_request_route, owner=owner,
+                                    repo=repository, number=number)
             json = self._json(self._get(url), 200)
         return self._instance_or_null(PullRequest, json)
 
@@ -1120,6 +1273,32 @@ class GitHub(GitHubCore):
 
         return self._iter(int(number), url, Repository, params, etag)
 
+    def repositories_for(self, pairs, workers=DEFAULT_WORKERS, ordered=True):
+        """Retrieve many repositories concurrently.
+
+        Failed lookups are reported instead of stopping the batch::
+
+            pairs = [('sigmavirus24', 'github3.py'), ('requests', 'requests')]
+            for result in gh.repositories_for(pairs, workers=20):
+                if result.exception is not None:
+                    print('Failed', result.key, result.exception)
+                elif result.result is None:
+                    print('Not found', result.key)
+                else:
+                    print(result.result.stargazers_count)
+
+        :param pairs: iterable of ``(owner, repository)`` tuples
+        :param int workers: (optional), maximum number of concurrent
+            requests, default: 10
+        :param bool ordered: (optional), yield results in the order of
+            ``pairs`` (True, the default) or as they complete (False)
+        :returns: generator of :class:`BatchResult
+            <github3.batch.BatchResult>` whose ``result`` is a
+            :class:`Repository <github3.repos.Repository>`
+        """
+        return run_batch(lambda pair: self.repository(*pair), pairs, workers,
+                         ordered)
+
     def repository(self, owner, repository):
         """Returns a Repository object for the specified combination of
         owner and repository
@@ -1130,7 +1309,8 @@ class GitHub(GitHubCore):
         """
         json = None
         if owner and repository:
-            url = self._build_url('repos', owner, repository)
+            url = self._build_route(_repository_route, owner=owner,
+                                    repo=repository)
             json = self._json(self._get(url, headers=License.CUSTOM_HEADERS),
                               200)
         return self._instance_or_null(Repository, json)
@@ -1445,6 +1625,35 @@ class GitHub(GitHubCore):
             return
         self.session.headers.update({'User-Agent': user_agent})
 
+    def sharded_search(self, kind, query, qualifier=None,
+                       workers=SEARCH_WORKERS, per_page=100,
+                       text_match=False):
+        """Find every result of a search, beyond the 1000 results GitHub
+        returns for a single query.
+
+        The query is split along a range qualifier until every part matches
+        at most 1000 results. See :class:`ShardedSearch
+        <github3.sharding.ShardedSearch>` for details.
+
+        :param str kind: (required), what to search, ``code``, ``issues``,
+            ``repositories`` or ``users``
+        :param str query: (required), a valid query, e.g.,
+            ``org:github is:issue``
+        :param str qualifier: (optional), date or number qualifier to split
+            the query along, e.g., ``created``, ``updated`` or ``stars``;
+            default: ``size`` for code and ``created`` otherwise
+        :param int workers: (optional), number of requests sent at once,
+            default: 4
+        :param int per_page: (optional), number of results per page, at most
+            100, default: 100
+        :param bool text_match: (optional), if True, return matching search
+            terms
+        :returns: :class:`ShardedSearch <github3.sharding.ShardedSearch>`,
+            an iterable of the same results as the ``search_*`` methods
+        """
+        return ShardedSearch(self, kind, query, qualifier, workers, per_page,
+                             text_match)
+
     @requires_auth
     def star(self, username, repo):
         """Star to username/repo
@@ -1581,7 +1790,7 @@ class GitHub(GitHubCore):
                 'hireable': hireable, 'bio': bio}
         self._remove_none(user)
         url = self._build_url('user')
-        _json = self._json(self._patch(url, data=json.dumps(user)), 200)
+        _json = self._json(self._patch(url, data=self._dumps(user)), 200)
         if _json:
             self._update_attributes(_json)
             return True
@@ -1593,7 +1802,7 @@ class GitHub(GitHubCore):
         :param str username: name of the user
         :returns: :class:`~github3.users.User`
         """
-        url = self._build_url('users', username)
+        url = self._build_route(_user_route, login=username)
         json = self._json(self._get(url), 200)
         return self._instance_or_null(users.User, json)
 
@@ -1666,6 +1875,20 @@ class GitHub(GitHubCore):
             json = self._json(self._get(url), 200)
         return self._instance_or_null(users.User, json)
 
+    def users_for(self, logins, workers=DEFAULT_WORKERS, ordered=True):
+        """Retrieve many users concurrently.
+
+        :param logins: iterable of user names
+        :param int workers: (optional), maximum number of concurrent
+            requests, default: 10
+        :param bool ordered: (optional), yield results in the order of
+            ``logins`` (True, the default) or as they complete (False)
+        :returns: generator of :class:`BatchResult
+            <github3.batch.BatchResult>` whose ``result`` is a
+            :class:`User <github3.users.User>`
+        """
+        return run_batch(self.user, logins, workers, ordered)
+
     def zen(self):
         """Returns a quote from the Zen of GitHub. Yet another API Easter Egg
 
@@ -1744,7 +1967,7 @@ class GitHubStatus(GitHubCore):
     def _recipe(self, *args):
         url = self._build_url(*args)
         resp = self._get(url)
-        return resp.json() if self._boolean(resp, 200, 404) else {}
+        return self._loads(resp) if self._boolean(resp, 200, 404) else {}
 
     def api(self):
         """GET /api.json"""
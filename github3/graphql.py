@@ -0,0 +1,557 @@
+# -*- coding: utf-8 -*-
+"""
+github3.graphql
+===============
+
+This module looks up many objects with a few requests to GitHub's `GraphQL
+API`_ and turns the results into the models the REST API produces, i.e.,
+:class:`Repository <github3.repos.Repository>`, :class:`Issue
+<github3.issues.Issue>`, :class:`PullRequest <github3.pulls.PullRequest>` and
+:class:`User <github3.users.User>`.
+
+Up to :data:`CHUNK_SIZE` objects, and the sub-resources asked for with them,
+are fetched by a single query. It powers :meth:`GitHub.hydrate_repositories
+<github3.github.GitHub.hydrate_repositories>` and its siblings.
+
+.. _GraphQL API: https://developer.github.com/v4/
+
+"""
+import itertools
+
+from .batch import BatchResult, run_batch
+from .exceptions import GraphQLError
+from .repos.repo import Repository
+from .repos.release import Release
+from .issues import Issue
+from .pulls import PullRequest
+from .users import User
+
+#: Default number of objects looked up by one query
+CHUNK_SIZE = 50
+
+#: Default number of languages fetched for every repository
+LANGUAGES = 5
+
+_ACTOR = """
+fragment actor on Actor {
+  __typename login avatarUrl url
+  ... on User { databaseId }
+  ... on Organization { databaseId }
+  ... on Bot { databaseId }
+}
+"""
+
+_REPOSITORY = """
+fragment repository on Repository {
+  databaseId name nameWithOwner description url homepageUrl mirrorUrl
+  isPrivate isFork createdAt updatedAt pushedAt diskUsage forkCount
+  hasIssuesEnabled hasWikiEnabled
+  owner { ...actor }
+  primaryLanguage { name }
+  defaultBranchRef { name }
+  stargazers { totalCount }
+  watchers { totalCount }
+  issues(states: OPEN) { totalCount }
+  pullRequests(states: OPEN) { totalCount }
+  latestRelease {
+    databaseId name tagName description isDraft isPrerelease createdAt
+    publishedAt url
+  }
+  languages(first: $languages, orderBy: {field: SIZE, direction: DESC}) {
+    edges { size node { name } }
+  }
+}
+"""
+
+_ISSUE = """
+fragment issue on Issue {
+  databaseId number title body state locked createdAt updatedAt closedAt url
+  author { ...actor }
+  assignees(first: 10) { nodes { ...actor } }
+  labels(first: 100) { nodes { name color } }
+  milestone { number title description state createdAt dueOn }
+  comments { totalCount }
+}
+"""
+
+_PULL_REQUEST = """
+fragment pullRequest on PullRequest {
+  databaseId number title body state locked createdAt updatedAt closedAt
+  mergedAt url merged mergeable additions deletions
+  author { ...actor }
+  mergedBy { ...actor }
+  comments { totalCount }
+  commits { totalCount }
+  baseRefName baseRefOid headRefName headRefOid
+  baseRepository { name nameWithOwner url owner { ...actor } }
+  headRepository { name nameWithOwner url owner { ...actor } }
+}
+"""
+
+_USER = """
+fragment user on User {
+  __typename login databaseId avatarUrl url name company websiteUrl
+  location email bio isHireable createdAt updatedAt
+  followers { totalCount }
+  following { totalCount }
+  gists(privacy: PUBLIC) { totalCount }
+  repositories(privacy: PUBLIC, ownerAffiliations: [OWNER]) { totalCount }
+}
+"""
+
+
+def graphql_url(base_url):
+    """Return the GraphQL endpoint belonging to a REST API URL.
+
+    :param str base_url: URL of the REST API, e.g.,
+        ``https://api.github.com`` or ``https://example.com/api/v3``
+    :rtype: str
+    """
+    base_url = base_url.rstrip('/')
+    if base_url.endswith('/api/v3'):
+        # GitHub Enterprise
+        return base_url[:-len('v3')] + 'graphql'
+    return base_url + '/graphql'
+
+
+def execute(core, query, variables=None):
+    """Send ``query`` and return the response and its decoded body.
+
+    The body may contain ``errors`` next to the ``data`` that could be
+    fetched.
+
+    :param core: :class:`GitHubCore <github3.models.GitHubCore>` whose
+        session sends the query
+    :param str query: the GraphQL query
+    :param dict variables: (optional), values of the query's variables
+    :returns: the :class:`requests.Response` and the decoded body
+    :rtype: tuple
+    :raises: :class:`GraphQLError <github3.exceptions.GraphQLError>` if no
+        data was returned at all
+    """
+    response = core._post(graphql_url(core.session.base_url), data={
+        'query': query, 'variables': variables or {},
+    })
+    document = core._json(response, 200, include_cache_info=False)
+    if not document or document.get('data') is None:
+        raise GraphQLError(response)
+    return response, document
+
+
+class Lookup(object):
+
+    """How to look up one kind of object in a GraphQL query.
+
+    :param arguments: ``(name, type)`` of the GraphQL variables identifying
+        an object, in the order of the keys' items
+    :param str selection: field selecting an object, formatted with the
+        names of its variables
+    :param fragments: fragments the selection uses
+    :param build: callable receiving the :class:`GitHubCore
+        <github3.models.GitHubCore>`, a key and the object's GraphQL node and
+        returning a model
+    :param str path: (optional), field of the selection holding the object,
+        if it is nested
+    :param options: (optional), ``(name, type)`` of variables shared by every
+        object
+    """
+
+    def __init__(self, arguments, selection, fragments, build, path=None,
+                 options=()):
+        self.arguments = arguments
+        self.selection = selection
+        self.fragments = fragments
+        self.build = build
+        self.path = path
+        self.options = options
+
+    def node(self, data):
+        """Return the object in the data selected for a key."""
+        if data is not None and self.path is not None:
+            data = data.get(self.path)
+        return data
+
+
+def build_query(lookup, keys, **options):
+    """Build the query looking up every key.
+
+    The object of the ``i``-th key is aliased to ``r<i>``.
+
+    :param lookup: :class:`Lookup` of the kind of object
+    :param list keys: identifiers of the objects, tuples or single values
+    :param options: values of the lookup's options
+    :returns: the query and its variables
+    :rtype: tuple
+    """
+    declarations = ['${0}: {1}'.format(name, kind)
+                    for name, kind in lookup.options]
+    variables = dict((name, options[name]) for name, _ in lookup.options)
+    selections = []
+    for i, key in enumerate(keys):
+        if not isinstance(key, (tuple, list)):
+            key = (key,)
+        names = {}
+        for (name, kind), value in zip(lookup.arguments, key):
+            variable = '{0}{1}'.format(name, i)
+            declarations.append('${0}: {1}'.format(variable, kind))
+            variables[variable] = value
+            names[name] = '$' + variable
+        selections.append('  r{0}: {1}'.format(
+            i, lookup.selection.format(**names)
+        ))
+    query = 'query({0}) {{\n{1}\n}}\n{2}'.format(
+        ', '.join(declarations), '\n'.join(selections),
+        ''.join(lookup.fragments)
+    )
+    return query, variables
+
+
+def hydrate(core, lookup, keys, chunk_size=CHUNK_SIZE, workers=1,
+            **options):
+    """Look up the objects identified by ``keys``, ``chunk_size`` at a time.
+
+    Objects GitHub does not find have a result of None. Objects GitHub
+    reports an error for have a :class:`GraphQLError
+    <github3.exceptions.GraphQLError>` as their exception, just like every
+    object of a query that failed as a whole.
+
+    :param core: :class:`GitHubCore <github3.models.GitHubCore>` whose
+        session sends the queries
+    :param lookup: :class:`Lookup` of the kind of object
+    :param keys: iterable of identifiers of the objects
+    :param int chunk_size: (optional), number of objects per query,
+        default: 50
+    :param int workers: (optional), number of queries sent at once,
+        default: 1
+    :param options: values of the lookup's options
+    :returns: generator of :class:`BatchResult <github3.batch.BatchResult>`
+        in the order of ``keys``
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+
+    def fetch(chunk):
+        return _hydrate_chunk(core, lookup, chunk, options)
+
+    for batch in run_batch(fetch, _chunks(keys, chunk_size), workers):
+        if batch.exception is not None:
+            for key in batch.key:
+                yield BatchResult(key, exception=batch.exception)
+        else:
+            for result in batch.result:
+                yield result
+
+
+def _chunks(keys, chunk_size):
+    keys = iter(keys)
+    while True:
+        chunk = list(itertools.islice(keys, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _hydrate_chunk(core, lookup, chunk, options):
+    query, variables = build_query(lookup, chunk, **options)
+    response, document = execute(core, query, variables)
+    data = document['data']
+    errors = {}
+    for error in document.get('errors') or []:
+        path = error.get('path')
+        if not path:
+            raise GraphQLError(response)
+        errors.setdefault(path[0], []).append(error)
+
+    results = []
+    for i, key in enumerate(chunk):
+        alias = 'r{0}'.format(i)
+        node = lookup.node(data.get(alias))
+        failures = [e for e in errors.get(alias, [])
+                    if e.get('type') != 'NOT_FOUND']
+        if failures:
+            result = BatchResult(key, exception=GraphQLError(response,
+                                                             failures))
+        elif node is None:
+            result = BatchResult(key)
+        else:
+            result = BatchResult(key, lookup.build(core, key, node))
+        results.append(result)
+    return results
+
+
+def _count(node, field):
+    value = node.get(field)
+    return value['totalCount'] if value else None
+
+
+def _user_json(node, api):
+    """Turn a GraphQL user, organization or bot into REST's JSON."""
+    if not node:
+        return None
+    url = '{0}/users/{1}'.format(api, node['login'])
+    return {
+        'login': node['login'],
+        'id': node.get('databaseId'),
+        'type': node.get('__typename', 'User'),
+        'avatar_url': node.get('avatarUrl'),
+        'gravatar_id': '',
+        'html_url': node.get('url'),
+        'url': url,
+        'events_url': url + '/events{/privacy}',
+        'followers_url': url + '/followers',
+        'following_url': url + '/following{/other_user}',
+        'gists_url': url + '/gists{/gist_id}',
+        'organizations_url': url + '/orgs',
+        'received_events_url': url + '/received_events',
+        'repos_url': url + '/repos',
+        'starred_url': url + '/starred{/owner}{/repo}',
+        'subscriptions_url': url + '/subscriptions',
+    }
+
+
+def _repository_json(node, api):
+    """Turn a GraphQL repository into REST's JSON."""
+    if not node:
+        return None
+    full_name = node['nameWithOwner']
+    url = '{0}/repos/{1}'.format(api, full_name)
+    html_url = node.get('url')
+    language = node.get('primaryLanguage') or {}
+    branch = node.get('defaultBranchRef') or {}
+    open_issues = _count(node, 'issues')
+    if open_issues is not None:
+        # REST counts open pull requests as open issues
+        open_issues += _count(node, 'pullRequests') or 0
+    return {
+        'id': node.get('databaseId'),
+        'name': node.get('name'),
+        'full_name': full_name,
+        'owner': _user_json(node.get('owner'), api),
+        'description': node.get('description'),
+        'private': node.get('isPrivate'),
+        'fork': node.get('isFork'),
+        'url': url,
+        'html_url': html_url,
+        'clone_url': html_url + '.git' if html_url else None,
+        'homepage': node.get('homepageUrl'),
+        'mirror_url': node.get('mirrorUrl'),
+        'language': language.get('name'),
+        'default_branch': branch.get('name'),
+        'forks_count': node.get('forkCount'),
+        'stargazers_count': _count(node, 'stargazers'),
+        'watchers': _count(node, 'stargazers'),
+        'subscribers_count': _count(node, 'watchers'),
+        'open_issues': open_issues,
+        'open_issues_count': open_issues,
+        'size': node.get('diskUsage'),
+        'has_issues': node.get('hasIssuesEnabled'),
+        'has_wiki': node.get('hasWikiEnabled'),
+        'created_at': node.get('createdAt'),
+        'updated_at': node.get('updatedAt'),
+        'pushed_at': node.get('pushedAt'),
+    }
+
+
+def _release_json(node, repository_url):
+    url = '{0}/releases/{1}'.format(repository_url, node.get('databaseId'))
+    tag = node.get('tagName')
+    return {
+        'id': node.get('databaseId'),
+        'name': node.get('name'),
+        'tag_name': tag,
+        'body': node.get('description'),
+        'draft': node.get('isDraft'),
+        'prerelease': node.get('isPrerelease'),
+        'created_at': node.get('createdAt'),
+        'published_at': node.get('publishedAt'),
+        'html_url': node.get('url'),
+        'url': url,
+        'assets_url': url + '/assets',
+        'tarball_url': '{0}/tarball/{1}'.format(repository_url, tag),
+        'zipball_url': '{0}/zipball/{1}'.format(repository_url, tag),
+    }
+
+
+def _issue_json(node, api, owner, repository):
+    """Turn a GraphQL issue or pull request into REST's JSON."""
+    repository_url = '{0}/repos/{1}/{2}'.format(api, owner, repository)
+    url = '{0}/issues/{1}'.format(repository_url, node['number'])
+    milestone = node.get('milestone')
+    if milestone:
+        milestone = {
+            'url': '{0}/milestones/{1}'.format(repository_url,
+                                               milestone['number']),
+            'number': milestone['number'],
+            'title': milestone.get('title'),
+            'description': milestone.get('description'),
+            'state': (milestone.get('state') or '').lower() or None,
+            'created_at': milestone.get('createdAt'),
+            'due_on': milestone.get('dueOn'),
+        }
+    labels = (node.get('labels') or {}).get('nodes') or []
+    assignees = [_user_json(assignee, api) for assignee in
+                 (node.get('assignees') or {}).get('nodes') or []]
+    return {
+        'id': node.get('databaseId'),
+        'number': node['number'],
+        'title': node.get('title'),
+        'body': node.get('body'),
+        'state': (node.get('state') or '').lower() or None,
+        'locked': node.get('locked'),
+        'user': _user_json(node.get('author'), api),
+        'assignee': assignees[0] if assignees else None,
+        'assignees': assignees,
+        'labels': [{
+            'url': '{0}/labels/{1}'.format(repository_url, label['name']),
+            'name': label['name'],
+            'color': label.get('color'),
+        } for label in labels],
+        'milestone': milestone,
+        'comments': _count(node, 'comments'),
+        'url': url,
+        'html_url': node.get('url'),
+        'comments_url': url + '/comments',
+        'events_url': url + '/events',
+        'labels_url': url + '/labels{/name}',
+        'created_at': node.get('createdAt'),
+        'updated_at': node.get('updatedAt'),
+        'closed_at': node.get('closedAt'),
+    }
+
+
+def _destination_json(node, ref, sha, api):
+    repository = _repository_json(node, api)
+    label = ref
+    if repository and repository['owner']:
+        label = '{0}:{1}'.format(repository['owner']['login'], ref)
+    return {
+        'ref': ref,
+        'sha': sha,
+        'label': label,
+        'user': repository['owner'] if repository else None,
+        'repo': repository,
+    }
+
+
+def _pull_request_json(node, api, owner, repository):
+    """Turn a GraphQL pull request into REST's JSON."""
+    pull = _issue_json(node, api, owner, repository)
+    issue_url = pull['url']
+    url = issue_url.replace('/issues/', '/pulls/')
+    mergeable = node.get('mergeable')
+    state = pull['state']
+    pull.update({
+        'url': url,
+        'issue_url': issue_url,
+        'state': 'closed' if state == 'merged' else state,
+        'merged': node.get('merged'),
+        'mergeable': {'MERGEABLE': True, 'CONFLICTING': False}.get(mergeable),
+        'merged_at': node.get('mergedAt'),
+        'merged_by': _user_json(node.get('mergedBy'), api),
+        'additions': node.get('additions'),
+        'deletions': node.get('deletions'),
+        'commits': _count(node, 'commits'),
+        'commits_url': url + '/commits',
+        'review_comments_url': url + '/comments',
+        'review_comment_url': url.rsplit('/', 1)[0] + '/comments{/number}',
+        'diff_url': (pull['html_url'] or '') + '.diff',
+        'patch_url': (pull['html_url'] or '') + '.patch',
+        'base': _destination_json(node.get('baseRepository'),
+                                  node.get('baseRefName'),
+                                  node.get('baseRefOid'), api),
+        'head': _destination_json(node.get('headRepository'),
+                                  node.get('headRefName'),
+                                  node.get('headRefOid'), api),
+    })
+    return pull
+
+
+def _user_details_json(node, api):
+    """Turn a GraphQL user into the JSON of REST's single user."""
+    user = _user_json(node, api)
+    user.update({
+        'name': node.get('name'),
+        'company': node.get('company'),
+        'blog': node.get('websiteUrl') or '',
+        'location': node.get('location'),
+        # GraphQL hides private addresses behind an empty string
+        'email': node.get('email') or None,
+        'bio': node.get('bio'),
+        'hireable': node.get('isHireable'),
+        'followers': _count(node, 'followers'),
+        'following': _count(node, 'following'),
+        'public_gists': _count(node, 'gists'),
+        'public_repos': _count(node, 'repositories'),
+        'created_at': node.get('createdAt'),
+        'updated_at': node.get('updatedAt'),
+    })
+    return user
+
+
+def _build_repository(core, key, node):
+    api = core.session.base_url
+    repository = Repository(_repository_json(node, api), core)
+    repository.open_pull_requests_count = _count(node, 'pullRequests')
+    release = node.get('latestRelease')
+    repository.recent_release = None
+    if release:
+        repository.recent_release = Release(
+            _release_json(release, repository._api), repository
+        )
+    repository.top_languages = [
+        (edge['node']['name'], edge['size'])
+        for edge in (node.get('languages') or {}).get('edges') or []
+    ]
+    return repository
+
+
+def _build_issue(core, key, node):
+    owner, repository = key[0], key[1]
+    return Issue(_issue_json(node, core.session.base_url, owner, repository),
+                 core)
+
+
+def _build_pull_request(core, key, node):
+    owner, repository = key[0], key[1]
+    return PullRequest(
+        _pull_request_json(node, core.session.base_url, owner, repository),
+        core
+    )
+
+
+def _build_user(core, key, node):
+    return User(_user_details_json(node, core.session.base_url), core)
+
+
+_REPOSITORY_ARGUMENTS = (('owner', 'String!'), ('name', 'String!'))
+
+#: Looks up repositories by ``(owner, repository)``
+REPOSITORIES = Lookup(
+    _REPOSITORY_ARGUMENTS,
+    'repository(owner: {owner}, name: {name}) {{ ...repository }}',
+    (_REPOSITORY, _ACTOR), _build_repository,
+    options=(('languages', 'Int!'),),
+)
+
+#: Looks up issues by ``(owner, repository, number)``
+ISSUES = Lookup(
+    _REPOSITORY_ARGUMENTS + (('number', 'Int!'),),
+    'repository(owner: {owner}, name: {name}) '
+    '{{ issue(number: {number}) {{ ...issue }} }}',
+    (_ISSUE, _ACTOR), _build_issue, path='issue',
+)
+
+#: Looks up pull requests by ``(owner, repository, number)``
+PULL_REQUESTS = Lookup(
+    _REPOSITORY_ARGUMENTS + (('number', 'Int!'),),
+    'repository(owner: {owner}, name: {name}) '
+    '{{ pullRequest(number: {number}) {{ ...pullRequest }} }}',
+    (_PULL_REQUEST, _ACTOR), _build_pull_request, path='pullRequest',
+)
+
+#: Looks up users by login
+USERS = Lookup(
+    (('login', 'String!'),),
+    'user(login: {login}) {{ ...user }}',
+    (_USER,), _build_user,
+)
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+github3.inbox
+=============
+
+This module keeps a local index of the unread notifications of a user, or of
+one of their repositories, in sync with GitHub. The notifications are polled
+with ``If-Modified-Since`` at the interval GitHub advises in
+``X-Poll-Interval``; unchanged listings are answered with
+``304 Not Modified``, which does not count against the rate limit. Threads
+are marked as read in bulk with the ``last_read_at`` form of the mark
+endpoints instead of one request per thread::
+
+    from github3.inbox import Inbox
+
+    inbox = Inbox(gh)
+    inbox.callbacks.append(lambda thread: print(thread.subject['title']))
+    inbox.sync()
+    inbox.mark_read()
+
+"""
+import threading
+
+from logging import getLogger
+
+from . import exceptions
+from .notifications import Thread
+
+__logs__ = getLogger(__package__)
+
+#: Seconds between polls when GitHub does not advise an interval
+DEFAULT_INTERVAL = 60
+
+#: Number of notifications requested per page, the most GitHub returns
+PER_PAGE = 50
+
+
+class Inbox(object):
+
+    """The unread notifications of a user or of one of their repositories.
+
+    :param github: the :class:`GitHub <github3.github.GitHub>` instance of
+        the user
+    :param repository: (optional), a :class:`Repository
+        <github3.repos.Repository>` to only follow the notifications of
+    :param bool participating: (optional), only follow the notifications the
+        user is participating in directly, default: False
+    :param int interval: (optional), seconds between polls when GitHub does
+        not advise an interval, default: 60
+    """
+
+    def __init__(self, github, repository=None, participating=False,
+                 interval=DEFAULT_INTERVAL):
+        self.github = github
+        self.repository = repository
+        self.participating = participating
+        #: Seconds to wait between polls, updated from ``X-Poll-Interval``
+        self.interval = interval
+        #: The unread :class:`Thread <github3.notifications.Thread>` objects,
+        #: by id
+        self.unread = {}
+        #: ``Last-Modified`` of the last listing, sent as
+        #: ``If-Modified-Since``
+        self.last_modified = None
+        #: Callables receiving every new or updated thread
+        self.callbacks = []
+        #: Callables receiving the exception of every failed sync
+        self.error_callbacks = []
+        if repository is not None:
+            self.url = repository._build_url('notifications',
+                                             base_url=repository._api)
+        else:
+            self.url = github._build_url('notifications')
+        # Threads marked as read, by id, with the time they were updated;
+        # GitHub may mark them asynchronously, so they can still be listed
+        self._marked = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __repr__(self):
+        return '<Inbox [{0} unread]>'.format(len(self.unread))
+
+    def sync(self):
+        r"""Poll the notifications once and update the unread index.
+
+        Threads no longer listed were read elsewhere and are dropped from
+        the index.
+
+        :returns: list of the new or updated :class:`Thread
+            <github3.notifications.Thread>`\ s
+        """
+        headers = {}
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        params = {'participating': str(self.participating).lower(),
+                  'per_page': PER_PAGE}
+        response = self.github._get(self.url, params=params, headers=headers)
+        interval = response.headers.get('X-Poll-Interval')
+        if interval:
+            self.interval = int(interval)
+        if response.status_code == 304:
+            return []
+
+        last_modified = response.headers.get('Last-Modified')
+        listed = {}
+        while True:
+            if response.status_code != 200:
+                raise exceptions.error_for(response)
+            for json in self.github._loads(response) or []:
+                thread = Thread(json, self.github)
+                listed[thread.id] = thread
+            url = response.links.get('next', {}).get('url')
+            if not url:
+                break
+            response = self.github._get(url)
+
+        with self._lock:
+            self._marked = dict(
+                (id, updated_at) for id, updated_at in self._marked.items()
+                if id in listed and _updated_at(listed[id]) == updated_at
+            )
+            for id in self._marked:
+                del listed[id]
+            changed = [thread for id, thread in listed.items()
+                       if id not in self.unread or
+                       _updated_at(self.unread[id]) != _updated_at(thread)]
+            self.unread = listed
+            self.last_modified = last_modified
+        changed.sort(key=_updated_at)
+        for thread in changed:
+            for callback in self.callbacks:
+                try:
+                    callback(thread)
+                except Exception:
+                    __logs__.exception('Notification callback %r failed',
+                                       callback)
+        return changed
+
+    def mark_read(self, threads=None):
+        r"""Mark threads as read with as few requests as possible.
+
+        Marking every unread thread takes one request. Otherwise the threads
+        of a repository take one request when no other unread thread of the
+        repository was updated before the last of them, and one request
+        each when one was. Inboxes following only the threads the user
+        participates in cannot see the others, which the bulk requests would
+        mark too, so they mark threads one at a time.
+
+        :param threads: (optional), the :class:`Thread
+            <github3.notifications.Thread>`\ s to mark, default: every unread
+            thread
+        :returns: list of the threads marked as read
+        """
+        with self._lock:
+            unread = list(self.unread.values())
+            if threads is None:
+                threads = unread
+            threads = [t for t in threads if t.id in self.unread]
+        if not threads:
+            return []
+
+        marked = []
+        if self.participating:
+            marked = [t for t in threads if t.mark()]
+        elif len(threads) == len(unread):
+            last_read = max(_updated_at(t) for t in threads)
+            owner = self.repository or self.github
+            if owner.mark_notifications(last_read):
+                marked = threads
+        else:
+            for repository, selected in _by_repository(threads).items():
+                ids = set(t.id for t in selected)
+                others = [t for t in unread
+                          if _repository_name(t) == repository and
+                          t.id not in ids]
+                last_read = max(_updated_at(t) for t in selected)
+                if repository is not None and all(
+                        _updated_at(t) > last_read for t in others):
+                    if selected[0].repository.mark_notifications(last_read):
+                        marked.extend(selected)
+                else:
+                    marked.extend(t for t in selected if t.mark())
+
+        with self._lock:
+            for thread in marked:
+                self.unread.pop(thread.id, None)
+                self._marked[thread.id] = _updated_at(thread)
+        return marked
+
+    def run(self):
+        """Sync the notifications until :meth:`stop` is called."""
+        self._stopped.clear()
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                self.sync()
+                failures = 0
+                delay = self.interval
+            except Exception as exc:
+                failures += 1
+                delay = min(900, self.interval * 2 ** (failures - 1))
+                __logs__.warning('Syncing notifications failed (%s), '
+                                 'retrying in %ss', exc, delay)
+                for callback in self.error_callbacks:
+                    try:
+                        callback(exc)
+                    except Exception:
+                        __logs__.exception('Error callback %r failed',
+                                           callback)
+            self._stopped.wait(delay)
+
+    def start(self):
+        """Run the sync loop in a background thread."""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self.run, name='github3-inbox')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop syncing once the sync in progress is done."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def _updated_at(thread):
+    return thread.as_dict().get('updated_at') or ''
+
+
+def _repository_name(thread):
+    return getattr(thread.repository, 'full_name', None)
+
+
+def _by_repository(threads):
+    groups = {}
+    for thread in threads:
+        groups.setdefault(_repository_name(thread), []).append(thread)
+    return groups
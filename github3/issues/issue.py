@@ -1,15 +1,16 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from json import dumps
 from re import match
 
 from uritemplate import URITemplate
 
 from .. import users
 
+from ..compact import CompactIssue
 from ..decorators import requires_auth
-from ..models import GitHubCore
+from ..models import (GitHubCore, LazyAttribute, lazy_class_attribute,
+                      lazy_strptime_attribute)
 from .comment import IssueComment, issue_comment_params
 from .event import IssueEvent
 from .label import Label
@@ -34,18 +35,57 @@ class Issue(GitHubCore):
 
     """
 
+    _compact_class = CompactIssue
+
+    #: :class:`User <github3.users.User>` representing the user the issue
+    #: was assigned to.
+    assignee = lazy_class_attribute('assignee', users.ShortUser)
+
+    @LazyAttribute
+    def assignees(self, issue):
+        r"""List of :class:`User <github3.users.User>`\ s assigned to the
+        issue."""
+        assignees = self._get_attribute(issue, 'assignees')
+        if assignees:
+            assignees = [users.ShortUser(assignee) for assignee in assignees]
+        return assignees
+
+    # If an issue is still open, this field will be None
+    #: datetime object representing when the issue was closed.
+    closed_at = lazy_strptime_attribute('closed_at')
+
+    #: datetime object representing when the issue was created.
+    created_at = lazy_strptime_attribute('created_at')
+
+    #: Labels URL Template. Expand with ``name``
+    labels_urlt = lazy_class_attribute('labels_url', URITemplate, bind=False)
+
+    @LazyAttribute
+    def original_labels(self, issue):
+        r"""Returns the list of :class:`Label <github3.issues.label.Label>`\ s
+        on this issue."""
+        labels = self._get_attribute(issue, 'labels', [])
+        if labels:
+            labels = [Label(l, self) for l in labels]
+        return labels
+
+    #: :class:`Milestone <github3.issues.milestone.Milestone>` this
+    #: issue was assigned to.
+    milestone = lazy_class_attribute('milestone', Milestone)
+
+    #: datetime object representing the last time the issue was updated.
+    updated_at = lazy_strptime_attribute('updated_at')
+
+    #: :class:`User <github3.users.User>` who opened the issue.
+    user = lazy_class_attribute('user', users.ShortUser)
+
+    #: :class:`User <github3.users.User>` who closed the issue.
+    closed_by = lazy_class_attribute('closed_by', users.ShortUser)
+
     def _update_attributes(self, issue):
+        self._reset_lazy_attributes(issue)
         self._api = self._get_attribute(issue, 'url', '')
 
-        #: :class:`User <github3.users.User>` representing the user the issue
-        #: was assigned to.
-        self.assignee = self._class_attribute(
-            issue, 'assignee', users.ShortUser, self)
-        self.assignees = self._get_attribute(issue, 'assignees')
-        if self.assignees:
-            self.assignees = [
-                users.ShortUser(assignee) for assignee in self.assignees
-            ]
         #: Body (description) of the issue.
         self.body = self._get_attribute(issue, 'body')
 
@@ -55,19 +95,12 @@ class Issue(GitHubCore):
         #: Plain text formatted body of the issue.
         self.body_text = self._get_attribute(issue, 'body_text')
 
-        # If an issue is still open, this field will be None
-        #: datetime object representing when the issue was closed.
-        self.closed_at = self._strptime_attribute(issue, 'closed_at')
-
         #: Number of comments on this issue.
         self.comments_count = self._get_attribute(issue, 'comments')
 
         #: Comments url (not a template)
         self.comments_url = self._get_attribute(issue, 'comments_url')
 
-        #: datetime object representing when the issue was created.
-        self.created_at = self._strptime_attribute(issue, 'created_at')
-
         #: Events url (not a template)
         self.events_url = self._get_attribute(issue, 'events_url')
 
@@ -77,27 +110,9 @@ class Issue(GitHubCore):
         #: Unique ID for the issue.
         self.id = self._get_attribute(issue, 'id')
 
-        #: Returns the list of :class:`Label <github3.issues.label.Label>`\ s
-        #: on this issue.
-        self.original_labels = self._get_attribute(issue, 'labels', [])
-        if self.original_labels:
-            self.original_labels = [
-                Label(l, self) for l in self.original_labels
-            ]
-
-        #: Labels URL Template. Expand with ``name``
-        self.labels_urlt = self._get_attribute(
-            issue, 'labels_url', URITemplate
-        )
-
         #: Locked status
         self.locked = self._get_attribute(issue, 'locked')
 
-        #: :class:`Milestone <github3.issues.milestone.Milestone>` this
-        #: issue was assigned to.
-        self.milestone = self._class_attribute(
-            issue, 'milestone', Milestone, self)
-
         #: Issue number (e.g. #15)
         self.number = self._get_attribute(issue, 'number')
 
@@ -117,17 +132,6 @@ class Issue(GitHubCore):
         #: Title of the issue.
         self.title = self._get_attribute(issue, 'title')
 
-        #: datetime object representing the last time the issue was updated.
-        self.updated_at = self._strptime_attribute(issue, 'updated_at')
-
-        #: :class:`User <github3.users.User>` who opened the issue.
-        self.user = self._class_attribute(
-            issue, 'user', users.ShortUser, self)
-
-        #: :class:`User <github3.users.User>` who closed the issue.
-        self.closed_by = self._class_attribute(
-            issue, 'closed_by', users.ShortUser, self)
-
     def _repr(self):
         return '<Issue [{r[0]}/{r[1]} #{n}]>'.format(r=self.repository,
                                                      n=self.number)
@@ -251,7 +255,9 @@ class Issue(GitHubCore):
         if data:
             if 'milestone' in data and data['milestone'] == 0:
                 data['milestone'] = None
-            json = self._json(self._patch(self._api, data=dumps(data)), 200)
+            json = self._json(
+                self._patch(self._api, data=self._dumps(data)), 200
+            )
         if json:
             self._update_attributes(json)
             return True
@@ -340,7 +346,7 @@ class Issue(GitHubCore):
         :returns: list of :class:`Label`
         """
         url = self._build_url('labels', base_url=self._api)
-        json = self._json(self._put(url, data=dumps(labels)), 200)
+        json = self._json(self._put(url, data=self._dumps(labels)), 200)
         return [Label(l, self) for l in json] if json else []
 
     @requires_auth
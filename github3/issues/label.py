@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from json import dumps
 from ..decorators import requires_auth
 from ..models import GitHubCore
 
@@ -48,7 +47,7 @@ class Label(GitHubCore):
         if name and color:
             if color[0] == '#':
                 color = color[1:]
-            json = self._json(self._patch(self._api, data=dumps({
+            json = self._json(self._patch(self._api, data=self._dumps({
                 'name': name, 'color': color})), 200)
 
         if json:
@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+"""
+github3.metrics
+===============
+
+This module describes every request a :class:`GitHubSession
+<github3.session.GitHubSession>` makes to the hooks registered in
+``session.request_hooks`` and provides hooks that aggregate those
+descriptions into metrics::
+
+    from github3.metrics import RequestStats
+
+    stats = RequestStats()
+    gh.session.request_hooks.append(stats)
+    ...
+    for (method, route), endpoint in stats.endpoints.items():
+        print(method, route, endpoint.count, endpoint.mean_latency)
+
+"""
+import re
+import threading
+
+from requests.compat import urlparse
+
+from .ratelimit import resource_for
+
+#: Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+_SHA = re.compile(r'^[0-9a-f]{40}$')
+_NUMBER = re.compile(r'^[0-9]+$')
+
+# Collections whose members are named rather than numbered, with the
+# placeholder used for the name
+_NAMED_MEMBERS = {
+    'assignees': '{assignee}',
+    'blocks': '{username}',
+    'blobs': '{sha}',
+    'branches': '{branch}',
+    'collaborators': '{username}',
+    'commits': '{sha}',
+    'followers': '{username}',
+    'following': '{username}',
+    'gists': '{gist_id}',
+    'keys': '{key_id}',
+    'labels': '{name}',
+    'members': '{username}',
+    'memberships': '{username}',
+    'orgs': '{org}',
+    'public_members': '{username}',
+    'tags': '{tag}',
+    'trees': '{sha}',
+    'users': '{username}',
+}
+# Collections of repositories, e.g., /user/starred/{owner}/{repo}
+_REPOSITORY_MEMBERS = frozenset(['starred', 'subscriptions'])
+# Collections whose members are named but which also have fixed sub-paths,
+# e.g., /gists/public
+_FIXED_MEMBERS = frozenset(['public', 'starred', 'latest', 'repos', 'orgs'])
+# Everything after these segments is a single path or ref
+_REST_OF_PATH = {
+    'compare': '{basehead}',
+    'contents': '{path}',
+    'refs': '{ref}',
+    'readme': '{dir}',
+}
+
+_routes = {}
+_ROUTES_SIZE = 4096
+
+
+def normalize_route(url):
+    """Turn the URL of a request into the template of its endpoint.
+
+    Owners, repositories, users, numbers, SHAs, paths and the like are
+    replaced by placeholders so that requests to the same endpoint can be
+    aggregated::
+
+        >>> normalize_route('https://api.github.com/repos/a/b/issues/1')
+        '/repos/{owner}/{repo}/issues/{number}'
+
+    :param str url: URL of the request
+    :returns: the route template
+    :rtype: str
+    """
+    path = urlparse(url).path
+    route = _routes.get(path)
+    if route is not None:
+        return route
+
+    segments = [s for s in path.split('/') if s]
+    if segments[:2] == ['api', 'v3']:
+        # GitHub Enterprise
+        segments = segments[2:]
+    template = []
+    i = 0
+    while i < len(segments):
+        segment = segments[i]
+        previous = segments[i - 1] if i else None
+        if ((previous == 'repos' and i == 1 or
+                previous in _REPOSITORY_MEMBERS) and i + 1 < len(segments)):
+            template.extend(['{owner}', '{repo}'])
+            i += 2
+            continue
+        if previous in _REST_OF_PATH:
+            template.append(_REST_OF_PATH[previous])
+            break
+        if _NUMBER.match(segment):
+            template.append('{id}' if previous not in (
+                'issues', 'pulls', 'milestones'
+            ) else '{number}')
+        elif _SHA.match(segment):
+            template.append('{sha}')
+        elif (previous in _NAMED_MEMBERS and
+                segment not in _FIXED_MEMBERS):
+            template.append(_NAMED_MEMBERS[previous])
+        else:
+            template.append(segment)
+        i += 1
+
+    route = '/' + '/'.join(template)
+    if len(_routes) >= _ROUTES_SIZE:
+        _routes.clear()
+    _routes[path] = route
+    return route
+
+
+class RequestEvent(object):
+
+    """Describes one request made through a session.
+
+    Retries and token fail-overs are part of the same event.
+    """
+
+    def __init__(self, method, url, response=None, elapsed=0.0,
+                 exception=None, stream=False):
+        #: HTTP method, e.g., ``'GET'``
+        self.method = method.upper()
+        #: URL requested
+        self.url = url
+        #: Template of the endpoint, see :func:`normalize_route`
+        self.route = normalize_route(url)
+        #: Rate limit resource the request counts against
+        self.resource = resource_for(url)
+        #: The response, None if an exception was raised
+        self.response = response
+        #: Exception raised while sending the request, if any
+        self.exception = exception
+        #: Seconds from the start of the request to its response, including
+        #: retries and waiting for the rate limit policy
+        self.elapsed = elapsed
+        #: Status code of the response, None if there is none
+        self.status_code = None
+        #: Number of bytes in the body of the response, None for streamed
+        #: responses without a ``Content-Length`` header
+        self.bytes_received = None
+        #: Whether the body was served from the session's cache
+        self.from_cache = False
+        #: Whether GitHub answered ``304 Not Modified``, i.e., the request
+        #: did not count against the rate limit
+        self.not_modified = False
+        #: Number of times the request was retried
+        self.retries = 0
+        #: ``X-RateLimit-Limit``, None if the header was missing
+        self.rate_limit = None
+        #: ``X-RateLimit-Remaining``, None if the header was missing
+        self.rate_limit_remaining = None
+        #: ``X-RateLimit-Reset``, None if the header was missing
+        self.rate_limit_reset = None
+
+        if response is not None:
+            self._update_from_response(response, stream)
+
+    def __repr__(self):
+        return '<RequestEvent [{0} {1} {2}]>'.format(
+            self.method, self.route, self.status_code
+        )
+
+    def _update_from_response(self, response, stream):
+        headers = response.headers
+        self.status_code = response.status_code
+        self.from_cache = getattr(response, 'from_cache', False)
+        self.not_modified = self.from_cache or response.status_code == 304
+        self.retries = getattr(response, 'retries', 0)
+        if stream:
+            length = headers.get('Content-Length')
+            self.bytes_received = int(length) if length else None
+        else:
+            self.bytes_received = len(response.content or b'')
+        self.resource = headers.get('X-RateLimit-Resource', self.resource)
+        self.rate_limit = _int_or_none(headers.get('X-RateLimit-Limit'))
+        self.rate_limit_remaining = _int_or_none(
+            headers.get('X-RateLimit-Remaining')
+        )
+        self.rate_limit_reset = _int_or_none(headers.get('X-RateLimit-Reset'))
+
+    @property
+    def quota_spent(self):
+        """Number of requests counted against the rate limit, 0 or 1."""
+        if self.response is None or self.not_modified:
+            return 0
+        return 1
+
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class EndpointStats(object):
+
+    """Aggregated statistics of the requests to one endpoint."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        #: Number of requests
+        self.count = 0
+        #: Number of requests by status code, ``None`` counts exceptions
+        self.statuses = {}
+        #: Sum of the latencies in seconds
+        self.total_latency = 0.0
+        #: Upper bounds of the latency buckets
+        self.buckets = tuple(buckets)
+        #: Number of requests in each latency bucket (not cumulative)
+        self.bucket_counts = [0] * len(self.buckets)
+        #: Number of bytes received
+        self.bytes_received = 0
+        #: Number of responses served from the cache or with a ``304``
+        self.not_modified = 0
+        #: Number of retries
+        self.retries = 0
+        #: Number of requests counted against the rate limit
+        self.quota_spent = 0
+
+    def __repr__(self):
+        return '<EndpointStats [{0} requests, {1:.3f}s mean]>'.format(
+            self.count, self.mean_latency
+        )
+
+    @property
+    def mean_latency(self):
+        """Mean latency in seconds."""
+        return self.total_latency / self.count if self.count else 0.0
+
+    def record(self, event):
+        self.count += 1
+        self.statuses[event.status_code] = (
+            self.statuses.get(event.status_code, 0) + 1
+        )
+        self.total_latency += event.elapsed
+        for index, bound in enumerate(self.buckets):
+            if event.elapsed <= bound:
+                self.bucket_counts[index] += 1
+                break
+        self.bytes_received += event.bytes_received or 0
+        self.not_modified += event.not_modified
+        self.retries += event.retries
+        self.quota_spent += event.quota_spent
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'statuses': dict(self.statuses),
+            'total_latency': self.total_latency,
+            'mean_latency': self.mean_latency,
+            'buckets': list(zip(self.buckets, self.bucket_counts)),
+            'bytes_received': self.bytes_received,
+            'not_modified': self.not_modified,
+            'retries': self.retries,
+            'quota_spent': self.quota_spent,
+        }
+
+
+class RequestStats(object):
+
+    """A request hook aggregating events by method and route in memory.
+
+    :param buckets: (optional), upper bounds of the latency histogram
+        buckets in seconds, default: :data:`LATENCY_BUCKETS`
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        #: :class:`EndpointStats` keyed by ``(method, route)``
+        self.endpoints = {}
+        #: Last ``X-RateLimit-Remaining`` seen, keyed by resource
+        self.rate_limit_remaining = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        key = (event.method, event.route)
+        with self._lock:
+            endpoint = self.endpoints.get(key)
+            if endpoint is None:
+                endpoint = self.endpoints[key] = EndpointStats(self.buckets)
+            endpoint.record(event)
+            if event.rate_limit_remaining is not None:
+                self.rate_limit_remaining[event.resource] = (
+                    event.rate_limit_remaining
+                )
+
+    def reset(self):
+        with self._lock:
+            self.endpoints.clear()
+            self.rate_limit_remaining.clear()
+
+    def as_dict(self):
+        """Return the statistics keyed by ``'METHOD /route'``."""
+        with self._lock:
+            return dict(
+                ('{0} {1}'.format(*key), endpoint.as_dict())
+                for key, endpoint in self.endpoints.items()
+            )
+
+
+class PrometheusMetrics(object):
+
+    """A request hook exporting events as Prometheus metrics.
+
+    This requires `prometheus_client
+    <https://pypi.org/project/prometheus_client/>`_, installable with the
+    ``prometheus`` extra. The following metrics are labelled by ``method``
+    and ``route``:
+
+    - ``<namespace>_requests_total``, also labelled by ``status``
+    - ``<namespace>_request_duration_seconds``, a histogram
+    - ``<namespace>_response_bytes_total``
+    - ``<namespace>_not_modified_total``
+    - ``<namespace>_retries_total``
+    - ``<namespace>_quota_spent_total``, also labelled by ``resource``
+
+    ``<namespace>_rate_limit_remaining`` is a gauge labelled by
+    ``resource``.
+
+    :param registry: (optional), registry to register the metrics with,
+        default: prometheus_client's default registry
+    :param str namespace: (optional), prefix of the metric names, default:
+        ``github3``
+    :param buckets: (optional), upper bounds of the latency histogram
+        buckets in seconds, default: :data:`LATENCY_BUCKETS`
+    """
+
+    def __init__(self, registry=None, namespace='github3',
+                 buckets=LATENCY_BUCKETS):
+        import prometheus_client as prometheus
+
+        if registry is None:
+            registry = prometheus.REGISTRY
+        labels = ['method', 'route']
+        options = {'namespace': namespace, 'registry': registry}
+        self.requests = prometheus.Counter(
+            'requests_total', 'Requests made to the GitHub API',
+            labels + ['status'], **options
+        )
+        self.duration = prometheus.Histogram(
+            'request_duration_seconds', 'Latency of GitHub API requests',
+            labels, buckets=buckets, **options
+        )
+        self.bytes_received = prometheus.Counter(
+            'response_bytes_total', 'Bytes received from the GitHub API',
+            labels, **options
+        )
+        self.not_modified = prometheus.Counter(
+            'not_modified_total',
+            'Responses served from the cache or with a 304', labels,
+            **options
+        )
+        self.retries = prometheus.Counter(
+            'retries_total', 'Retries of GitHub API requests', labels,
+            **options
+        )
+        self.quota_spent = prometheus.Counter(
+            'quota_spent_total', 'Requests counted against the rate limit',
+            labels + ['resource'], **options
+        )
+        self.rate_limit_remaining = prometheus.Gauge(
+            'rate_limit_remaining', 'Requests left in the rate limit window',
+            ['resource'], **options
+        )
+
+    def __call__(self, event):
+        method, route = event.method, event.route
+        self.requests.labels(method, route, str(event.status_code)).inc()
+        self.duration.labels(method, route).observe(event.elapsed)
+        if event.bytes_received:
+            self.bytes_received.labels(method, route).inc(
+                event.bytes_received
+            )
+        if event.not_modified:
+            self.not_modified.labels(method, route).inc()
+        if event.retries:
+            self.retries.labels(method, route).inc(event.retries)
+        if event.quota_spent:
+            self.quota_spent.labels(method, route, event.resource).inc()
+        if event.rate_limit_remaining is not None:
+            self.rate_limit_remaining.labels(event.resource).set(
+                event.rate_limit_remaining
+            )
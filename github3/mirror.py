@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+"""
+github3.mirror
+==============
+
+This module mirrors the files of a repository into a local directory. The
+whole tree is listed with a single recursive request and only the blobs
+whose SHA differs from the file on disk are downloaded, concurrently and
+undecoded, so keeping a large directory up to date costs one request plus
+one per changed file::
+
+    from github3.mirror import TreeMirror
+
+    mirror = TreeMirror(repository, '/srv/config', patterns=['config/*'])
+    report = mirror.sync('master')
+    print(report.written, report.unchanged)
+
+"""
+import binascii
+import errno
+import fnmatch
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+
+from logging import getLogger
+
+from . import exceptions
+from .batch import DEFAULT_WORKERS, run_batch
+from .git import Blob, Hash
+
+__logs__ = getLogger(__package__)
+
+#: Media type of undecorated blob contents
+RAW_MEDIA_TYPE = 'application/vnd.github.v3.raw'
+
+#: Git file modes, by meaning
+EXECUTABLE_MODE = '100755'
+SYMLINK_MODE = '120000'
+
+#: Prefix of the temporary files written next to their destination
+TEMPORARY_PREFIX = '.github3-'
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+def blob_sha(data):
+    """Return the SHA git gives a blob holding ``data``.
+
+    :param bytes data: contents of the blob
+    :rtype: str
+    """
+    header = 'blob {0}\0'.format(len(data)).encode('ascii')
+    return hashlib.sha1(header + data).hexdigest()
+
+
+class MirrorReport(object):
+
+    """What a :meth:`TreeMirror.sync` did."""
+
+    def __init__(self, sha):
+        #: SHA of the tree that was mirrored
+        self.sha = sha
+        #: Paths of the files written
+        self.written = []
+        #: Number of files that were up to date
+        self.unchanged = 0
+        #: Paths of the files removed because they left the tree
+        self.deleted = []
+        #: Exceptions raised while mirroring files, by path
+        self.failed = {}
+
+    def __repr__(self):
+        return '<MirrorReport [{0}: {1} written, {2} unchanged]>'.format(
+            self.sha, len(self.written), self.unchanged
+        )
+
+    @property
+    def ok(self):
+        """Whether every file was mirrored."""
+        return not self.failed
+
+
+class TreeMirror(object):
+
+    """Keep a local directory identical to the tree of a repository.
+
+    The SHA of every local file is remembered along with its size and
+    modification time, so files are only read and hashed again when they
+    changed on disk. Blobs found at several paths, or already present on
+    disk under another path, are only downloaded once.
+
+    :param repository: the :class:`Repository <github3.repos.Repository>`
+        to mirror
+    :param str destination: directory the files are written to
+    :param patterns: (optional), glob patterns, e.g., ``'config/*.yml'``;
+        only paths matching one of them are mirrored. ``*`` also matches
+        ``/``. Default: every path
+    :type patterns: list of str
+    :param int workers: (optional), number of blobs downloaded at once,
+        default: 10
+    :param bool delete: (optional), remove the local files, among those
+        matching ``patterns``, that are not in the tree, default: False
+    """
+
+    def __init__(self, repository, destination, patterns=None,
+                 workers=DEFAULT_WORKERS, delete=False):
+        self.repository = repository
+        self.destination = os.path.abspath(destination)
+        self.patterns = list(patterns or [])
+        self.workers = workers
+        self.delete = delete
+        self._index = {}
+
+    def __repr__(self):
+        return '<TreeMirror [{0} -> {1}]>'.format(self.repository,
+                                                  self.destination)
+
+    def sync(self, ref=None):
+        """Bring the destination up to date with a tree.
+
+        Files that cannot be downloaded or written are recorded in the
+        report and do not stop the others.
+
+        :param str ref: (optional), SHA of a tree or commit, or name of a
+            branch or tag. Default: the default branch of the repository
+        :returns: :class:`MirrorReport`
+        """
+        ref = ref or self.repository.default_branch or 'master'
+        sha, entries = self._tree(ref)
+        report = MirrorReport(sha)
+        wanted = {}
+        for entry in entries:
+            if entry.type != 'blob' or not self._matches(entry.path):
+                continue
+            path = self._local_path(entry.path)
+            if path is None:
+                report.failed[entry.path] = ValueError(
+                    'Unsafe path {0!r}'.format(entry.path)
+                )
+                continue
+            wanted[entry.path] = (path, entry)
+
+        local = {}
+        missing = {}
+        for name, (path, entry) in wanted.items():
+            current = None
+            if self._inside(os.path.dirname(path)):
+                current = self._local_sha(path)
+            if current is not None:
+                local.setdefault(current, path)
+            if current == entry.sha and self._mode_matches(path, entry):
+                report.unchanged += 1
+            else:
+                missing.setdefault(entry.sha, []).append((name, path, entry))
+
+        def fetch(sha):
+            data = None
+            if sha in local:
+                # Renamed and copied files are copied locally
+                data = _read(local[sha])
+            if data is None or blob_sha(data) != sha:
+                data = self._blob(sha)
+            for name, path, entry in missing[sha]:
+                self._write(path, data, entry)
+            return [name for name, _, _ in missing[sha]]
+
+        for result in run_batch(fetch, sorted(missing), self.workers,
+                                ordered=False):
+            if result.exception is not None:
+                __logs__.warning('Mirroring blob %s failed: %s', result.key,
+                                 result.exception)
+                for name, _, _ in missing[result.key]:
+                    report.failed[name] = result.exception
+            else:
+                report.written.extend(result.result)
+        report.written.sort()
+
+        if self.delete:
+            report.deleted = self._delete(set(wanted))
+        return report
+
+    def _tree(self, ref):
+        """List the blobs of ``ref`` with one request if GitHub can."""
+        json = self._get_tree(ref, recursive=True)
+        sha = json.get('sha')
+        if not json.get('truncated'):
+            return sha, [Hash(entry) for entry in json.get('tree', [])]
+
+        # Trees too large for one listing are walked level by level
+        entries = []
+        level = [('', sha)]
+        while level:
+            subtrees = []
+            results = run_batch(lambda item: self._get_tree(item[1]), level,
+                                self.workers)
+            for result in results:
+                if result.exception is not None:
+                    raise result.exception
+                prefix = result.key[0]
+                for entry in result.result.get('tree', []):
+                    entry = dict(entry, path=prefix + entry['path'])
+                    if entry['type'] == 'tree':
+                        subtrees.append((entry['path'] + '/', entry['sha']))
+                    else:
+                        entries.append(Hash(entry))
+            level = subtrees
+        return sha, entries
+
+    def _get_tree(self, sha, recursive=False):
+        repository = self.repository
+        url = repository._build_url('git', 'trees', sha,
+                                    base_url=repository._api)
+        params = {'recursive': '1'} if recursive else None
+        response = repository._get(url, params=params)
+        json = repository._json(response, 200, include_cache_info=False)
+        if json is None:
+            raise exceptions.error_for(response)
+        return json
+
+    def _blob(self, sha):
+        repository = self.repository
+        url = repository._build_url('git', 'blobs', sha,
+                                    base_url=repository._api)
+        response = repository._get(url, headers={'Accept': RAW_MEDIA_TYPE})
+        if response.status_code != 200:
+            raise exceptions.error_for(response)
+        data = response.content
+        if response.headers.get('Content-Type', '').startswith(
+                'application/json'):
+            # The media type was not honoured, e.g., by a proxy
+            data = Blob(repository._loads(response)).decoded
+        if blob_sha(data) != sha:
+            raise ValueError('Blob {0} was corrupted in transit'.format(sha))
+        return data
+
+    def _matches(self, path):
+        return not self.patterns or any(
+            fnmatch.fnmatchcase(path, pattern) for pattern in self.patterns
+        )
+
+    def _local_path(self, name):
+        parts = name.split('/')
+        if '..' in parts or '' in parts or os.path.isabs(name):
+            return None
+        return os.path.join(self.destination, *parts)
+
+    def _inside(self, directory):
+        """Whether ``directory`` resolves to a directory under the
+        destination."""
+        root = os.path.realpath(self.destination)
+        directory = os.path.realpath(directory)
+        return directory == root or directory.startswith(
+            os.path.join(root, '')
+        )
+
+    def _make_parents(self, path):
+        """Create the directories holding ``path``.
+
+        Symbolic links and files in the way, e.g., left by an earlier tree,
+        are replaced, so that nothing is written outside the destination.
+        """
+        directory = self.destination
+        try:
+            os.makedirs(directory)
+        except OSError as exc:
+            if exc.errno != errno.EEXIST:
+                raise
+        for part in os.path.relpath(path, directory).split(os.sep)[:-1]:
+            directory = os.path.join(directory, part)
+            if os.path.islink(directory) or os.path.isfile(directory):
+                os.remove(directory)
+                self._index.pop(directory, None)
+            try:
+                os.mkdir(directory)
+            except OSError as exc:
+                if exc.errno != errno.EEXIST:
+                    raise
+        if not self._inside(directory):
+            raise ValueError('{0!r} is outside of {1!r}'.format(
+                directory, self.destination
+            ))
+        return directory
+
+    def _local_sha(self, path):
+        try:
+            info = os.lstat(path)
+        except OSError:
+            self._index.pop(path, None)
+            return None
+        key = (info.st_size, info.st_mtime, info.st_mode)
+        cached = self._index.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if stat.S_ISLNK(info.st_mode):
+            sha = blob_sha(os.readlink(path).encode('utf-8'))
+        elif stat.S_ISREG(info.st_mode):
+            with open(path, 'rb') as fd:
+                sha = blob_sha(fd.read())
+        else:
+            return None
+        self._index[path] = (key, sha)
+        return sha
+
+    def _mode_matches(self, path, entry):
+        mode = os.lstat(path).st_mode
+        if entry.mode == SYMLINK_MODE or stat.S_ISLNK(mode):
+            return entry.mode == SYMLINK_MODE and stat.S_ISLNK(mode)
+        if os.name != 'posix':
+            return True
+        return bool(mode & stat.S_IXUSR) == (entry.mode == EXECUTABLE_MODE)
+
+    def _write(self, path, data, entry):
+        directory = self._make_parents(path)
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+
+        if entry.mode == SYMLINK_MODE and hasattr(os, 'symlink'):
+            temporary = _symlink(data.decode('utf-8'), directory)
+        else:
+            fd, temporary = tempfile.mkstemp(dir=directory,
+                                             prefix=TEMPORARY_PREFIX)
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(data)
+                os.chmod(temporary,
+                         0o755 if entry.mode == EXECUTABLE_MODE else 0o644)
+            except Exception:
+                os.remove(temporary)
+                raise
+        try:
+            _replace(temporary, path)
+        except Exception:
+            os.remove(temporary)
+            raise
+        info = os.lstat(path)
+        self._index[path] = ((info.st_size, info.st_mtime, info.st_mode),
+                             entry.sha)
+
+    def _delete(self, names):
+        deleted = []
+        for root, directories, files in os.walk(self.destination):
+            # Links to directories are listed but not followed
+            links = [d for d in directories
+                     if os.path.islink(os.path.join(root, d))]
+            for file in files + links:
+                path = os.path.join(root, file)
+                name = os.path.relpath(path, self.destination).replace(
+                    os.sep, '/'
+                )
+                if name not in names and self._matches(name):
+                    os.remove(path)
+                    self._index.pop(path, None)
+                    deleted.append(name)
+        return sorted(deleted)
+
+
+def _symlink(target, directory):
+    """Create a link to ``target`` under a new name in ``directory``."""
+    while True:
+        suffix = binascii.hexlify(os.urandom(8)).decode('ascii')
+        temporary = os.path.join(directory, TEMPORARY_PREFIX + suffix)
+        try:
+            os.symlink(target, temporary)
+            return temporary
+        except OSError as exc:
+            if exc.errno != errno.EEXIST:
+                raise
+
+
+def _read(path):
+    try:
+        if os.path.islink(path):
+            return os.readlink(path).encode('utf-8')
+        with open(path, 'rb') as fd:
+            return fd.read()
+    except (IOError, OSError):
+        return None
@@ -8,7 +8,6 @@ This module provides the basic models used in github3.py
 """
 from __future__ import unicode_literals
 
-from datetime import datetime
 from json import dumps, loads
 from logging import getLogger
 
@@ -18,10 +17,85 @@ from requests.compat import is_py2, urlparse
 from . import exceptions
 from .decorators import requires_auth
 from .session import GitHubSession
-from .utils import UTC
+from .utils import TIMESTAMP_FORMAT, parse_timestamp
 
-__timeformat__ = '%Y-%m-%dT%H:%M:%SZ'
+__timeformat__ = TIMESTAMP_FORMAT
 __logs__ = getLogger(__package__)
+__lazy_names__ = {}
+
+
+class LazyAttribute(object):
+    """An attribute computed from a model's JSON the first time it is read.
+
+    The computed value is stored on the instance, so every later read is a
+    plain attribute lookup. It is used as a decorator on a function that
+    receives the model and the JSON it was last updated with::
+
+        @LazyAttribute
+        def owner(self, repo):
+            return self._class_attribute(repo, 'owner', ShortUser, self)
+
+    Models using lazy attributes call
+    :meth:`GitHubCore._reset_lazy_attributes` from ``_update_attributes``.
+    """
+
+    def __init__(self, compute):
+        self.compute = compute
+        self.name = getattr(compute, '__name__', None)
+        if self.name == '<lambda>':
+            self.name = None
+        self.__doc__ = compute.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if self.name is None:
+            lazy_attribute_names(owner)
+        json = instance.__dict__.get('_lazy_json', instance._json_data)
+        value = self.compute(instance, json)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def lazy_attribute_names(cls):
+    r"""Return the names of the :class:`LazyAttribute`\ s of ``cls``."""
+    names = __lazy_names__.get(cls)
+    if names is None:
+        names = []
+        for klass in cls.__mro__:
+            for name, value in vars(klass).items():
+                if isinstance(value, LazyAttribute) and name not in names:
+                    value.name = value.name or name
+                    names.append(name)
+        names = __lazy_names__[cls] = tuple(names)
+    return names
+
+
+def lazy_class_attribute(attribute, cl, bind=True):
+    """Lazily instantiate ``cl`` with the value of ``attribute``.
+
+    :param str attribute: key of the attribute
+    :param class cl: class that will be instantiated
+    :param bool bind: (optional), pass the model on so the instance shares
+        its session, default: True
+    """
+    if bind:
+        return LazyAttribute(
+            lambda self, json: self._class_attribute(json, attribute, cl, self)
+        )
+    return LazyAttribute(
+        lambda self, json: self._class_attribute(json, attribute, cl)
+    )
+
+
+def lazy_strptime_attribute(attribute):
+    """Lazily parse the timestamp stored under ``attribute``."""
+    return LazyAttribute(
+        lambda self, json: self._strptime_attribute(json, attribute)
+    )
 
 
 class GitHubCore(object):
@@ -54,6 +128,17 @@ class GitHubCore(object):
     def _update_attributes(self, json):
         pass
 
+    def _reset_lazy_attributes(self, json):
+        """Compute every :class:`LazyAttribute` from ``json`` from now on.
+
+        Values computed from previous JSON are discarded.
+        """
+        had_json = '_lazy_json' in self.__dict__
+        self.__dict__['_lazy_json'] = json
+        if had_json:
+            for name in lazy_attribute_names(type(self)):
+                self.__dict__.pop(name, None)
+
     def __getattr__(self, attribute):
         """Proxy access to stored JSON."""
         if attribute not in self._json_data:
@@ -81,10 +166,13 @@ class GitHubCore(object):
 
             json.dumps(obj.as_dict())
 
+        using the session's :attr:`codec
+        <github3.session.GitHubSession.codec>` when one is set.
+
         :returns: this object's attributes as a JSON string
         :rtype: str
         """
-        return dumps(self._json_data)
+        return self._dumps(self._json_data)
 
     @classmethod
     def _get_attribute(cls, data, attribute, fallback=None):
@@ -152,9 +240,7 @@ class GitHubCore(object):
         :rtype: datetime or None
         """
         if time_str:
-            # Parse UTC string into naive datetime, then add timezone
-            dt = datetime.strptime(time_str, __timeformat__)
-            return dt.replace(tzinfo=UTC())
+            return parse_timestamp(time_str)
         return None
 
     def __repr__(self):
@@ -169,9 +255,20 @@ class GitHubCore(object):
         return cls(json_dict)
 
     @classmethod
-    def from_json(cls, json):
-        """Return an instance of this class formed from ``json``."""
-        return cls(loads(json))
+    def from_json(cls, json, session=None):
+        """Return an instance of this class formed from ``json``.
+
+        :param json: JSON document as text or bytes
+        :param session: (optional), :class:`GitHubSession
+            <github3.session.GitHubSession>` whose :attr:`codec
+            <github3.session.GitHubSession.codec>` decodes ``json`` and
+            which the instance will use
+        """
+        codec = getattr(session, 'codec', None)
+        data = codec.loads(json) if codec is not None else loads(json)
+        if session is None:
+            return cls(data)
+        return cls(data, session)
 
     def __eq__(self, other):
         return self._uniq == other._uniq
@@ -211,7 +308,7 @@ class GitHubCore(object):
             __logs__.info('Attempting to get JSON information from a Response '
                           'with status code %d expecting %d',
                           response.status_code, status_code)
-            ret = response.json()
+            ret = self._loads(response)
             headers = response.headers
             if (include_cache_info and
                     (headers.get('Last-Modified') or headers.get('ETag')) and
@@ -223,6 +320,20 @@ class GitHubCore(object):
         __logs__.info('JSON was %sreturned', 'not ' if ret is None else '')
         return ret
 
+    def _loads(self, response):
+        """Decode the body of ``response`` with the session's codec."""
+        codec = getattr(self.session, 'codec', None)
+        if codec is None:
+            return response.json()
+        return codec.loads(response.content)
+
+    def _dumps(self, data):
+        """Encode ``data`` with the session's codec."""
+        codec = getattr(self.session, 'codec', None)
+        if codec is None:
+            return dumps(data)
+        return codec.dumps(data)
+
     def _boolean(self, response, true_code, false_code):
         if response is not None:
             status_code = response.status_code
@@ -257,7 +368,7 @@ class GitHubCore(object):
 
     def _post(self, url, data=None, json=True, **kwargs):
         if json:
-            data = dumps(data) if data is not None else data
+            data = self._dumps(data) if data is not None else data
         __logs__.debug('POST %s with %s, %s', url, data, kwargs)
         return self._request('post', url, data, **kwargs)
 
@@ -269,6 +380,10 @@ class GitHubCore(object):
         """Builds a new API url from scratch."""
         return self.session.build_url(*args, **kwargs)
 
+    def _build_route(self, route, **kwargs):
+        """Expands a precompiled :class:`Route <github3.session.Route>`."""
+        return self.session.build_route(route, **kwargs)
+
     @property
     def _api(self):
         value = "{0.scheme}://{0.netloc}{0.path}".format(self._uri)
@@ -400,8 +515,9 @@ class BaseComment(GitHubCore):
         :returns: bool
         """
         if body:
-            json = self._json(self._patch(self._api,
-                                          data=dumps({'body': body})), 200)
+            json = self._json(
+                self._patch(self._api, data=self._dumps({'body': body})), 200
+            )
             if json:
                 self._update_attributes(json)
                 return True
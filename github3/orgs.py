@@ -9,7 +9,6 @@ This module contains all of the classes related to organizations.
 from __future__ import unicode_literals
 
 import warnings
-from json import dumps
 
 from uritemplate import URITemplate
 
@@ -98,7 +97,7 @@ class Team(GitHubCore):
         """
         data = {'permission': permission}
         url = self._build_url('repos', repository, base_url=self._api)
-        return self._boolean(self._put(url, data=dumps(data)), 204, 404)
+        return self._boolean(self._put(url, data=self._dumps(data)), 204, 404)
 
     @requires_auth
     def delete(self):
@@ -118,7 +117,9 @@ class Team(GitHubCore):
         """
         if name:
             data = {'name': name, 'permission': permission}
-            json = self._json(self._patch(self._api, data=dumps(data)), 200)
+            json = self._json(
+                self._patch(self._api, data=self._dumps(data)), 200
+            )
             if json:
                 self._update_attributes(json)
                 return True
@@ -434,7 +435,9 @@ class Organization(BaseAccount):
         self._remove_none(data)
 
         if data:
-            json = self._json(self._patch(self._api, data=dumps(data)), 200)
+            json = self._json(
+                self._patch(self._api, data=self._dumps(data)), 200
+            )
 
         if json:
             self._update_attributes(json)
@@ -657,7 +660,7 @@ class Membership(GitHubCore):
         :rtype: bool
         """
         if state and state.lower() == 'active':
-            data = dumps({'state': state.lower()})
+            data = self._dumps({'state': state.lower()})
             json = self._json(self._patch(self._api, data=data))
             self._update_attributes(json)
             return True
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""
+github3.poller
+==============
+
+This module watches many event feeds, e.g., the events of thousands of
+repositories, from a single process. Every feed is polled with a conditional
+request at the interval GitHub advises in ``X-Poll-Interval``; unchanged
+feeds are answered with ``304 Not Modified``, which does not count against
+the rate limit. New events are passed to callbacks or put on a queue::
+
+    from github3.poller import EventPoller
+
+    poller = EventPoller(gh, workers=20)
+    for repository in repositories:
+        poller.watch(repository)
+    poller.callbacks.append(lambda event, feed: print(feed.name, event.type))
+    poller.run()
+
+"""
+import collections
+import heapq
+import itertools
+import threading
+import time
+
+from concurrent import futures
+from logging import getLogger
+
+from . import exceptions
+from .events import Event
+from .github import GitHub
+
+__logs__ = getLogger(__package__)
+
+#: Seconds between polls of a feed when GitHub does not advise an interval
+DEFAULT_INTERVAL = 60
+
+#: Number of event ids remembered to recognize events seen before
+DEFAULT_WINDOW = 100000
+
+
+class EventWindow(object):
+
+    """The ids of the most recently seen events.
+
+    Once ``size`` ids are remembered, the oldest are forgotten. The window is
+    shared by every feed of a poller, so an event appearing in the feeds of
+    both an organization and one of its repositories is only dispatched once.
+
+    :param int size: (optional), number of ids to remember, default: 100000
+    """
+
+    def __init__(self, size=DEFAULT_WINDOW):
+        self.size = size
+        self._ids = set()
+        self._order = collections.deque()
+        self._lock = threading.Lock()
+
+    def __contains__(self, event_id):
+        with self._lock:
+            return event_id in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, event_id):
+        """Remember ``event_id``.
+
+        :returns: bool -- True if it was not remembered yet
+        """
+        with self._lock:
+            if event_id in self._ids:
+                return False
+            self._ids.add(event_id)
+            self._order.append(event_id)
+            while len(self._order) > self.size:
+                self._ids.discard(self._order.popleft())
+            return True
+
+
+class Feed(object):
+
+    """A listing of events watched by an :class:`EventPoller`.
+
+    :param str url: URL of the listing, e.g.,
+        ``https://api.github.com/repos/sigmavirus24/github3.py/events``
+    :param str name: (optional), name of the feed, default: its URL
+    """
+
+    def __init__(self, url, name=None):
+        #: URL of the listing
+        self.url = url
+        #: Name of the feed, e.g., the full name of a repository
+        self.name = name or url
+        #: ETag of the last response, sent as ``If-None-Match``
+        self.etag = None
+        #: Seconds GitHub asked to wait between polls, None until the first
+        #: response
+        self.interval = None
+        #: Time, in seconds since the epoch, of the next poll
+        self.next_poll = 0
+        #: Number of polls sent
+        self.polls = 0
+        #: Number of polls answered with ``304 Not Modified``
+        self.not_modified = 0
+        #: Number of failed polls since the last successful one
+        self.failures = 0
+        #: Whether the feed is still watched
+        self.active = True
+        self._primed = False
+
+    def __repr__(self):
+        return '<Feed [{0}]>'.format(self.name)
+
+
+class EventPoller(object):
+
+    """Poll many event feeds and dispatch their new events.
+
+    Polls are sent by a pool of ``workers`` threads, so the number of feeds
+    is only bounded by the rate at which they have to be polled. Feeds whose
+    polls fail are retried with exponential back-off.
+
+    :param github: the :class:`GitHub <github3.github.GitHub>` instance whose
+        session sends the polls
+    :param int workers: (optional), number of polls sent at once, default: 10
+    :param int interval: (optional), seconds between polls of a feed when
+        GitHub does not advise an interval, default: 60
+    :param int per_page: (optional), number of events requested per page,
+        at most 100, default: 100
+    :param window: (optional), an :class:`EventWindow` or its size,
+        default: 100000
+    :param queue: (optional), a :class:`queue.Queue` receiving
+        ``(event, feed)`` tuples
+    :param bool backlog: (optional), dispatch the events already in a feed
+        when it is polled the first time, default: False
+    :param int max_backoff: (optional), longest wait, in seconds, before
+        polling a failing feed again, default: 900
+    """
+
+    def __init__(self, github, workers=10, interval=DEFAULT_INTERVAL,
+                 per_page=100, window=DEFAULT_WINDOW, queue=None,
+                 backlog=False, max_backoff=900):
+        self.github = github
+        self.workers = workers
+        self.interval = interval
+        self.per_page = per_page
+        if not isinstance(window, EventWindow):
+            window = EventWindow(window)
+        #: The :class:`EventWindow` of the ids seen so far
+        self.window = window
+        #: Optional queue receiving ``(event, feed)`` tuples
+        self.queue = queue
+        self.backlog = backlog
+        self.max_backoff = max_backoff
+        #: Callables receiving every new event and its feed
+        self.callbacks = []
+        #: Callables receiving the exception of every failed poll and the
+        #: feed
+        self.error_callbacks = []
+        self._feeds = {}
+        self._schedule = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __repr__(self):
+        return '<EventPoller [{0} feeds]>'.format(len(self._feeds))
+
+    @property
+    def feeds(self):
+        r"""List of the watched :class:`Feed`\ s."""
+        with self._condition:
+            return list(self._feeds.values())
+
+    def watch(self, source, name=None):
+        """Start watching the events of ``source``.
+
+        :param source: a :class:`Repository <github3.repos.Repository>`, an
+            :class:`Organization <github3.orgs.Organization>`, a
+            :class:`GitHub <github3.github.GitHub>` instance for the public
+            events of everyone, or the URL of any event listing
+        :param str name: (optional), name of the feed
+        :returns: :class:`Feed`; watching the same listing twice returns the
+            same feed
+        """
+        url, default_name = _feed_url(source)
+        with self._condition:
+            feed = self._feeds.get(url)
+            if feed is None:
+                feed = self._feeds[url] = Feed(url, name or default_name)
+                self._push(feed)
+                self._condition.notify()
+        return feed
+
+    def unwatch(self, feed):
+        """Stop watching ``feed``."""
+        with self._condition:
+            feed.active = False
+            self._feeds.pop(feed.url, None)
+
+    def poll(self, feed):
+        r"""Poll ``feed`` once and dispatch its new events.
+
+        When every event of a page is new, the next page is requested too,
+        until a page holds an event seen before or the listing ends, so that
+        busy feeds do not lose events between two polls.
+
+        :param feed: the :class:`Feed` to poll
+        :returns: list of the new :class:`Event <github3.events.Event>`\ s,
+            oldest first
+        """
+        headers = {}
+        if feed.etag:
+            headers['If-None-Match'] = feed.etag
+        feed.polls += 1
+        response = self.github._get(feed.url, headers=headers,
+                                    params={'per_page': self.per_page})
+        interval = response.headers.get('X-Poll-Interval')
+        feed.interval = int(interval) if interval else self.interval
+        if response.status_code == 304:
+            feed.not_modified += 1
+            feed.failures = 0
+            return []
+
+        dispatch = feed._primed or self.backlog
+        page = events = self._read_page(response)
+        etag = response.headers.get('ETag')
+        # A feed polled for the first time only needs its latest page to
+        # remember what was already there, unless the backlog is wanted
+        while dispatch and not any(e['id'] in self.window for e in page):
+            url = response.links.get('next', {}).get('url')
+            if not url:
+                break
+            response = self.github._get(url)
+            page = self._read_page(response)
+            events.extend(page)
+
+        feed.etag = etag
+        feed.failures = 0
+        feed._primed = True
+        new = []
+        for event in reversed(events):
+            if self.window.add(event['id']) and dispatch:
+                new.append(Event(event, self.github))
+        for event in new:
+            self._dispatch(event, feed)
+        return new
+
+    def _read_page(self, response):
+        if response.status_code != 200:
+            raise exceptions.error_for(response)
+        return list(self.github._loads(response) or [])
+
+    def _dispatch(self, event, feed):
+        if self.queue is not None:
+            self.queue.put((event, feed))
+        for callback in self.callbacks:
+            try:
+                callback(event, feed)
+            except Exception:
+                __logs__.exception('Event callback %r failed', callback)
+
+    def _poll_and_reschedule(self, feed):
+        try:
+            self.poll(feed)
+            delay = feed.interval
+        except Exception as exc:
+            feed.failures += 1
+            delay = min(self.max_backoff,
+                        (feed.interval or self.interval) *
+                        2 ** (feed.failures - 1))
+            __logs__.warning('Polling %s failed (%s), retrying in %ss',
+                             feed.name, exc, delay)
+            for callback in self.error_callbacks:
+                try:
+                    callback(exc, feed)
+                except Exception:
+                    __logs__.exception('Error callback %r failed', callback)
+        with self._condition:
+            if feed.active:
+                feed.next_poll = time.time() + delay
+                self._push(feed)
+                self._condition.notify()
+
+    def _push(self, feed):
+        heapq.heappush(self._schedule,
+                       (feed.next_poll, next(self._counter), feed))
+
+    def _due(self):
+        """Pop the feeds due now; return them and the seconds until the
+        next one is due."""
+        now = time.time()
+        due = []
+        while self._schedule and self._schedule[0][0] <= now:
+            _, _, feed = heapq.heappop(self._schedule)
+            if feed.active:
+                due.append(feed)
+        wait = self._schedule[0][0] - now if self._schedule else None
+        return due, wait
+
+    def run(self):
+        """Poll the feeds until :meth:`stop` is called."""
+        self._stopped.clear()
+        executor = futures.ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            while not self._stopped.is_set():
+                with self._condition:
+                    if self._stopped.is_set():
+                        break
+                    due, wait = self._due()
+                    if not due:
+                        self._condition.wait(wait)
+                        continue
+                for feed in due:
+                    executor.submit(self._poll_and_reschedule, feed)
+        finally:
+            executor.shutdown(wait=True)
+
+    def start(self):
+        """Run the poller in a background thread."""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self.run,
+                                        name='github3-event-poller')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop polling once the polls in progress are done."""
+        self._stopped.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def _feed_url(source):
+    if isinstance(source, GitHub):
+        return source._build_url('events'), 'public events'
+    if hasattr(source, '_api'):
+        url = source._build_url('events', base_url=source._api)
+        name = (getattr(source, 'full_name', None) or
+                getattr(source, 'login', None) or url)
+        return url, name
+    return source, source
@@ -8,8 +8,6 @@ This module contains all the classes relating to pull requests.
 """
 from __future__ import unicode_literals
 
-from json import dumps
-
 from uritemplate import URITemplate
 
 from . import models
@@ -121,13 +119,58 @@ class PullRequest(models.GitHubCore):
     See also: http://developer.github.com/v3/pulls/
     """
 
-    def _update_attributes(self, pull):
-        self._api = self._get_attribute(pull, 'url')
-
-        #: Base of the merge
-        self.base = self._class_attribute(
+    #: Base of the merge
+    base = models.LazyAttribute(
+        lambda self, pull: self._class_attribute(
             pull, 'base', PullDestination, 'Base'
         )
+    )
+
+    #: datetime object representing when the pull was closed
+    closed_at = models.lazy_strptime_attribute('closed_at')
+
+    #: datetime object representing when the pull was created
+    created_at = models.lazy_strptime_attribute('created_at')
+
+    #: The new head after the pull request
+    head = models.LazyAttribute(
+        lambda self, pull: self._class_attribute(
+            pull, 'head', PullDestination, 'Head'
+        )
+    )
+
+    #: datetime object representing when the pull was merged
+    merged_at = models.lazy_strptime_attribute('merged_at')
+
+    #: :class:`User <github3.users.User>` who merged this pull
+    merged_by = models.lazy_class_attribute('merged_by', users.ShortUser)
+
+    #: Review comment URL Template. Expands with ``number``
+    review_comment_url = models.lazy_class_attribute(
+        'review_comment_url', URITemplate, bind=False
+    )
+
+    @models.LazyAttribute
+    def repository(self, pull):
+        """Returns ('owner', 'repository') this issue was filed on."""
+        if self.base:
+            return self.base.repo
+        return self.base
+
+    #: datetime object representing the last time the object was changed
+    updated_at = models.lazy_strptime_attribute('updated_at')
+
+    #: :class:`User <github3.users.User>` object representing the creator
+    #: of the pull request
+    user = models.lazy_class_attribute('user', users.ShortUser)
+
+    #: :class:`User <github3.users.User>` object representing the assignee
+    #: of the pull request
+    assignee = models.lazy_class_attribute('assignee', users.ShortUser)
+
+    def _update_attributes(self, pull):
+        self._reset_lazy_attributes(pull)
+        self._api = self._get_attribute(pull, 'url')
 
         #: Body of the pull request message
         self.body = self._get_attribute(pull, 'body')
@@ -144,9 +187,6 @@ class PullRequest(models.GitHubCore):
         #: Number of deletions on this pull request
         self.deletions_count = self._get_attribute(pull, 'deletions')
 
-        #: datetime object representing when the pull was closed
-        self.closed_at = self._strptime_attribute(pull, 'closed_at')
-
         #: Number of comments
         self.comments_count = self._get_attribute(pull, 'comments')
 
@@ -159,17 +199,9 @@ class PullRequest(models.GitHubCore):
         #: GitHub.com url of commits in this pull request
         self.commits_url = self._get_attribute(pull, 'commits_url')
 
-        #: datetime object representing when the pull was created
-        self.created_at = self._strptime_attribute(pull, 'created_at')
-
         #: URL to view the diff associated with the pull
         self.diff_url = self._get_attribute(pull, 'diff_url')
 
-        #: The new head after the pull request
-        self.head = self._class_attribute(
-            pull, 'head', PullDestination, 'Head'
-        )
-
         #: The URL of the pull request
         self.html_url = self._get_attribute(pull, 'html_url')
 
@@ -188,31 +220,18 @@ class PullRequest(models.GitHubCore):
         #: Boolean representing whether the pull request has been merged
         self.merged = self._get_attribute(pull, 'merged')
 
-        #: datetime object representing when the pull was merged
-        self.merged_at = self._strptime_attribute(pull, 'merged_at')
-
         #: Whether the pull is deemed mergeable by GitHub
         self.mergeable = self._get_attribute(pull, 'mergeable', False)
 
         #: Whether it would be a clean merge or not
         self.mergeable_state = self._get_attribute(pull, 'mergeable_state')
 
-        #: :class:`User <github3.users.User>` who merged this pull
-        self.merged_by = self._class_attribute(
-            pull, 'merged_by', users.ShortUser, self,
-        )
-
         #: Number of the pull/issue on the repository
         self.number = self._get_attribute(pull, 'number')
 
         #: The URL of the patch
         self.patch_url = self._get_attribute(pull, 'patch_url')
 
-        #: Review comment URL Template. Expands with ``number``
-        self.review_comment_url = self._class_attribute(
-            pull, 'review_comment_url', URITemplate
-        )
-
         #: Number of review comments on the pull request
         self.review_comments_count = self._get_attribute(
             pull, 'review_comments'
@@ -223,30 +242,12 @@ class PullRequest(models.GitHubCore):
             pull, 'review_comments_url'
         )
 
-        #: Returns ('owner', 'repository') this issue was filed on.
-        self.repository = self.base
-        if self.repository:
-            self.repository = self.base.repo
-
         #: The state of the pull
         self.state = self._get_attribute(pull, 'state')
 
         #: The title of the request
         self.title = self._get_attribute(pull, 'title')
 
-        #: datetime object representing the last time the object was changed
-        self.updated_at = self._strptime_attribute(pull, 'updated_at')
-
-        #: :class:`User <github3.users.User>` object representing the creator
-        #: of the pull request
-        self.user = self._class_attribute(pull, 'user', users.ShortUser, self)
-
-        #: :class:`User <github3.users.User>` object representing the assignee
-        #: of the pull request
-        self.assignee = self._class_attribute(
-            pull, 'assignee', users.ShortUser, self,
-        )
-
     def _repr(self):
         return '<Pull Request [#{0}]>'.format(self.number)
 
@@ -378,7 +379,7 @@ class PullRequest(models.GitHubCore):
         if commit_message is not None:
             parameters['commit_message'] = commit_message
         url = self._build_url('merge', base_url=self._api)
-        json = self._json(self._put(url, data=dumps(parameters)), 200)
+        json = self._json(self._put(url, data=self._dumps(parameters)), 200)
         if not json:
             return False
         return json['merged']
@@ -440,7 +441,9 @@ class PullRequest(models.GitHubCore):
         self._remove_none(data)
 
         if data:
-            json = self._json(self._patch(self._api, data=dumps(data)), 200)
+            json = self._json(
+                self._patch(self._api, data=self._dumps(data)), 200
+            )
 
         if json:
             self._update_attributes(json)
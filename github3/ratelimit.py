@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+github3.ratelimit
+=================
+
+This module keeps track of the rate limit budgets GitHub reports on every
+response and provides policies that pace requests so that a crawl never runs
+into a ``403`` half way through.
+
+"""
+import threading
+import time
+
+from requests.compat import urlparse
+
+
+def resource_for(url):
+    """Return the name of the rate limit resource a URL is counted against.
+
+    :param str url: URL of the request
+    :returns: ``'search'``, ``'graphql'`` or ``'core'``
+    :rtype: str
+    """
+    path = urlparse(url).path
+    if '/search/' in path:
+        return 'search'
+    if path.endswith('/graphql'):
+        return 'graphql'
+    return 'core'
+
+
+class Budget(object):
+
+    """The rate limit budget of a single resource."""
+
+    def __init__(self, resource, limit, remaining, reset):
+        #: Name of the resource, e.g., ``'core'`` or ``'search'``
+        self.resource = resource
+        #: Maximum number of requests in the current window
+        self.limit = limit
+        #: Number of requests left in the current window
+        self.remaining = remaining
+        #: UTC epoch seconds at which the window resets
+        self.reset = reset
+
+    def _repr(self):
+        return '<Budget [{0}: {1}/{2}]>'.format(self.resource,
+                                                self.remaining, self.limit)
+
+    def __repr__(self):
+        return self._repr()
+
+    def available(self, now=None):
+        """Return the number of requests that can be made right now."""
+        now = time.time() if now is None else now
+        if now >= self.reset:
+            return self.limit
+        return self.remaining
+
+    def seconds_until_reset(self, now=None):
+        """Return the number of seconds until the window resets."""
+        now = time.time() if now is None else now
+        return max(self.reset - now, 0)
+
+
+class RateLimitTracker(object):
+
+    """Track the rate limit budgets reported in response headers.
+
+    A tracker is attached to every :class:`GitHubSession
+    <github3.session.GitHubSession>` as ``session.rate_limits``::
+
+        budget = gh.session.rate_limits.budget('core')
+        if budget is not None:
+            print(budget.remaining, budget.reset)
+
+    """
+
+    def __init__(self):
+        self._budgets = {}
+        self._lock = threading.Lock()
+
+    def budget(self, resource='core'):
+        """Return the last known :class:`Budget` of ``resource`` or None."""
+        with self._lock:
+            return self._budgets.get(resource)
+
+    def budgets(self):
+        """Return a dictionary of every known :class:`Budget`."""
+        with self._lock:
+            return dict(self._budgets)
+
+    def consume(self, resource):
+        """Record that a request against ``resource`` is about to be sent.
+
+        This keeps concurrent senders from spending the same remaining
+        requests before any of their responses have arrived.
+        """
+        with self._lock:
+            budget = self._budgets.get(resource)
+            if budget is not None and budget.remaining > 0:
+                budget.remaining -= 1
+
+    def update(self, response, resource=None):
+        """Update the budgets from the headers of ``response``.
+
+        :param response: a response from GitHub
+        :param str resource: (optional), resource the request was counted
+            against. Defaults to the ``X-RateLimit-Resource`` header or is
+            inferred from the URL.
+        :returns: the updated :class:`Budget` or None if the response did not
+            carry rate limit headers
+        """
+        headers = response.headers
+        try:
+            limit = int(headers['X-RateLimit-Limit'])
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset = int(headers['X-RateLimit-Reset'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        resource = (headers.get('X-RateLimit-Resource') or resource or
+                    resource_for(response.url or ''))
+        budget = Budget(resource, limit, remaining, reset)
+        with self._lock:
+            self._budgets[resource] = budget
+        return budget
+
+
+class RateLimitPolicy(object):
+
+    """The base class for throttling policies.
+
+    Policies are attached to a session as ``session.rate_limit_policy`` and
+    consulted before every request. Sub-classes implement :meth:`delay`;
+    this class never delays anything.
+
+    :param int reserve: (optional), number of requests per window that are
+        kept back, e.g., for interactive use of the same credentials
+    """
+
+    def __init__(self, reserve=0):
+        #: Number of requests per window that are never spent
+        self.reserve = reserve
+
+    def delay(self, tracker, resource, now):
+        """Return the number of seconds to wait before sending a request."""
+        return 0
+
+    def wait(self, tracker, resource):
+        """Block the calling thread until a request may be sent."""
+        delay = self.delay(tracker, resource, time.time())
+        if delay > 0:
+            time.sleep(delay)
+
+
+class BlockingPolicy(RateLimitPolicy):
+
+    """Send requests as fast as possible, then wait for the window to reset.
+
+    This avoids ``403`` responses but still spends the budget in bursts.
+    """
+
+    def delay(self, tracker, resource, now):
+        budget = tracker.budget(resource)
+        if budget is None or budget.available(now) > self.reserve:
+            return 0
+        return budget.seconds_until_reset(now)
+
+
+class PacingPolicy(RateLimitPolicy):
+
+    """Spread the remaining budget evenly until the window resets.
+
+    Every thread sharing the session is given its own slot so that the
+    combined request rate never exceeds what is left of the budget.
+    """
+
+    def __init__(self, reserve=0):
+        super(PacingPolicy, self).__init__(reserve)
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def delay(self, tracker, resource, now):
+        budget = tracker.budget(resource)
+        if budget is None:
+            return 0
+
+        with self._lock:
+            available = budget.available(now) - self.reserve
+            window = budget.seconds_until_reset(now)
+            # Trackers differ per token when a TokenPool is in use
+            key = (id(tracker), resource)
+            if available <= 0:
+                slot = now + window
+                interval = 0
+            else:
+                slot = max(now, self._next_slot.get(key, now))
+                interval = window / float(available)
+            self._next_slot[key] = slot + interval
+        return slot - now
+
+
+def is_exhausted(response):
+    """Determine whether a response was refused because the budget ran out.
+
+    :param response: a response from GitHub
+    :rtype: bool
+    """
+    return (response.status_code in (403, 429) and
+            response.headers.get('X-RateLimit-Remaining') == '0')
+
+
+class TokenPool(object):
+
+    """A pool of tokens used in turn according to their remaining quota.
+
+    Each token has its own :class:`RateLimitTracker`. For every request the
+    token with the most requests left against the relevant resource is used;
+    tokens that have not been used yet are tried first, in turn. Pools are
+    attached to a session with :meth:`GitHubSession.token_pool_auth
+    <github3.session.GitHubSession.token_pool_auth>`.
+
+    :param tokens: the tokens to rotate between
+    :type tokens: list of str
+    """
+
+    def __init__(self, tokens):
+        #: The tokens in the pool
+        self.tokens = []
+        for token in tokens:
+            if token and token not in self.tokens:
+                self.tokens.append(token)
+        if not self.tokens:
+            raise ValueError('A token pool needs at least one token')
+        self._trackers = dict((t, RateLimitTracker()) for t in self.tokens)
+        self._turn = -1
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def __repr__(self):
+        return '<TokenPool [{0} tokens]>'.format(len(self.tokens))
+
+    def __getstate__(self):
+        # Budgets are out of date by the time a pool is unpickled
+        return {'tokens': self.tokens}
+
+    def __setstate__(self, state):
+        self.__init__(state['tokens'])
+
+    def tracker(self, token):
+        """Return the :class:`RateLimitTracker` of ``token``."""
+        return self._trackers[token]
+
+    def acquire(self, resource='core', exclude=()):
+        """Pick the token with the most requests left for ``resource``.
+
+        Tokens whose budget is not known yet are handed out in turn first,
+        so that a burst of concurrent requests does not go to a single token
+        before any response has arrived. When every token is exhausted, the
+        one whose window resets first is returned.
+
+        :param str resource: rate limit resource of the request
+        :param exclude: (optional), tokens that must not be returned
+        :returns: a token or None if every token was excluded
+        """
+        candidates = [t for t in self.tokens if t not in exclude]
+        if not candidates:
+            return None
+        budgets = dict((t, self._trackers[t].budget(resource))
+                       for t in candidates)
+        unknown = [t for t in candidates if budgets[t] is None]
+        if unknown:
+            with self._lock:
+                self._turn += 1
+                return unknown[self._turn % len(unknown)]
+
+        now = time.time()
+        best = max(candidates, key=lambda t: budgets[t].available(now))
+        if budgets[best].available(now) > 0:
+            return best
+        return min(candidates, key=lambda t: budgets[t].reset)
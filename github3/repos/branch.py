@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from json import dumps
-
 from ..models import GitHubCore
 from .commit import RepoCommit
 
@@ -81,7 +79,7 @@ class Branch(GitHubCore):
 
         edit = {'protection': {'enabled': True, 'required_status_checks': {
             'enforcement_level': enforcement, 'contexts': status_checks}}}
-        json = self._json(self._patch(self._api, data=dumps(edit),
+        json = self._json(self._patch(self._api, data=self._dumps(edit),
                                       headers=self.PREVIEW_HEADERS), 200)
         self._update_attributes(json)
         return True
@@ -89,7 +87,7 @@ class Branch(GitHubCore):
     def unprotect(self):
         """Disable force push protection on this branch."""
         edit = {'protection': {'enabled': False}}
-        json = self._json(self._patch(self._api, data=dumps(edit),
+        json = self._json(self._patch(self._api, data=self._dumps(edit),
                                       headers=self.PREVIEW_HEADERS), 200)
         self._update_attributes(json)
         return True
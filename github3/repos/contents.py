@@ -10,7 +10,6 @@ that can be accessed via the GitHub API.
 from __future__ import unicode_literals
 
 from base64 import b64decode, b64encode
-from json import dumps
 
 from ..decorators import requires_auth
 from ..git import Commit
@@ -120,7 +119,9 @@ class Contents(GitHubCore):
                     'committer': validate_commmitter(committer),
                     'author': validate_commmitter(author)}
             self._remove_none(data)
-            json = self._json(self._delete(self._api, data=dumps(data)), 200)
+            json = self._json(
+                self._delete(self._api, data=self._dumps(data)), 200
+            )
             if json and 'commit' in json:
                 json['commit'] = Commit(json['commit'], self)
             if json and 'content' in json:
@@ -160,7 +161,9 @@ class Contents(GitHubCore):
                     'committer': validate_commmitter(committer),
                     'author': validate_commmitter(author)}
             self._remove_none(data)
-            json = self._json(self._put(self._api, data=dumps(data)), 200)
+            json = self._json(
+                self._put(self._api, data=self._dumps(data)), 200
+            )
             if json and 'content' in json:
                 self._update_attributes(json['content'])
                 json['content'] = self
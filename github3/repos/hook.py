@@ -8,7 +8,6 @@ This module contains only the Hook object for GitHub's Hook API.
 """
 from __future__ import unicode_literals
 
-from json import dumps
 from ..decorators import requires_auth
 from ..models import GitHubCore
 
@@ -90,7 +89,7 @@ class Hook(GitHubCore):
         if rm_events:
             data['remove_events'] = rm_events
 
-        json = self._json(self._patch(self._api, data=dumps(data)), 200)
+        json = self._json(self._patch(self._api, data=self._dumps(data)), 200)
 
         if json:
             self._update_attributes(json)
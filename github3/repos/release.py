@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-import json
-
 from uritemplate import URITemplate
 
 from .. import utils
@@ -171,13 +169,13 @@ class Release(GitHubCore):
         self._remove_none(data)
 
         r = self.session.patch(
-            url, data=json.dumps(data), headers=Release.CUSTOM_HEADERS
+            url, data=self._dumps(data), headers=Release.CUSTOM_HEADERS
         )
 
         successful = self._boolean(r, 200, 404)
         if successful:
             # If the edit was successful, let's update the object.
-            self._update_attributes(r.json())
+            self._update_attributes(self._loads(r))
 
         return successful
 
@@ -200,7 +198,7 @@ class Release(GitHubCore):
         url = self.upload_urlt.expand(params)
         r = self._post(url, data=asset, json=False, headers=headers)
         if r.status_code in (201, 202):
-            return Asset(r.json(), self)
+            return Asset(self._loads(r), self)
         raise error_for(r)
 
 
@@ -305,11 +303,11 @@ class Asset(GitHubCore):
         self._remove_none(edit_data)
         r = self._patch(
             self._api,
-            data=json.dumps(edit_data),
+            data=self._dumps(edit_data),
             headers=Release.CUSTOM_HEADERS
         )
         successful = self._boolean(r, 200, 404)
         if successful:
-            self._update_attributes(r.json())
+            self._update_attributes(self._loads(r))
 
         return successful
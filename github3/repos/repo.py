@@ -10,7 +10,6 @@ parts of GitHub's Repository API.
 from __future__ import unicode_literals
 
 from base64 import b64encode
-from json import dumps
 
 from uritemplate import URITemplate
 
@@ -24,9 +23,12 @@ from ..issues.event import IssueEvent
 from ..issues.label import Label
 from ..issues.milestone import Milestone
 from ..licenses import License
-from ..models import GitHubCore
+from ..mirror import DEFAULT_WORKERS, TreeMirror
+from ..models import (GitHubCore, LazyAttribute, lazy_class_attribute,
+                      lazy_strptime_attribute)
 from ..notifications import Subscription, Thread
 from ..pulls import PullRequest
+from ..session import Route
 from ..utils import stream_response_to_file, timestamp_parameter
 from .branch import Branch
 from .comment import RepoComment
@@ -42,6 +44,10 @@ from .stats import ContributorStats
 from .status import Status
 from .tag import RepoTag
 
+_commit_route = Route('commits/{sha}')
+_issue_route = Route('issues/{number}')
+_pull_request_route = Route('pulls/{number}')
+
 
 class Repository(GitHubCore):
 
@@ -67,13 +73,142 @@ class Repository(GitHubCore):
         'Accept': 'application/vnd.github.v3.star+json'
     }
 
+    #: ``datetime`` object representing when the Repository was created.
+    created_at = lazy_strptime_attribute('created_at')
+
+    # License containing only key, name, url & featured
+    #: :class:`License <github3.licenses.License>` object representing the
+    #: repository license.
+    original_license = lazy_class_attribute('license', License)
+
+    # Repository owner's name
+    #: :class:`User <github3.users.User>` object representing the
+    #: repository owner.
+    owner = lazy_class_attribute('owner', users.ShortUser)
+
+    #: ``datetime`` object representing the last time commits were pushed
+    #: to the repository.
+    pushed_at = lazy_strptime_attribute('pushed_at')
+
+    #: ``datetime`` object representing when the repository was starred
+    starred_at = lazy_strptime_attribute('starred_at')
+
+    #: ``datetime`` object representing the last time the repository was
+    #: updated.
+    updated_at = lazy_strptime_attribute('updated_at')
+
+    @LazyAttribute
+    def source(self, repo):
+        """Parent of this fork, if it exists :class:`Repository`"""
+        return self._class_attribute(repo, 'source', Repository, self)
+
+    @LazyAttribute
+    def parent(self, repo):
+        """Parent of this fork, if it exists :class:`Repository`"""
+        return self._class_attribute(repo, 'parent', Repository, self)
+
+    # Template URLS
+    #: Issue events URL Template. Expand with ``number``
+    issue_events_urlt = lazy_class_attribute(
+        'issue_events_url', URITemplate, bind=False
+    )
+
+    #: Assignees URL Template. Expand with ``user``
+    assignees_urlt = lazy_class_attribute(
+        'assignees_url', URITemplate, bind=False
+    )
+
+    #: Branches URL Template. Expand with ``branch``
+    branches_urlt = lazy_class_attribute(
+        'branches_url', URITemplate, bind=False
+    )
+
+    #: Blobs URL Template. Expand with ``sha``
+    blobs_urlt = lazy_class_attribute('blobs_url', URITemplate, bind=False)
+
+    #: Git tags URL Template. Expand with ``sha``
+    git_tags_urlt = lazy_class_attribute(
+        'git_tags_url', URITemplate, bind=False
+    )
+
+    #: Git refs URL Template. Expand with ``sha``
+    git_refs_urlt = lazy_class_attribute(
+        'git_refs_url', URITemplate, bind=False
+    )
+
+    #: Trres URL Template. Expand with ``sha``
+    trees_urlt = lazy_class_attribute('trees_url', URITemplate, bind=False)
+
+    #: Statuses URL Template. Expand with ``sha``
+    statuses_urlt = lazy_class_attribute(
+        'statuses_url', URITemplate, bind=False
+    )
+
+    #: Commits URL Template. Expand with ``sha``
+    commits_urlt = lazy_class_attribute('commits_url', URITemplate, bind=False)
+
+    #: Git commits URL Template. Expand with ``sha``
+    git_commits_urlt = lazy_class_attribute(
+        'git_commits_url', URITemplate, bind=False
+    )
+
+    #: Comments URL Template. Expand with ``number``
+    comments_urlt = lazy_class_attribute(
+        'comments_url', URITemplate, bind=False
+    )
+
+    #: Pull Request Review Comments URL
+    review_comments_url = lazy_class_attribute(
+        'review_comments_url', URITemplate, bind=False
+    )
+
+    #: Pull Request Review Comments URL Template. Expand with ``number``
+    review_comment_urlt = lazy_class_attribute(
+        'review_comment_url', URITemplate, bind=False
+    )
+
+    #: Issue comment URL Template. Expand with ``number``
+    issue_comment_urlt = lazy_class_attribute(
+        'issue_comment_url', URITemplate, bind=False
+    )
+
+    #: Contents URL Template. Expand with ``path``
+    contents_urlt = lazy_class_attribute(
+        'contents_url', URITemplate, bind=False
+    )
+
+    #: Comparison URL Template. Expand with ``base`` and ``head``
+    compare_urlt = lazy_class_attribute('compare_url', URITemplate, bind=False)
+
+    #: Archive URL Template. Expand with ``archive_format`` and ``ref``
+    archive_urlt = lazy_class_attribute('archive_url', URITemplate, bind=False)
+
+    #: Issues URL Template. Expand with ``number``
+    issues_urlt = lazy_class_attribute('issues_url', URITemplate, bind=False)
+
+    #: Pull Requests URL Template. Expand with ``number``
+    pulls_urlt = lazy_class_attribute('pulls_url', URITemplate, bind=False)
+
+    #: Milestones URL Template. Expand with ``number``
+    milestones_urlt = lazy_class_attribute(
+        'milestones_url', URITemplate, bind=False
+    )
+
+    #: Notifications URL Template. Expand with ``since``, ``all``,
+    #: ``participating``
+    notifications_urlt = lazy_class_attribute(
+        'notifications_url', URITemplate, bind=False
+    )
+
+    #: Labels URL Template. Expand with ``name``
+    labels_urlt = lazy_class_attribute('labels_url', URITemplate, bind=False)
+
     def _update_attributes(self, repo):
+        self._reset_lazy_attributes(repo)
         self._api = self._get_attribute(repo, 'url')
 
         #: URL used to clone via HTTPS.
         self.clone_url = self._get_attribute(repo, 'clone_url')
-        #: ``datetime`` object representing when the Repository was created.
-        self.created_at = self._strptime_attribute(repo, 'created_at')
         #: Description of the repository.
         self.description = self._get_attribute(repo, 'description')
 
@@ -119,13 +254,6 @@ class Repository(GitHubCore):
         #: Language property.
         self.language = self._get_attribute(repo, 'language')
 
-        # License containing only key, name, url & featured
-        #: :class:`License <github3.licenses.License>` object representing the
-        #: repository license.
-        self.original_license = self._class_attribute(
-            repo, 'license', License, self
-        )
-
         #: Mirror property.
         self.mirror_url = self._get_attribute(repo, 'mirror_url')
 
@@ -139,21 +267,12 @@ class Repository(GitHubCore):
         #: Number of open issues on the repository
         self.open_issues_count = self._get_attribute(repo, 'open_issues_count')
 
-        # Repository owner's name
-        #: :class:`User <github3.users.User>` object representing the
-        #: repository owner.
-        self.owner = self._class_attribute(
-            repo, 'owner', users.ShortUser, self)
-
         #: Is this repository private?
         self.private = self._get_attribute(repo, 'private')
 
         #: Permissions for this repository
         self.permissions = self._get_attribute(repo, 'permissions')
 
-        #: ``datetime`` object representing the last time commits were pushed
-        #: to the repository.
-        self.pushed_at = self._strptime_attribute(repo, 'pushed_at')
         #: Size of the repository.
         self.size = self._get_attribute(repo, 'size')
 
@@ -161,28 +280,16 @@ class Repository(GitHubCore):
         #: Number of users who starred the repository
         self.stargazers_count = self._get_attribute(repo, 'stargazers_count')
 
-        #: ``datetime`` object representing when the repository was starred
-        self.starred_at = self._strptime_attribute(repo, 'starred_at')
-
         # SSH url e.g. git@github.com/sigmavirus24/github3.py
         #: URL to clone the repository via SSH.
         self.ssh_url = self._get_attribute(repo, 'ssh_url')
         #: If it exists, url to clone the repository via SVN.
         self.svn_url = self._get_attribute(repo, 'svn_url')
-        #: ``datetime`` object representing the last time the repository was
-        #: updated.
-        self.updated_at = self._strptime_attribute(repo, 'updated_at')
 
         # The number of watchers
         #: Number of users watching the repository.
         self.watchers = self._get_attribute(repo, 'watchers')
 
-        #: Parent of this fork, if it exists :class:`Repository`
-        self.source = self._class_attribute(repo, 'source', Repository, self)
-
-        #: Parent of this fork, if it exists :class:`Repository`
-        self.parent = self._class_attribute(repo, 'parent', Repository, self)
-
         #: default branch for the repository
         self.default_branch = self._get_attribute(repo, 'default_branch')
 
@@ -222,162 +329,6 @@ class Repository(GitHubCore):
         #: Downloads url (not a template)
         self.download_url = self._get_attribute(repo, 'downloads_url')
 
-        # Template URLS
-        #: Issue events URL Template. Expand with ``number``
-        self.issue_events_urlt = self._class_attribute(
-            repo,
-            'issue_events_url',
-            URITemplate
-        )
-
-        #: Assignees URL Template. Expand with ``user``
-        self.assignees_urlt = self._class_attribute(
-            repo,
-            'assignees_url',
-            URITemplate
-        )
-
-        #: Branches URL Template. Expand with ``branch``
-        self.branches_urlt = self._class_attribute(
-            repo,
-            'branches_url',
-            URITemplate
-        )
-
-        #: Blobs URL Template. Expand with ``sha``
-        self.blobs_urlt = self._class_attribute(
-            repo,
-            'blobs_url',
-            URITemplate
-        )
-
-        #: Git tags URL Template. Expand with ``sha``
-        self.git_tags_urlt = self._class_attribute(
-            repo,
-            'git_tags_url',
-            URITemplate
-        )
-
-        #: Git refs URL Template. Expand with ``sha``
-        self.git_refs_urlt = self._class_attribute(
-            repo,
-            'git_refs_url',
-            URITemplate
-        )
-
-        #: Trres URL Template. Expand with ``sha``
-        self.trees_urlt = self._class_attribute(
-            repo,
-            'trees_url',
-            URITemplate
-        )
-
-        #: Statuses URL Template. Expand with ``sha``
-        self.statuses_urlt = self._class_attribute(
-            repo,
-            'statuses_url',
-            URITemplate
-        )
-
-        #: Commits URL Template. Expand with ``sha``
-        self.commits_urlt = self._class_attribute(
-            repo,
-            'commits_url',
-            URITemplate
-        )
-
-        #: Git commits URL Template. Expand with ``sha``
-        self.git_commits_urlt = self._class_attribute(
-            repo,
-            'git_commits_url',
-            URITemplate
-        )
-
-        #: Comments URL Template. Expand with ``number``
-        self.comments_urlt = self._class_attribute(
-            repo,
-            'comments_url',
-            URITemplate
-        )
-
-        #: Pull Request Review Comments URL
-        self.review_comments_url = self._class_attribute(
-            repo,
-            'review_comments_url',
-            URITemplate
-        )
-
-        #: Pull Request Review Comments URL Template. Expand with ``number``
-        self.issue_events_urlt = self._class_attribute(
-            repo,
-            'review_comment_url',
-            URITemplate
-        )
-
-        #: Issue comment URL Template. Expand with ``number``
-        self.issue_comment_urlt = self._class_attribute(
-            repo,
-            'issue_comment_url',
-            URITemplate
-        )
-
-        #: Contents URL Template. Expand with ``path``
-        self.contents_urlt = self._class_attribute(
-            repo,
-            'contents_url',
-            URITemplate
-        )
-
-        #: Comparison URL Template. Expand with ``base`` and ``head``
-        self.compare_urlt = self._class_attribute(
-            repo,
-            'compare_url',
-            URITemplate
-        )
-
-        #: Archive URL Template. Expand with ``archive_format`` and ``ref``
-        self.archive_urlt = self._class_attribute(
-            repo,
-            'archive_url',
-            URITemplate
-        )
-
-        #: Issues URL Template. Expand with ``number``
-        self.issues_urlt = self._class_attribute(
-            repo,
-            'issues_url',
-            URITemplate
-        )
-
-        #: Pull Requests URL Template. Expand with ``number``
-        self.pulls_urlt = self._class_attribute(
-            repo,
-            'pulls_url',
-            URITemplate
-        )
-
-        #: Milestones URL Template. Expand with ``number``
-        self.milestones_urlt = self._class_attribute(
-            repo,
-            'milestones_url',
-            URITemplate
-        )
-
-        #: Notifications URL Template. Expand with ``since``, ``all``,
-        #: ``participating``
-        self.notifications_urlt = self._class_attribute(
-            repo,
-            'notifications_url',
-            URITemplate
-        )
-
-        #: Labels URL Template. Expand with ``name``
-        self.labels_urlt = self._class_attribute(
-            repo,
-            'labels_url',
-            URITemplate
-        )
-
     def _repr(self):
         return '<Repository [{0}]>'.format(self)
 
@@ -558,7 +509,7 @@ class Repository(GitHubCore):
         :returns: :class:`RepoCommit <github3.repos.commit.RepoCommit>` if
             successful, otherwise None
         """
-        url = self._build_url('commits', sha, base_url=self._api)
+        url = self._build_route(_commit_route, sha=sha, base_url=self._api)
         json = self._json(self._get(url), 200)
         return self._instance_or_null(RepoCommit, json)
 
@@ -822,7 +773,7 @@ class Repository(GitHubCore):
                     'committer': validate_commmitter(committer),
                     'author': validate_commmitter(author)}
             self._remove_none(data)
-            json = self._json(self._put(url, data=dumps(data)), 201)
+            json = self._json(self._put(url, data=self._dumps(data)), 201)
             if json and 'content' in json and 'commit' in json:
                 json['content'] = Contents(json['content'], self)
                 json['commit'] = Commit(json['commit'], self)
@@ -1250,7 +1201,9 @@ class Repository(GitHubCore):
         self._remove_none(edit)
         json = None
         if edit:
-            json = self._json(self._patch(self._api, data=dumps(edit)), 200)
+            json = self._json(
+                self._patch(self._api, data=self._dumps(edit)), 200
+            )
             self._update_attributes(json)
             return True
         return False
@@ -1349,7 +1302,9 @@ class Repository(GitHubCore):
         :returns: :class:`Subscription <github3.notifications.Subscription>`
         """
         url = self._build_url('subscription', base_url=self._api)
-        json = self._json(self._put(url, data=dumps({'ignored': True})), 200)
+        json = self._json(
+            self._put(url, data=self._dumps({'ignored': True})), 200
+        )
         return self._instance_or_null(Subscription, json)
 
     @requires_auth
@@ -1473,7 +1428,8 @@ class Repository(GitHubCore):
         """
         json = None
         if int(number) > 0:
-            url = self._build_url('issues', str(number), base_url=self._api)
+            url = self._build_route(_issue_route, number=number,
+                                    base_url=self._api)
             json = self._json(self._get(url), 200)
         return self._instance_or_null(Issue, json)
 
@@ -1634,8 +1590,10 @@ class Repository(GitHubCore):
         mark = {'read': True}
         if last_read:
             mark['last_read_at'] = last_read
-        return self._boolean(self._put(url, data=dumps(mark)),
-                             205, 404)
+        response = self._put(url, data=self._dumps(mark))
+        # GitHub answers 202 when it marks the notifications asynchronously
+        return (self._boolean(response, 205, 404) or
+                self._boolean(response, 202, 404))
 
     @requires_auth
     def merge(self, base, head, message=''):
@@ -1695,6 +1653,30 @@ class Repository(GitHubCore):
             params = None
         return self._iter(int(number), url, Milestone, params, etag)
 
+    def mirror(self, destination, ref=None, patterns=None,
+               workers=DEFAULT_WORKERS, delete=False):
+        """Write the files of a tree of this repository to a directory.
+
+        Only the files whose contents differ from the ones on disk are
+        downloaded. To keep a directory up to date, call :meth:`TreeMirror.sync
+        <github3.mirror.TreeMirror.sync>` on the same mirror instead, so that
+        unchanged local files are not hashed again.
+
+        :param str destination: (required), directory the files are written
+            to
+        :param str ref: (optional), SHA of a tree or commit, or name of a
+            branch or tag. Default: the default branch
+        :param list patterns: (optional), glob patterns of the paths to
+            mirror, e.g., ``['config/*']``. Default: every path
+        :param int workers: (optional), number of files downloaded at once,
+            default: 10
+        :param bool delete: (optional), remove the local files matching
+            ``patterns`` that are not in the tree, default: False
+        :returns: :class:`MirrorReport <github3.mirror.MirrorReport>`
+        """
+        mirror = TreeMirror(self, destination, patterns, workers, delete)
+        return mirror.sync(ref)
+
     def network_events(self, number=-1, etag=None):
         r"""Iterate over events on a network of repositories.
 
@@ -1762,7 +1744,8 @@ class Repository(GitHubCore):
         """
         json = None
         if int(number) > 0:
-            url = self._build_url('pulls', str(number), base_url=self._api)
+            url = self._build_route(_pull_request_route, number=number,
+                                    base_url=self._api)
             json = self._json(self._get(url), 200)
         return self._instance_or_null(PullRequest, json)
 
@@ -1950,8 +1933,9 @@ class Repository(GitHubCore):
         :returns: :class:`Subscription <github3.notifications.Subscription>`
         """
         url = self._build_url('subscription', base_url=self._api)
-        json = self._json(self._put(url, data=dumps({'subcribed': True})),
-                          200)
+        json = self._json(
+            self._put(url, data=self._dumps({'subcribed': True})), 200
+        )
         return self._instance_or_null(Subscription, json)
 
     def subscribers(self, number=-1, etag=None):
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+github3.retry
+=============
+
+This module provides the retry engine that can be attached to a
+:class:`GitHubSession <github3.session.GitHubSession>`. It retries transient
+failures (``502``, ``503`` and ``504`` responses, secondary rate limits and
+connection resets) with jittered exponential backoff so that a long crawl
+does not die on a single hiccup.
+
+"""
+import calendar
+import random
+import re
+import threading
+import time
+
+from email.utils import parsedate_tz, mktime_tz
+
+import requests
+from requests.compat import urlparse
+
+#: Methods that may safely be sent more than once
+IDEMPOTENT_METHODS = frozenset(['DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT'])
+
+
+def retry_after(response):
+    """Return the number of seconds GitHub asked us to wait, if any.
+
+    :param response: a response from GitHub
+    :returns: seconds or None if there is no valid ``Retry-After`` header
+    :rtype: float
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+    return max(mktime_tz(date) - calendar.timegm(time.gmtime()), 0)
+
+
+def _discard(response):
+    """Release the connection of a response that is retried.
+
+    Streamed responses keep their connection checked out of the pool until
+    they are closed.
+    """
+    if getattr(response, 'raw', None) is not None:
+        response.close()
+
+
+class RetryPolicy(object):
+
+    """Describe which failures are retried and how long to wait between tries.
+
+    :param int total: (optional), maximum number of retries, default: 3
+    :param float backoff_factor: (optional), base of the exponential backoff
+        in seconds, default: 0.5
+    :param float backoff_max: (optional), longest backoff in seconds,
+        default: 60
+    :param status_codes: (optional), status codes retried for idempotent
+        methods, default: ``(502, 503, 504)``
+    :param methods: (optional), methods considered idempotent, default:
+        :data:`IDEMPOTENT_METHODS`
+    :param bool secondary_rate_limits: (optional), retry ``403`` and ``429``
+        responses that carry a ``Retry-After`` header, default: True
+    :param bool jitter: (optional), randomize backoffs so that concurrent
+        clients do not retry in lockstep, default: True
+    """
+
+    def __init__(self, total=3, backoff_factor=0.5, backoff_max=60,
+                 status_codes=(502, 503, 504), methods=IDEMPOTENT_METHODS,
+                 secondary_rate_limits=True, jitter=True):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.secondary_rate_limits = secondary_rate_limits
+        self.jitter = jitter
+
+    def response_reason(self, method, response):
+        """Return why ``response`` should be retried or None.
+
+        :returns: ``'secondary_rate_limit'``, the status code as a string or
+            None
+        """
+        status_code = response.status_code
+        if (self.secondary_rate_limits and status_code in (403, 429) and
+                retry_after(response) is not None):
+            # The request was refused outright so any method may be resent
+            return 'secondary_rate_limit'
+        if (status_code in self.status_codes and
+                method.upper() in self.methods):
+            return str(status_code)
+        return None
+
+    def error_reason(self, method, exc):
+        """Return why the exception ``exc`` should be retried or None."""
+        if method.upper() not in self.methods:
+            return None
+        if isinstance(exc, requests.exceptions.Timeout):
+            return 'timeout'
+        if isinstance(exc, requests.exceptions.ConnectionError):
+            return 'connection'
+        return None
+
+    def delay(self, attempt, response=None):
+        """Return the number of seconds to wait before retry ``attempt``.
+
+        A ``Retry-After`` header always wins over the computed backoff.
+        """
+        if response is not None:
+            seconds = retry_after(response)
+            if seconds is not None:
+                return seconds
+        backoff = min(self.backoff_max, self.backoff_factor * 2 ** attempt)
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+
+class RetryStats(object):
+
+    """Counters describing the work done by a :class:`RetryEngine`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        #: Number of requests that went through the engine
+        self.requests = 0
+        #: Number of retries made
+        self.retries = 0
+        #: Number of requests that still failed after the last retry
+        self.exhausted = 0
+        #: Number of retries made for each reason
+        self.reasons = {}
+
+    def _record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def _record_retry(self, reason):
+        with self._lock:
+            self.retries += 1
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def _record_exhausted(self):
+        with self._lock:
+            self.exhausted += 1
+
+    def as_dict(self):
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return {'requests': self.requests, 'retries': self.retries,
+                    'exhausted': self.exhausted,
+                    'reasons': dict(self.reasons)}
+
+
+class RetryEngine(object):
+
+    """Retry requests according to a :class:`RetryPolicy`.
+
+    Engines are attached to a session as ``session.retry``::
+
+        from github3.retry import RetryEngine, RetryPolicy
+
+        gh.session.retry = RetryEngine(RetryPolicy(total=5))
+        # The statistics endpoints are slow to compute, be more patient
+        gh.session.retry.override(r'/stats/', RetryPolicy(total=10))
+
+    :param policy: (optional), the default :class:`RetryPolicy`
+    """
+
+    def __init__(self, policy=None):
+        #: Policy used when no override matches
+        self.policy = policy or RetryPolicy()
+        #: :class:`RetryStats` for every request sent through this engine
+        self.stats = RetryStats()
+        self._overrides = []
+
+    def override(self, pattern, policy):
+        """Use ``policy`` for requests whose URL path matches ``pattern``.
+
+        Overrides are checked in the order they were added.
+
+        :param str pattern: regular expression searched for in the URL path
+        :param policy: the :class:`RetryPolicy` to use
+        """
+        self._overrides.append((re.compile(pattern), policy))
+
+    def policy_for(self, url):
+        """Return the :class:`RetryPolicy` that applies to ``url``."""
+        path = urlparse(url).path
+        for pattern, policy in self._overrides:
+            if pattern.search(path):
+                return policy
+        return self.policy
+
+    def send(self, method, url, send):
+        """Call ``send`` until it succeeds or the policy gives up.
+
+        :param str method: HTTP method of the request
+        :param str url: URL of the request
+        :param send: callable sending the request and returning the response
+        :returns: the last response received. It has a ``retries`` attribute
+            holding the number of retries it took.
+        """
+        policy = self.policy_for(url)
+        self.stats._record_request()
+        attempt = 0
+        while True:
+            try:
+                response = send()
+            except requests.exceptions.RequestException as exc:
+                reason = policy.error_reason(method, exc)
+                if reason is None:
+                    raise
+                if attempt >= policy.total:
+                    self.stats._record_exhausted()
+                    raise
+                delay = policy.delay(attempt)
+            else:
+                reason = policy.response_reason(method, response)
+                if reason is None:
+                    response.retries = attempt
+                    return response
+                if attempt >= policy.total:
+                    self.stats._record_exhausted()
+                    response.retries = attempt
+                    return response
+                delay = policy.delay(attempt, response)
+                _discard(response)
+
+            self.stats._record_retry(reason)
+            attempt += 1
+            time.sleep(delay)
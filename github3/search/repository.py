@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+from ..compact import CompactRepositorySearchResult
 from ..models import GitHubCore
 from ..repos import Repository
 
 
 class RepositorySearchResult(GitHubCore):
+    _compact_class = CompactRepositorySearchResult
+
     def _update_attributes(self, data):
         result = data.copy()
 
@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
 import requests
+import threading
+import time
 
-from collections import Callable
+from collections import Callable, OrderedDict
 from . import __version__
+from .cache import CacheEntry, cache_key
+from .metrics import RequestEvent
+from .ratelimit import (RateLimitTracker, TokenPool, is_exhausted,
+                        resource_for)
 from logging import getLogger
 from contextlib import contextmanager
 
-__url_cache__ = {}
 __logs__ = getLogger(__package__)
 
 
@@ -17,9 +22,90 @@ def requires_2fa(response):
     return False
 
 
+class URLCache(object):
+
+    """A size-bounded, least recently used cache of built URLs.
+
+    Every :class:`GitHubSession` has its own cache as ``session.url_cache``.
+    Once ``maxsize`` URLs are stored, the least recently used one is evicted.
+
+    :param int maxsize: (optional), maximum number of URLs kept, default:
+        1024
+    """
+
+    def __init__(self, maxsize=1024):
+        #: Maximum number of URLs kept
+        self.maxsize = maxsize
+        #: Number of lookups answered from the cache
+        self.hits = 0
+        #: Number of lookups that had to build the URL
+        self.misses = 0
+        self._urls = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._urls)
+
+    def __contains__(self, key):
+        return key in self._urls
+
+    def get(self, key, build):
+        """Return the URL stored for ``key``, calling ``build`` on a miss."""
+        with self._lock:
+            url = self._urls.pop(key, None)
+            if url is not None:
+                self.hits += 1
+                self._urls[key] = url
+                return url
+            self.misses += 1
+
+        url = build()
+        with self._lock:
+            self._urls[key] = url
+            while len(self._urls) > self.maxsize:
+                self._urls.popitem(last=False)
+        return url
+
+    def clear(self):
+        with self._lock:
+            self._urls.clear()
+            self.hits = self.misses = 0
+
+
+class Route(object):
+
+    """A URL template that is compiled once and expanded on every call.
+
+    Routes are meant for endpoints requested with many different values, such
+    as single issues or commits, which would otherwise flood the
+    :class:`URLCache`::
+
+        ISSUE = Route('repos/{owner}/{repo}/issues/{number}')
+        url = session.build_route(ISSUE, owner='sigmavirus24',
+                                  repo='github3.py', number=1)
+
+    :param str template: path relative to the base URL with ``str.format``
+        style placeholders
+    """
+
+    def __init__(self, template):
+        #: The template this route was compiled from
+        self.template = template
+        self._expand = ('{0}/' + template).format
+
+    def __repr__(self):
+        return '<Route [{0}]>'.format(self.template)
+
+    def expand(self, base_url, **params):
+        """Return the URL for ``params`` relative to ``base_url``."""
+        return self._expand(base_url, **params)
+
+
 class GitHubSession(requests.Session):
     auth = None
-    __attrs__ = requests.Session.__attrs__ + ['base_url', 'two_factor_auth_cb']
+    __attrs__ = requests.Session.__attrs__ + [
+        'base_url', 'two_factor_auth_cb', 'request_counter', 'token_pool'
+    ]
 
     def __init__(self):
         super(GitHubSession, self).__init__()
@@ -36,6 +122,44 @@ class GitHubSession(requests.Session):
         self.base_url = 'https://api.github.com'
         self.two_factor_auth_cb = None
         self.request_counter = 0
+        self._init_extensions()
+
+    def __setstate__(self, state):
+        # Caches, rate limit state, retries, codecs and hooks hold locks,
+        # connections or callables and are not pickled; unpickled sessions
+        # start with the defaults
+        self._init_extensions()
+        super(GitHubSession, self).__setstate__(state)
+
+    def _init_extensions(self):
+        #: :class:`URLCache` used by :meth:`build_url`
+        self.url_cache = URLCache()
+        #: Optional response cache, e.g. :class:`SQLiteCache
+        #: <github3.cache.SQLiteCache>`. When set, ``GET`` requests are made
+        #: conditional automatically and ``304`` responses are answered from
+        #: the cache.
+        self.cache = None
+        #: :class:`RateLimitTracker <github3.ratelimit.RateLimitTracker>`
+        #: updated from the headers of every response
+        self.rate_limits = RateLimitTracker()
+        #: Optional :class:`RateLimitPolicy
+        #: <github3.ratelimit.RateLimitPolicy>` consulted before every
+        #: request
+        self.rate_limit_policy = None
+        #: :class:`TokenPool <github3.ratelimit.TokenPool>` set by
+        #: :meth:`token_pool_auth`
+        self.token_pool = None
+        #: Optional :class:`RetryEngine <github3.retry.RetryEngine>` used to
+        #: retry transient failures
+        self.retry = None
+        #: Optional :class:`JSONCodec <github3.codec.JSONCodec>` used by
+        #: models to decode responses and encode request bodies. When None,
+        #: requests and the standard library's :mod:`json` are used.
+        self.codec = None
+        #: Callables receiving a :class:`RequestEvent
+        #: <github3.metrics.RequestEvent>` after every request, e.g., a
+        #: :class:`RequestStats <github3.metrics.RequestStats>`
+        self.request_hooks = []
 
     def basic_auth(self, username, password):
         """Set the Basic Auth credentials on this Session.
@@ -50,18 +174,28 @@ class GitHubSession(requests.Session):
 
         # Disable token authentication
         self.headers.pop('Authorization', None)
+        self.token_pool = None
 
     def build_url(self, *args, **kwargs):
         """Builds a new API url from scratch."""
-        parts = [kwargs.get('base_url') or self.base_url]
-        parts.extend(args)
-        parts = [str(p) for p in parts]
-        key = tuple(parts)
-        __logs__.info('Building a url from %s', key)
-        if key not in __url_cache__:
-            __logs__.info('Missed the cache building the url')
-            __url_cache__[key] = '/'.join(parts)
-        return __url_cache__[key]
+        base_url = kwargs.get('base_url') or self.base_url
+        key = (base_url, args)
+
+        def build():
+            __logs__.debug('Missed the cache building a url from %s', key)
+            return '/'.join([str(p) for p in (base_url,) + args])
+
+        return self.url_cache.get(key, build)
+
+    def build_route(self, route, base_url=None, **params):
+        """Expand a precompiled :class:`Route` into a URL.
+
+        :param route: the :class:`Route` to expand
+        :param str base_url: (optional), URL the route is relative to,
+            defaults to the session's base URL
+        :returns: str
+        """
+        return route.expand(base_url or self.base_url, **params)
 
     def handle_two_factor_auth(self, args, kwargs):
         headers = kwargs.pop('headers', {})
@@ -72,7 +206,8 @@ class GitHubSession(requests.Session):
         return super(GitHubSession, self).request(*args, **kwargs)
 
     def has_auth(self):
-        return (self.auth or self.headers.get('Authorization'))
+        return (self.auth or self.headers.get('Authorization') or
+                self.token_pool)
 
     def oauth2_auth(self, client_id, client_secret):
         """Use OAuth2 for authentication.
@@ -84,9 +219,58 @@ class GitHubSession(requests.Session):
         """
         raise NotImplementedError('These features are not implemented yet')
 
-    def request(self, *args, **kwargs):
-        response = super(GitHubSession, self).request(*args, **kwargs)
-        self.request_counter += 1
+    def request(self, method, url, *args, **kwargs):
+        if not self.request_hooks:
+            return self._request(method, url, *args, **kwargs)
+
+        start = time.time()
+        try:
+            response = self._request(method, url, *args, **kwargs)
+        except Exception as exc:
+            self._emit(RequestEvent(method, url, elapsed=time.time() - start,
+                                    exception=exc))
+            raise
+        self._emit(RequestEvent(method, url, response, time.time() - start,
+                                stream=kwargs.get('stream', False)))
+        return response
+
+    def _emit(self, event):
+        for hook in self.request_hooks:
+            try:
+                hook(event)
+            except Exception:
+                __logs__.exception('Request hook %r failed', hook)
+
+    def _request(self, method, url, *args, **kwargs):
+        resource = resource_for(url)
+        args = (method, url) + args
+        tried = set()
+        while True:
+            tracker = self.rate_limits
+            if self.token_pool is not None:
+                token = self.token_pool.acquire(resource, tried)
+                tried.add(token)
+                tracker = self.token_pool.tracker(token)
+                headers = dict(kwargs.get('headers') or {})
+                headers['Authorization'] = 'token {0}'.format(token)
+                kwargs['headers'] = headers
+
+            if self.rate_limit_policy is not None:
+                self.rate_limit_policy.wait(tracker, resource)
+            tracker.consume(resource)
+
+            response = self._send_with_retries(args, kwargs)
+            self.request_counter += 1
+            tracker.update(response, resource)
+            if tracker is not self.rate_limits:
+                self.rate_limits.update(response, resource)
+
+            if not (self.token_pool is not None and is_exhausted(response) and
+                    len(tried) < len(self.token_pool)):
+                break
+            __logs__.info('Token exhausted its %s budget, failing over',
+                          resource)
+
         if requires_2fa(response) and self.two_factor_auth_cb:
             # No need to flatten and re-collect the args in
             # handle_two_factor_auth
@@ -95,6 +279,50 @@ class GitHubSession(requests.Session):
             response = new_response
         return response
 
+    def send(self, request, **kwargs):
+        cache = self.cache
+        if (cache is None or request.method != 'GET' or
+                kwargs.get('stream') or
+                'If-None-Match' in request.headers or
+                'If-Modified-Since' in request.headers):
+            # Requests made conditional by the caller expect to see the 304
+            return super(GitHubSession, self).send(request, **kwargs)
+
+        key = cache_key(request)
+        entry = cache.get(key)
+        if entry is not None:
+            request.headers.update(entry.conditional_headers())
+
+        response = super(GitHubSession, self).send(request, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            __logs__.debug('Serving %s from the cache', request.url)
+            response = entry.to_response(response)
+        elif response.status_code == 200 and (
+                response.headers.get('ETag') or
+                response.headers.get('Last-Modified')):
+            cache.set(key, CacheEntry.from_response(response))
+        return response
+
+    def use_transport(self, adapter):
+        """Send every request through ``adapter``.
+
+        :param adapter: a :mod:`requests` transport adapter, e.g., one
+            created by :func:`transport_for
+            <github3.transport.transport_for>`
+        """
+        for prefix in ('https://', 'http://'):
+            old = self.adapters.get(prefix)
+            self.mount(prefix, adapter)
+            if old is not None and old is not adapter:
+                old.close()
+
+    def _send_with_retries(self, args, kwargs):
+        send = super(GitHubSession, self).request
+        if self.retry is None:
+            return send(*args, **kwargs)
+        return self.retry.send(args[0], args[1],
+                               lambda: send(*args, **kwargs))
+
     def retrieve_client_credentials(self):
         """Return the client credentials.
 
@@ -127,16 +355,39 @@ class GitHubSession(requests.Session):
             })
         # Unset username/password so we stop sending them
         self.auth = None
+        self.token_pool = None
+
+    def token_pool_auth(self, tokens):
+        """Use a pool of application tokens for authentication.
+
+        Each request is made with the token that has the most requests left
+        against the relevant rate limit, as reported by GitHub's response
+        headers. When a token's budget runs out, the request is retried with
+        the next one.
+
+        :param tokens: Application tokens retrieved from GitHub's
+            /authorizations endpoint
+        :type tokens: list of str
+        """
+        if not tokens:
+            return
+
+        self.token_pool = TokenPool(tokens)
+        # Unset the other credentials so we stop sending them
+        self.headers.pop('Authorization', None)
+        self.auth = None
 
     @contextmanager
     def temporary_basic_auth(self, *auth):
         old_basic_auth = self.auth
         old_token_auth = self.headers.get('Authorization')
+        old_token_pool = self.token_pool
 
         self.basic_auth(*auth)
         yield
 
         self.auth = old_basic_auth
+        self.token_pool = old_token_pool
         if old_token_auth:
             self.headers['Authorization'] = old_token_auth
 
@@ -145,9 +396,11 @@ class GitHubSession(requests.Session):
         """Unset authentication temporarily as a context manager."""
         old_basic_auth, self.auth = self.auth, None
         old_token_auth = self.headers.pop('Authorization', None)
+        old_token_pool, self.token_pool = self.token_pool, None
 
         yield
 
         self.auth = old_basic_auth
+        self.token_pool = old_token_pool
         if old_token_auth:
             self.headers['Authorization'] = old_token_auth
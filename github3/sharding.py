@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+github3.sharding
+================
+
+This module retrieves complete result sets from the search API, which never
+returns more than 1000 results for a query. A query matching more is split
+along a range qualifier, e.g., ``created:`` or ``stars:``, into shards that
+each match at most 1000 results. Shards are searched concurrently and paced
+to stay within the search rate limit::
+
+    from github3.sharding import ShardedSearch
+
+    search = ShardedSearch(gh, 'issues', 'org:github is:issue')
+    for result in search:
+        print(result.issue.html_url)
+
+"""
+import datetime
+import math
+import re
+
+from concurrent import futures
+from logging import getLogger
+
+from .ratelimit import PacingPolicy
+from .search import (CodeSearchResult, IssueSearchResult,
+                     RepositorySearchResult, UserSearchResult)
+
+__logs__ = getLogger(__package__)
+
+#: Most results GitHub returns for a single query
+RESULT_CAP = 1000
+
+#: Default number of shards searched at once
+DEFAULT_WORKERS = 4
+
+#: Most shards a shard is split into at once
+MAX_PARTS = 64
+
+#: Earliest time searched when a date range has no lower bound
+EPOCH = datetime.datetime(2007, 10, 1)
+
+#: Qualifiers whose values are dates
+DATE_QUALIFIERS = ('closed', 'created', 'merged', 'pushed', 'updated')
+
+#: Qualifiers whose values are numbers
+NUMBER_QUALIFIERS = ('comments', 'followers', 'forks', 'repos', 'size',
+                     'stars')
+
+#: Result class and default qualifier to shard on, by kind of search
+KINDS = {
+    'code': (CodeSearchResult, 'size'),
+    'issues': (IssueSearchResult, 'created'),
+    'repositories': (RepositorySearchResult, 'created'),
+    'users': (UserSearchResult, 'created'),
+}
+
+SECOND = datetime.timedelta(seconds=1)
+DAY = datetime.timedelta(days=1)
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+class Shard(object):
+
+    """A range of values of one qualifier.
+
+    Both ends of the range are included. Dates are handled to the second;
+    a number range without an upper bound is open-ended.
+    """
+
+    def __init__(self, qualifier, low, high):
+        #: The qualifier, e.g., ``'created'``
+        self.qualifier = qualifier
+        #: Lowest value, a :class:`datetime.datetime` or an int
+        self.low = low
+        #: Highest value, None if the range is open-ended
+        self.high = high
+        #: Number of results GitHub reported, None until searched
+        self.total_count = None
+
+    def __str__(self):
+        return '{0}:{1}..{2}'.format(self.qualifier, _format(self.low),
+                                     _format(self.high))
+
+    def __repr__(self):
+        return '<Shard [{0}]>'.format(self)
+
+    def split(self, parts=2):
+        """Split the range into up to ``parts`` adjacent shards.
+
+        :returns: list of :class:`Shard`, empty if the range is a single
+            value
+        """
+        low, high = self.low, self.high
+        if high is None:
+            # Counts are usually skewed towards small values, so open ranges
+            # are split geometrically
+            middle = 2 * low + 1
+            return [Shard(self.qualifier, low, middle),
+                    Shard(self.qualifier, middle + 1, None)]
+
+        if isinstance(low, datetime.datetime):
+            span = int(_seconds(high - low)) + 1
+            step = SECOND
+        else:
+            span = high - low + 1
+            step = 1
+        parts = min(parts, span)
+        if parts < 2:
+            return []
+        shards = []
+        for i in range(parts):
+            start = low + step * (span * i // parts)
+            end = low + step * (span * (i + 1) // parts - 1)
+            shards.append(Shard(self.qualifier, start, end))
+        return shards
+
+
+class ShardedSearch(object):
+
+    """All the results of a search, however many there are.
+
+    The query is first searched as is. Whenever a query matches more than
+    :data:`RESULT_CAP` results, it is split along ``qualifier`` into shards
+    expected to match about half that many each, which are searched in
+    turn. Pages are fetched by a pool of ``workers`` threads. When the
+    session has no :attr:`rate_limit_policy
+    <github3.session.GitHubSession.rate_limit_policy>`, requests are spread
+    evenly over the search rate limit window.
+
+    Results are yielded as they arrive, not in the order GitHub sorts them.
+    A result listed by several shards, e.g., because it changed while the
+    search ran, is only yielded once.
+
+    :param github: the :class:`GitHub <github3.github.GitHub>` instance
+        whose session sends the requests
+    :param str kind: what to search, ``code``, ``issues``,
+        ``repositories`` or ``users``
+    :param str query: the query, as accepted by the ``search_*`` methods of
+        :class:`GitHub <github3.github.GitHub>`
+    :param str qualifier: (optional), qualifier to split the query along,
+        one of :data:`DATE_QUALIFIERS` or :data:`NUMBER_QUALIFIERS`. When
+        the query already restricts it, only that range is searched.
+        Default: ``size`` for code and ``created`` otherwise
+    :param int workers: (optional), number of requests sent at once,
+        default: 4
+    :param int per_page: (optional), number of results per page, at most
+        100, default: 100
+    :param bool text_match: (optional), if True, return matching search
+        terms
+    """
+
+    def __init__(self, github, kind, query, qualifier=None,
+                 workers=DEFAULT_WORKERS, per_page=100, text_match=False):
+        if kind not in KINDS:
+            raise ValueError('Cannot search {0!r}'.format(kind))
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+        self.github = github
+        self.kind = kind
+        self.workers = workers
+        self.per_page = per_page
+        self._cls, default = KINDS[kind]
+        #: The qualifier the query is split along
+        self.qualifier = qualifier or default
+        #: The query without the range of :attr:`qualifier`
+        self.query, self.root = _root_shard(query, self.qualifier)
+        self.url = github._build_url('search', kind)
+        self.headers = {}
+        if text_match:
+            self.headers['Accept'] = (
+                'application/vnd.github.v3.full.text-match+json'
+            )
+        #: Total count GitHub reported for the whole query
+        self.total_count = None
+        #: The :class:`Shard` objects whose results were retrieved
+        self.shards = []
+        #: Shards matching more than :data:`RESULT_CAP` results that could
+        #: not be split further; only part of their results were retrieved
+        self.truncated = []
+        #: Shards for which GitHub reported incomplete results
+        self.incomplete = []
+        self._policy = PacingPolicy()
+
+    def __iter__(self):
+        return self._search()
+
+    def __repr__(self):
+        return '<ShardedSearch [{0}: {1}]>'.format(self.kind, self.query)
+
+    def _search(self):
+        self.shards, self.truncated, self.incomplete = [], [], []
+        executor = futures.ThreadPoolExecutor(max_workers=self.workers)
+        pending = set()
+        seen = set()
+
+        def submit(shard, url=None):
+            pending.add(executor.submit(self._page, shard, url))
+
+        try:
+            submit(self.root)
+            while pending:
+                done, _ = futures.wait(pending,
+                                       return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    shard, json, next_url, first = future.result()
+                    if first:
+                        shard.total_count = json.get('total_count', 0)
+                        if shard is self.root:
+                            self.total_count = shard.total_count
+                        if shard.total_count > RESULT_CAP:
+                            parts = int(math.ceil(
+                                2.0 * shard.total_count / RESULT_CAP
+                            ))
+                            shards = shard.split(min(parts, MAX_PARTS))
+                            if shards:
+                                for part in shards:
+                                    submit(part)
+                                continue
+                            __logs__.warning(
+                                'Only %d of the %d results of %s can be '
+                                'retrieved', RESULT_CAP, shard.total_count,
+                                shard
+                            )
+                            self.truncated.append(shard)
+                        self.shards.append(shard)
+                    if (json.get('incomplete_results') and
+                            shard not in self.incomplete):
+                        self.incomplete.append(shard)
+                    if next_url:
+                        submit(shard, next_url)
+                    for item in json.get('items') or []:
+                        key = item.get('url') or item.get('html_url')
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        yield self._cls(item, self.github)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _page(self, shard, url=None):
+        params = None
+        if url is None:
+            url = self.url
+            params = {'q': '{0} {1}'.format(self.query, shard).strip(),
+                      'per_page': self.per_page}
+        session = self.github.session
+        if getattr(session, 'rate_limit_policy', None) is None:
+            self._policy.wait(session.rate_limits, 'search')
+        response = self.github._get(url, params=params, headers=self.headers)
+        json = self.github._json(response, 200, include_cache_info=False)
+        next_url = response.links.get('next', {}).get('url')
+        return shard, json or {}, next_url, params is not None
+
+
+def _seconds(delta):
+    return delta.days * 86400 + delta.seconds
+
+
+def _format(value):
+    if value is None:
+        return '*'
+    if isinstance(value, datetime.datetime):
+        return value.strftime(TIMESTAMP_FORMAT)
+    return str(value)
+
+
+def _root_shard(query, qualifier):
+    """Take the range of ``qualifier`` out of ``query``."""
+    if qualifier in DATE_QUALIFIERS:
+        parse, low, high = _date_bounds, EPOCH, datetime.datetime.utcnow()
+        high = high.replace(microsecond=0)
+    elif qualifier in NUMBER_QUALIFIERS:
+        parse, low, high = _number_bounds, 0, None
+    else:
+        raise ValueError('Cannot split searches along {0!r}'.format(
+            qualifier
+        ))
+
+    pattern = re.compile(r'(^|\s)' + re.escape(qualifier) + r':(\S+)')
+    match = pattern.search(query)
+    if match is not None:
+        query = (query[:match.start()] + ' ' + query[match.end():]).strip()
+        value = match.group(2)
+        if '..' in value:
+            start, end = value.split('..', 1)
+            if start != '*':
+                low = parse(start)[0]
+            if end != '*':
+                high = parse(end)[1]
+        elif value.startswith('>='):
+            low = parse(value[2:])[0]
+        elif value.startswith('>'):
+            low = parse(value[1:])[1] + _step(low)
+        elif value.startswith('<='):
+            high = parse(value[2:])[1]
+        elif value.startswith('<'):
+            high = parse(value[1:])[0] - _step(low)
+        else:
+            low, high = parse(value)
+    return ' '.join(query.split()), Shard(qualifier, low, high)
+
+
+def _step(value):
+    return SECOND if isinstance(value, datetime.datetime) else 1
+
+
+def _date_bounds(value):
+    """Return the first and last second a date or timestamp stands for."""
+    try:
+        moment = datetime.datetime.strptime(value, TIMESTAMP_FORMAT)
+        return moment, moment
+    except ValueError:
+        day = datetime.datetime.strptime(value, '%Y-%m-%d')
+        return day, day + DAY - SECOND
+
+
+def _number_bounds(value):
+    number = int(value)
+    return number, number
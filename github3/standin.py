@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+"""
+github3.standin
+===============
+
+This module provides a local stand-in for GitHub's API. It serves JSON
+documents, e.g., those recorded in Betamax cassettes, over HTTP and mimics
+the behaviour that matters when load testing code built on github3.py:
+pagination with ``Link`` headers, ``ETag`` and ``Last-Modified`` validation
+and ``304`` responses, raw blobs, rate limits that are enforced, ``202``
+responses from the statistics endpoints, latency and server errors.
+
+Nothing but the standard library is used, so the server runs on machines
+without network access::
+
+    with StandInServer(per_page=100, latency=0.05) as server:
+        server.add_cassette('tests/cassettes/GitHub_all_users.json')
+        gh = server.github()
+        for user in gh.all_users():
+            print(user.login)
+
+"""
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+import zlib
+
+from email.utils import formatdate, parsedate_tz, mktime_tz
+
+from requests.compat import urlencode, urlparse
+from requests.structures import CaseInsensitiveDict
+
+from .github import GitHub
+from .ratelimit import resource_for
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qsl
+except ImportError:  # (No coverage)
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import parse_qsl
+
+#: URL of the API the served documents point to
+GITHUB_URL = 'https://api.github.com'
+RAW_MEDIA_TYPE = 'application/vnd.github.v3.raw'
+
+_DOCUMENTATION = 'https://developer.github.com/v3'
+
+
+class StandInServer(object):
+
+    """A local HTTP server answering like GitHub's API.
+
+    Documents are registered with :meth:`add` or loaded from cassettes with
+    :meth:`add_cassette`. Every ``https://api.github.com`` URL in them is
+    rewritten to point at the stand-in so that following links, e.g., from a
+    repository to its issues, stays local. Arrays are paginated.
+
+    Rate limits are counted per ``Authorization`` header and resource
+    (``core``, ``search``). Once a budget is spent, requests are answered
+    with ``403`` until the window resets. ``304`` responses are free, like on
+    GitHub.
+
+    :param int per_page: (optional), page size used when the request does
+        not specify ``per_page``, default: 30
+    :param int rate_limit: (optional), requests per window to the ``core``
+        resource, default: 5000
+    :param int search_rate_limit: (optional), requests per window to the
+        ``search`` resource, default: 30
+    :param float reset_interval: (optional), length of a rate limit window
+        in seconds, default: 3600
+    :param latency: (optional), seconds to wait before answering, either a
+        number or a ``(minimum, maximum)`` tuple to draw from uniformly,
+        default: 0
+    :param float error_rate: (optional), fraction of requests answered with
+        ``error_status``, default: 0
+    :param int error_status: (optional), status of injected errors,
+        default: 502
+    :param int stats_pending: (optional), number of requests to each
+        statistics endpoint answered with ``202`` before the data is
+        served, default: 1
+    :param int poll_interval: (optional), seconds advised in the
+        ``X-Poll-Interval`` header of event and notification listings,
+        default: 60
+    :param seed: (optional), seed for the latency and error draws
+    :param str host: (optional), address to listen on, default: 127.0.0.1
+    :param int port: (optional), port to listen on, default: any free port
+    """
+
+    def __init__(self, per_page=30, rate_limit=5000, search_rate_limit=30,
+                 reset_interval=3600, latency=0, error_rate=0.0,
+                 error_status=502, stats_pending=1, poll_interval=60,
+                 seed=None, host='127.0.0.1', port=0):
+        self.per_page = per_page
+        self.rate_limits = {'core': rate_limit, 'search': search_rate_limit}
+        self.reset_interval = reset_interval
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.stats_pending = stats_pending
+        self.poll_interval = poll_interval
+        self.host = host
+        self.port = port
+        #: Number of requests received
+        self.request_count = 0
+        #: Number of requests answered, by status code
+        self.status_counts = {}
+        self._routes = {}
+        self._modified = {}
+        self._clock = 0
+        self._budgets = {}
+        self._stats_requests = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def __repr__(self):
+        return '<StandInServer [{0}]>'.format(self.url)
+
+    @property
+    def url(self):
+        """Base URL of the running server."""
+        return 'http://{0}:{1}'.format(self.host, self.port)
+
+    def start(self):
+        """Start serving in a background thread."""
+        self._server = _HTTPServer((self.host, self.port), _Handler)
+        self._server.standin = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = self._thread = None
+
+    def github(self, token=None):
+        """Return a :class:`GitHub <github3.github.GitHub>` using the server.
+
+        :param str token: (optional), token to log in with. Every token has
+            its own rate limit.
+        """
+        gh = GitHub(token=token or '')
+        gh.session.base_url = self.url
+        return gh
+
+    def add(self, path, json, method='GET', status=200):
+        """Serve ``json`` for ``method`` requests to ``path``.
+
+        :param str path: path of the URL, e.g., ``/users/octocat``
+        :param json: document to serve, arrays are paginated
+        :param str method: (optional), HTTP method, default: ``GET``
+        :param int status: (optional), status code, default: 200
+        """
+        with self._lock:
+            self._routes[(method.upper(), path)] = (status, json)
+            self._touch(method.upper(), path)
+
+    def add_cassette(self, path):
+        """Serve the successful responses recorded in a Betamax cassette.
+
+        Pages of the same listing are joined into one array which is then
+        paginated according to each request.
+
+        :param str path: path of the cassette file
+        """
+        with open(path) as fd:
+            interactions = json.load(fd)['http_interactions']
+        for interaction in interactions:
+            status, document = _recorded_json(interaction)
+            if document is None or status >= 400:
+                continue
+            method = interaction['request']['method'].upper()
+            url = urlparse(interaction['request']['uri'])
+            page = dict(parse_qsl(url.query)).get('page', '1')
+            with self._lock:
+                existing = self._routes.get((method, url.path))
+                if (page != '1' and existing is not None and
+                        isinstance(existing[1], list) and
+                        isinstance(document, list)):
+                    document = existing[1] + document
+                self._routes[(method, url.path)] = (status, document)
+                self._touch(method, url.path)
+
+    def _touch(self, method, path):
+        # Last-Modified has a resolution of one second, so every change is
+        # stamped with a later second than the one before
+        self._clock = max(int(time.time()), self._clock + 1)
+        self._modified[(method, path)] = self._clock
+
+    def reset_rate_limits(self):
+        """Restore every rate limit budget."""
+        with self._lock:
+            self._budgets.clear()
+
+    def respond(self, method, url, headers):
+        """Work out the response to a request.
+
+        This is what the HTTP server calls for every request. It can be
+        called directly to exercise the stand-in without a socket.
+
+        :param str method: HTTP method
+        :param str url: path and query string of the request
+        :param dict headers: headers of the request
+        :returns: status code, headers and body
+        :rtype: tuple
+        """
+        headers = CaseInsensitiveDict(headers)
+        self._delay()
+        with self._lock:
+            self.request_count += 1
+            status, response_headers, body = self._respond(
+                method.upper(), url, headers
+            )
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        return status, response_headers, body
+
+    def _delay(self):
+        latency = self.latency
+        if isinstance(latency, (tuple, list)):
+            with self._lock:
+                latency = self._random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+
+    def _respond(self, method, url, headers):
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self._error(self.error_status, 'Server Error')
+
+        parsed = urlparse(url)
+        path = parsed.path.rstrip('/') or '/'
+        query = dict(parse_qsl(parsed.query))
+        resource = resource_for(path)
+        budget = self._budget(headers.get('Authorization'), resource)
+        rate_headers = {
+            'X-RateLimit-Limit': str(budget['limit']),
+            'X-RateLimit-Remaining': str(budget['remaining']),
+            'X-RateLimit-Reset': str(budget['reset']),
+            'X-RateLimit-Resource': resource,
+        }
+
+        if path == '/rate_limit':
+            return self._json(200, self._rate_limit_json(
+                headers.get('Authorization')
+            ), rate_headers)
+
+        if budget['remaining'] <= 0:
+            return self._error(403, 'API rate limit exceeded', rate_headers)
+        budget['remaining'] -= 1
+        rate_headers['X-RateLimit-Remaining'] = str(budget['remaining'])
+
+        route = self._routes.get(('GET' if method == 'HEAD' else method, path))
+        if route is None:
+            return self._error(404, 'Not Found', rate_headers)
+        status, document = route
+
+        if method == 'GET' and '/stats/' in path:
+            seen = self._stats_requests.get(path, 0)
+            self._stats_requests[path] = seen + 1
+            if seen < self.stats_pending:
+                return self._json(202, {}, rate_headers)
+
+        if path.endswith(('/events', '/notifications')):
+            rate_headers['X-Poll-Interval'] = str(self.poll_interval)
+
+        if isinstance(document, list):
+            document, link = self._page(path, query, document)
+            if link:
+                rate_headers['Link'] = link
+
+        status, response_headers, body = self._json(status, document,
+                                                    rate_headers)
+        if (headers.get('Accept') == RAW_MEDIA_TYPE and
+                isinstance(document, dict) and
+                document.get('encoding') == 'base64'):
+            # Blobs and contents can be requested undecorated
+            body = base64.b64decode(document.get('content') or '')
+            response_headers['Content-Type'] = RAW_MEDIA_TYPE
+        etag = '"{0}"'.format(hashlib.md5(body).hexdigest())
+        response_headers['ETag'] = etag
+        if headers.get('If-None-Match') == etag:
+            # Conditional requests that match are not counted
+            budget['remaining'] += 1
+            response_headers['X-RateLimit-Remaining'] = str(
+                budget['remaining']
+            )
+            return 304, response_headers, b''
+        modified = self._modified.get(('GET' if method == 'HEAD' else method,
+                                       path))
+        if modified is not None:
+            response_headers['Last-Modified'] = formatdate(modified,
+                                                           usegmt=True)
+            since = parsedate_tz(headers.get('If-Modified-Since') or '')
+            if since is not None and modified <= mktime_tz(since):
+                budget['remaining'] += 1
+                response_headers['X-RateLimit-Remaining'] = str(
+                    budget['remaining']
+                )
+                return 304, response_headers, b''
+        if method == 'HEAD':
+            body = b''
+        return status, response_headers, body
+
+    def _budget(self, authorization, resource):
+        now = int(time.time())
+        key = (authorization or None, resource)
+        budget = self._budgets.get(key)
+        if budget is None or budget['reset'] <= now:
+            limit = self.rate_limits.get(resource, self.rate_limits['core'])
+            budget = self._budgets[key] = {
+                'limit': limit,
+                'remaining': limit,
+                'reset': now + int(self.reset_interval),
+            }
+        return budget
+
+    def _rate_limit_json(self, authorization):
+        resources = dict(
+            (resource, dict(self._budget(authorization, resource)))
+            for resource in self.rate_limits
+        )
+        return {'resources': resources, 'rate': resources['core']}
+
+    def _page(self, path, query, items):
+        """Slice ``items`` and build the ``Link`` header for the page."""
+        try:
+            per_page = min(int(query.get('per_page', self.per_page)), 100)
+            page = max(int(query.get('page', 1)), 1)
+        except ValueError:
+            per_page, page = self.per_page, 1
+        per_page = max(per_page, 1)
+        last = max((len(items) + per_page - 1) // per_page, 1)
+
+        def link(number, rel):
+            params = dict(query, page=number)
+            return '<{0}{1}?{2}>; rel="{3}"'.format(
+                self.url, path, urlencode(sorted(params.items())), rel
+            )
+
+        links = []
+        if page < last:
+            links.extend([link(page + 1, 'next'), link(last, 'last')])
+        if page > 1:
+            links.extend([link(1, 'first'), link(page - 1, 'prev')])
+        start = (page - 1) * per_page
+        return items[start:start + per_page], ', '.join(links)
+
+    def _json(self, status, document, headers=None):
+        body = json.dumps(document).replace(GITHUB_URL, self.url)
+        response_headers = dict(headers or {})
+        response_headers['Content-Type'] = 'application/json; charset=utf-8'
+        return status, response_headers, body.encode('utf-8')
+
+    def _error(self, status, message, headers=None):
+        return self._json(status, {
+            'message': message,
+            'documentation_url': _DOCUMENTATION,
+        }, headers)
+
+
+def _recorded_json(interaction):
+    """Return the status and decoded JSON body of a recorded interaction."""
+    response = interaction['response']
+    status = (response.get('status_code') or
+              response.get('status', {}).get('code'))
+    body = response.get('body', {})
+    if body.get('base64_string'):
+        content = base64.b64decode(body['base64_string'])
+    else:
+        content = (body.get('string') or '').encode('utf-8')
+    if content[:2] == b'\x1f\x8b':  # gzip
+        content = zlib.decompress(content, 16 + zlib.MAX_WBITS)
+    try:
+        return status, json.loads(content.decode('utf-8'))
+    except ValueError:
+        return status, None
+
+
+class _HTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, don't wait for an ACK
+    disable_nagle_algorithm = True
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        status, headers, body = self.server.standin.respond(
+            self.command, self.path, self.headers.items()
+        )
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_HEAD = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
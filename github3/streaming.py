@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+github3.streaming
+=================
+
+This module parses JSON arrays incrementally so that the elements of a large
+page can be used before the whole body has been received. It powers the
+``stream`` mode of :class:`GitHubIterator
+<github3.structs.GitHubIterator>`.
+
+"""
+import codecs
+import json
+
+#: Number of bytes read from the response at a time
+CHUNK_SIZE = 16 * 1024
+
+_WHITESPACE = ' \t\n\r'
+# Characters that may follow a complete value
+_DELIMITERS = _WHITESPACE + ',:]}'
+
+
+class JSONArrayStream(object):
+
+    """Yield the elements of a JSON array as soon as each one is complete.
+
+    The array is either the whole document or, when ``key`` is given, the
+    value of ``key`` in the top-level object. The other members of that
+    object are decoded as they are encountered and stored in
+    :attr:`members`::
+
+        stream = JSONArrayStream(response.iter_content(CHUNK_SIZE), 'items')
+        for item in stream:
+            print(stream.members.get('total_count'), item['full_name'])
+
+    :param chunks: iterable of UTF-8 encoded byte strings
+    :param str key: (optional), key of the array in the top-level object
+    """
+
+    def __init__(self, chunks, key=None):
+        self.key = key
+        #: Members of the top-level object decoded so far
+        self.members = {}
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+
+    def __iter__(self):
+        if self.key is None:
+            return self._array()
+        return self._object()
+
+    def _read(self):
+        """Append the next chunk to the buffer; return False at the end."""
+        if self._eof:
+            return False
+        # Drop what has been consumed so the buffer only holds one element
+        self._buffer = self._buffer[self._position:]
+        self._position = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return True
+        self._buffer += self._decoder.decode(b'', True)
+        self._eof = True
+        return False
+
+    def _peek(self):
+        """Return the next non-whitespace character or '' at the end."""
+        while True:
+            buffer, position = self._buffer, self._position
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            self._position = position
+            if position < len(buffer):
+                return buffer[position]
+            if not self._read():
+                return ''
+
+    def _expect(self, characters):
+        character = self._peek()
+        if character not in characters or not character:
+            raise ValueError('Expected one of {0!r} but found {1!r}'.format(
+                characters, character
+            ))
+        self._position += 1
+        return character
+
+    def _value(self):
+        """Decode the next complete value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer,
+                                                   self._position)
+            except ValueError:
+                if self._read():
+                    continue
+                raise
+            # A number, e.g., "2" of "2.5", might continue in the next chunk
+            if self._eof or (end < len(self._buffer) and
+                             self._buffer[end] in _DELIMITERS):
+                self._position = end
+                return value
+            self._read()
+
+    def _elements(self):
+        self._expect('[')
+        if self._peek() == ']':
+            self._position += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(',]') == ']':
+                return
+
+    def _array(self):
+        for element in self._elements():
+            yield element
+        if self._peek():
+            raise ValueError('Extra data after the JSON array')
+
+    def _object(self):
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            name = self._value()
+            self._expect(':')
+            if name == self.key and self._peek() == '[':
+                for element in self._elements():
+                    yield element
+            else:
+                self.members[name] = self._value()
+            if self._expect(',}') == '}':
+                return
+
+
+def stream_array(response, key=None):
+    """Stream the elements of the JSON array in ``response``.
+
+    The response is closed when the generator is exhausted or discarded.
+
+    :param response: a response requested with ``stream=True``
+    :param str key: (optional), key of the array in the top-level object
+    :returns: a :class:`JSONArrayStream`
+    """
+    return JSONArrayStream(_closing(response), key)
+
+
+def _closing(response):
+    try:
+        for chunk in response.iter_content(CHUNK_SIZE):
+            yield chunk
+    finally:
+        response.close()
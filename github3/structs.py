@@ -2,10 +2,17 @@
 import collections
 import functools
 
-from requests.compat import urlparse, urlencode
+from concurrent import futures
+from requests.compat import urlparse, urlencode, urlunparse
 
 from . import exceptions
 from . import models
+from . import streaming
+
+try:
+    from urllib.parse import parse_qsl
+except ImportError:  # (No coverage)
+    from urlparse import parse_qsl
 
 
 class GitHubIterator(models.GitHubCore, collections.Iterator):
@@ -39,6 +46,30 @@ class GitHubIterator(models.GitHubCore, collections.Iterator):
         self.last_response = None
         #: Last status code received
         self.last_status = 0
+        #: Number of pages to request concurrently ahead of the one being
+        #: consumed. This only takes effect when GitHub's first response
+        #: carries a ``rel="last"`` link. The default, ``0``, fetches pages
+        #: one after another.
+        self.prefetch = 0
+        #: Whether to return compact, ``__slots__`` based representations
+        #: from :mod:`github3.compact` instead of full models. Only classes
+        #: that have a compact counterpart are affected.
+        self.compact = False
+        #: Whether compact representations keep the raw JSON
+        self.keep_json = True
+        #: Collection of event types, e.g., ``{'PushEvent'}``, to return
+        #: from an event listing. Events of other types are skipped before
+        #: any object is created for them. The default, ``None``, returns
+        #: every event.
+        self.event_types = None
+        #: Whether to parse each page incrementally and return every item
+        #: as soon as it has been received instead of decoding the whole
+        #: page first. Only listings of models are streamed.
+        self.stream = False
+        #: Whether to return the dictionaries GitHub sent instead of
+        #: creating an object for each of them. Pagination, ``etag`` and
+        #: ``count`` behave exactly as they do otherwise.
+        self.raw = False
 
         if etag:
             self.headers.update({'If-None-Match': etag})
@@ -58,48 +89,153 @@ class GitHubIterator(models.GitHubCore, collections.Iterator):
         if 'per_page' not in params and self.count == -1:
             params['per_page'] = 100
 
+        stream = self.stream and issubclass(self.cls, models.GitHubCore)
         cls = self.cls
-        if issubclass(self.cls, models.GitHubCore):
+        compact_cls = getattr(self.cls, '_compact_class', None)
+        if self.raw:
+            cls = None
+        elif self.compact and compact_cls is not None:
+            cls = functools.partial(compact_cls, keep_json=self.keep_json)
+        elif issubclass(self.cls, models.GitHubCore):
             cls = functools.partial(self.cls, session=self)
 
+        for response in self._pages(params, headers):
+            # Streamed responses are closed even when the consumer stops
+            # before the end of the page
+            try:
+                self.last_response = response
+                self.last_status = response.status_code
+
+                if not self.etag and response.headers.get('ETag'):
+                    self.etag = response.headers.get('ETag')
+
+                if stream and response.status_code == 200:
+                    json = self._stream_json(response)
+                else:
+                    json = self._get_json(response)
+
+                if json is None:
+                    break
+
+                # languages returns a single dict. We want the items.
+                if isinstance(json, dict):
+                    if issubclass(self.cls, models.GitHubCore):
+                        raise exceptions.UnprocessableResponseBody(
+                            "GitHub's API returned a body that could not be"
+                            " handled", json
+                        )
+                    if json.get('ETag'):
+                        del json['ETag']
+                    if json.get('Last-Modified'):
+                        del json['Last-Modified']
+                    json = json.items()
+
+                for i in json:
+                    if (self.event_types is not None and
+                            not (isinstance(i, dict) and
+                                 i.get('type') in self.event_types)):
+                        continue
+                    yield i if cls is None else cls(i)
+                    self.count -= 1 if self.count > 0 else 0
+                    if self.count == 0:
+                        break
+            finally:
+                if stream:
+                    response.close()
+
+    def _pages(self, params, headers):
+        """Generate each page's response in order."""
         while (self.count == -1 or self.count > 0) and self.last_url:
-            response = self._get(self.last_url, params=params,
-                                 headers=headers)
-            self.last_response = response
-            self.last_status = response.status_code
+            response = self._get_page(self.last_url, params, headers)
             if params:
                 params = None  # rel_next already has the params
 
-            if not self.etag and response.headers.get('ETag'):
-                self.etag = response.headers.get('ETag')
-
-            json = self._get_json(response)
-
-            if json is None:
-                break
-
-            # languages returns a single dict. We want the items.
-            if isinstance(json, dict):
-                if issubclass(self.cls, models.GitHubCore):
-                    raise exceptions.UnprocessableResponseBody(
-                        "GitHub's API returned a body that could not be"
-                        " handled", json
-                    )
-                if json.get('ETag'):
-                    del json['ETag']
-                if json.get('Last-Modified'):
-                    del json['Last-Modified']
-                json = json.items()
-
-            for i in json:
-                yield cls(i)
-                self.count -= 1 if self.count > 0 else 0
-                if self.count == 0:
-                    break
+            urls = self._remaining_page_urls(response) if self.prefetch else []
+            if urls:
+                for response in self._prefetched_pages(response, urls,
+                                                       headers):
+                    yield response
+                return
 
+            yield response
             rel_next = response.links.get('next', {})
             self.last_url = rel_next.get('url', '')
 
+    def _get_page(self, url, params, headers):
+        if self.stream:
+            return self._get(url, params=params, headers=headers, stream=True)
+        return self._get(url, params=params, headers=headers)
+
+    @staticmethod
+    def _remaining_page_urls(response):
+        """Work out the URLs of every page after the first one.
+
+        :returns: list of URLs, empty if GitHub did not send the last page
+        """
+        links = response.links
+        if 'next' not in links or 'last' not in links:
+            return []
+        next_url = urlparse(links['next']['url'])
+        next_query = dict(parse_qsl(next_url.query))
+        last_query = dict(parse_qsl(urlparse(links['last']['url']).query))
+        try:
+            first_page = int(next_query['page'])
+            last_page = int(last_query['page'])
+        except (KeyError, ValueError):
+            return []
+
+        urls = []
+        for page in range(first_page, last_page + 1):
+            next_query['page'] = page
+            urls.append(urlunparse(next_url._replace(
+                query=urlencode(sorted(next_query.items()))
+            )))
+        return urls
+
+    def _prefetched_pages(self, first, urls, headers):
+        """Yield ``first`` then the pages at ``urls`` fetched concurrently.
+
+        At most :attr:`prefetch` requests are in flight at any one time and no
+        further pages are requested once enough items to satisfy ``count``
+        have been asked for.
+        """
+        per_page = int(dict(parse_qsl(urlparse(urls[0]).query)).get(
+            'per_page', 30
+        ))
+        executor = futures.ThreadPoolExecutor(max_workers=self.prefetch)
+        pending = collections.deque()
+        urls = collections.deque(urls)
+
+        def fill():
+            while urls and len(pending) < self.prefetch:
+                # self.count already accounts for the pages yielded so far
+                if (self.count != -1 and
+                        len(pending) * per_page >= self.count):
+                    break
+                url = urls.popleft()
+                pending.append((url, executor.submit(
+                    self._get_page, url, None, headers
+                )))
+
+        try:
+            yield first
+            fill()
+            while pending and (self.count == -1 or self.count > 0):
+                url, future = pending.popleft()
+                self.last_url = url
+                response = future.result()
+                yield response
+                fill()
+            if not (pending or urls):
+                self.last_url = ''
+        finally:
+            for _, future in pending:
+                if not future.cancel():
+                    # Pages already requested are never yielded, so nothing
+                    # else would release their connections
+                    future.add_done_callback(_close_page)
+            executor.shutdown(wait=False)
+
     def __next__(self):
         if not hasattr(self, '__i__'):
             self.__i__ = self.__iter__()
@@ -108,6 +244,20 @@ class GitHubIterator(models.GitHubCore, collections.Iterator):
     def _get_json(self, response):
         return self._json(response, 200)
 
+    def _stream_json(self, response):
+        """Return a generator of the items in ``response`` as they arrive."""
+        return self._streamed_items(streaming.stream_array(response))
+
+    def _streamed_items(self, stream):
+        try:
+            for item in stream:
+                yield item
+        except ValueError as exc:
+            raise exceptions.UnprocessableResponseBody(
+                "GitHub's API returned a body that could not be handled: "
+                "{0}".format(exc), None
+            )
+
     def refresh(self, conditional=False):
         self.count = self.original
         if conditional:
@@ -152,3 +302,22 @@ class SearchIterator(GitHubIterator):
         self.items = json.get('items', [])
         # If we return None then it will short-circuit the while loop.
         return json.get('items')
+
+    def _stream_json(self, response):
+        # Streamed items are not kept in self.items, that is the point
+        self.items = []
+        stream = streaming.stream_array(response, 'items')
+        return self._search_items(stream)
+
+    def _search_items(self, stream):
+        for item in self._streamed_items(stream):
+            self.total_count = stream.members.get('total_count',
+                                                  self.total_count)
+            yield item
+        self.total_count = stream.members.get('total_count', self.total_count)
+
+
+def _close_page(future):
+    """Close the response of a prefetched page that will not be yielded."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
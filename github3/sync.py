@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+"""
+github3.sync
+============
+
+This module fetches only what changed since the last run from endpoints
+that accept ``since``. A :class:`SyncEngine` keeps a high-water mark per
+resource and scope, e.g., the latest ``updated_at`` of the issues of one
+repository, and passes it as ``since`` on the next run::
+
+    from github3.sync import SQLiteStateStore, SyncEngine
+
+    engine = SyncEngine(SQLiteStateStore('sync.db'))
+    for issue in engine.changes('issues', repository):
+        save(issue)
+
+"""
+import json
+import sqlite3
+import threading
+
+from .batch import DEFAULT_WORKERS, run_batch
+
+
+class DictStateStore(object):
+
+    """High-water marks kept in memory for the lifetime of the process."""
+
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def get(self, resource, scope):
+        with self._lock:
+            return self._states.get((resource, scope))
+
+    def set(self, resource, scope, state):
+        with self._lock:
+            self._states[(resource, scope)] = state
+
+    def delete(self, resource, scope):
+        with self._lock:
+            self._states.pop((resource, scope), None)
+
+    def clear(self):
+        with self._lock:
+            self._states.clear()
+
+
+class SQLiteStateStore(object):
+
+    """High-water marks persisted in a SQLite database.
+
+    :param str path: path of the database file. It is created if it does not
+        exist.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS marks ('
+                ' resource TEXT,'
+                ' scope TEXT,'
+                ' state TEXT,'
+                ' PRIMARY KEY (resource, scope)'
+                ')'
+            )
+
+    def get(self, resource, scope):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT state FROM marks WHERE resource = ? AND scope = ?',
+                (resource, scope)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def set(self, resource, scope, state):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO marks (resource, scope, state) '
+                'VALUES (?, ?, ?)', (resource, scope, json.dumps(state))
+            )
+
+    def delete(self, resource, scope):
+        with self._lock, self._connection:
+            self._connection.execute(
+                'DELETE FROM marks WHERE resource = ? AND scope = ?',
+                (resource, scope)
+            )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM marks')
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class Resource(object):
+
+    """How to fetch the changes of one kind of object.
+
+    Custom resources, e.g., only the open issues of a repository, are
+    described the same way as the built-in ones::
+
+        open_issues = Resource(
+            'open_issues',
+            lambda repository, since: repository.issues(
+                state='open', sort='updated', direction='asc', since=since
+            ),
+            mark=lambda issue: issue.as_dict()['updated_at'],
+        )
+
+    :param str name: name the high-water marks are stored under
+    :param fetch: callable receiving the scope and the high-water mark, None
+        on the first run, and returning an iterator of models
+    :param mark: callable returning the position of a model, e.g., its
+        ``updated_at`` timestamp or its id. Positions must be JSON
+        serializable and grow with every change.
+    :param key: (optional), callable returning the identity of a model,
+        default: its ``id``
+    :param scope_key: (optional), callable turning the scope into the string
+        the high-water mark is stored under, default: :func:`str`
+    """
+
+    def __init__(self, name, fetch, mark, key=None, scope_key=str):
+        self.name = name
+        self.fetch = fetch
+        self.mark = mark
+        self.key = key or (lambda model: model.id)
+        self.scope_key = scope_key
+
+    def __repr__(self):
+        return '<Resource [{0}]>'.format(self.name)
+
+
+class SyncEngine(object):
+
+    """Fetch the objects that changed since the previous run.
+
+    GitHub's ``since`` includes objects at the high-water mark itself, so the
+    engine remembers which objects it saw at the mark and skips them. An
+    object appearing more than once in a run, e.g., because it was updated
+    while the pages were fetched, is only yielded again if it moved past its
+    previous position.
+
+    When the session has a :mod:`cache <github3.cache>`, scopes that did not
+    change since the last run are requested with the same ``since`` and are
+    answered with ``304 Not Modified``, which does not count against the
+    rate limit.
+
+    :param store: (optional), where high-water marks are kept, default: a
+        :class:`DictStateStore`
+    """
+
+    def __init__(self, store=None):
+        #: The store of the high-water marks
+        self.store = store if store is not None else DictStateStore()
+
+    def changes(self, resource, scope):
+        """Iterate over the objects of ``scope`` that changed since the last
+        run.
+
+        The high-water mark is only advanced once the generator is
+        exhausted, so an interrupted run is repeated in full.
+
+        :param resource: a :class:`Resource` or the name of one in
+            :data:`RESOURCES`
+        :param scope: what to fetch the resource of, e.g., a
+            :class:`Repository <github3.repos.Repository>` for ``'issues'``
+        :returns: generator of models
+        """
+        resource = _resource(resource)
+        scope_key = resource.scope_key(scope)
+        state = self.store.get(resource.name, scope_key) or {}
+        mark = state.get('mark')
+        seen = set(state.get('seen', []))
+        new_mark, new_seen = mark, set(seen)
+        positions = {}
+
+        for model in resource.fetch(scope, mark):
+            identity = resource.key(model)
+            position = resource.mark(model)
+            if position is not None and position == mark and (
+                    identity in seen):
+                continue
+            if identity in positions:
+                previous = positions[identity]
+                if position is None or (previous is not None and
+                                        previous >= position):
+                    continue
+            positions[identity] = position
+            if position is not None:
+                if new_mark is None or position > new_mark:
+                    new_mark, new_seen = position, set([identity])
+                elif position == new_mark:
+                    new_seen.add(identity)
+            yield model
+
+        self.store.set(resource.name, scope_key, {
+            'mark': new_mark, 'seen': list(new_seen),
+        })
+
+    def changes_for(self, resource, scopes, workers=DEFAULT_WORKERS,
+                    ordered=True):
+        """Fetch the changes of many scopes concurrently.
+
+        ::
+
+            repositories = [gh.repository(*pair) for pair in pairs]
+            for result in engine.changes_for('issues', repositories):
+                if result.exception is None:
+                    save(result.key, result.result)
+
+        :param resource: a :class:`Resource` or the name of one in
+            :data:`RESOURCES`
+        :param scopes: iterable of scopes
+        :param int workers: (optional), maximum number of scopes fetched at
+            once, default: 10
+        :param bool ordered: (optional), yield results in the order of
+            ``scopes`` (True, the default) or as they complete (False)
+        :returns: generator of :class:`BatchResult
+            <github3.batch.BatchResult>` whose ``result`` is the list of
+            changed models
+        """
+        resource = _resource(resource)
+        return run_batch(lambda scope: list(self.changes(resource, scope)),
+                         scopes, workers, ordered)
+
+    def high_water_mark(self, resource, scope):
+        """Return the high-water mark of ``scope``, None before the first
+        run."""
+        resource = _resource(resource)
+        state = self.store.get(resource.name, resource.scope_key(scope))
+        return (state or {}).get('mark')
+
+    def reset(self, resource, scope):
+        """Forget the high-water mark of ``scope``, so the next run fetches
+        everything."""
+        resource = _resource(resource)
+        self.store.delete(resource.name, resource.scope_key(scope))
+
+
+def _resource(resource):
+    if isinstance(resource, Resource):
+        return resource
+    try:
+        return RESOURCES[resource]
+    except KeyError:
+        raise ValueError('Unknown resource: {0}'.format(resource))
+
+
+def _updated_at(model):
+    return model.as_dict().get('updated_at')
+
+
+def _committed_at(commit):
+    committer = (commit.as_dict().get('commit') or {}).get('committer')
+    return (committer or {}).get('date')
+
+
+def _issue_key(issue):
+    return '{0}/{1}#{2}'.format(issue.repository[0], issue.repository[1],
+                                issue.number)
+
+
+def _github_key(github):
+    return github.session.base_url
+
+
+#: The built-in resources by name
+RESOURCES = dict((resource.name, resource) for resource in [
+    Resource('issues', lambda repository, since: repository.issues(
+        state='all', sort='updated', direction='asc', since=since
+    ), _updated_at),
+    Resource('commits', lambda repository, since: repository.commits(
+        since=since
+    ), _committed_at, key=lambda commit: commit.sha),
+    Resource('issue_comments', lambda issue, since: issue.comments(
+        sort='updated', direction='asc', since=since
+    ), _updated_at, scope_key=_issue_key),
+    Resource('imported_issues', lambda repository, since: (
+        repository.imported_issues(since=since)
+    ), _updated_at),
+    Resource('users', lambda github, since: github.all_users(since=since),
+             lambda user: user.id, scope_key=_github_key),
+    Resource('repositories', lambda github, since: github.all_repositories(
+        since=since
+    ), lambda repository: repository.id, scope_key=_github_key),
+])
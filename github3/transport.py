@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+github3.transport
+=================
+
+This module contains transport adapters that can be mounted on a
+:class:`GitHubSession <github3.session.GitHubSession>`. Sessions send every
+request through a :mod:`requests` transport adapter, so swapping the adapter
+changes how requests reach GitHub without changing anything else, e.g., the
+models, caching, retries or rate limiting::
+
+    from github3.transport import transport_for
+
+    gh.session.use_transport(transport_for('httpx', pool_maxsize=100))
+
+"""
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+class HTTPXAdapter(BaseAdapter):
+
+    """A transport adapter sending requests with `httpx`_.
+
+    With HTTP/2 enabled, concurrent requests to GitHub are multiplexed over
+    a few connections instead of opening one connection, and paying for one
+    TLS handshake, per concurrent request.
+
+    TLS verification and client certificates are options of the adapter;
+    the ``verify`` and ``cert`` arguments of individual requests are
+    ignored. Proxies are configured through the environment.
+
+    :param bool http2: (optional), negotiate HTTP/2 where the server supports
+        it, default: True. This requires the ``h2`` package, installable
+        with the ``http2`` extra.
+    :param int pool_maxsize: (optional), maximum number of connections,
+        default: 100
+    :param int pool_keepalive: (optional), maximum number of idle
+        connections kept open, default: ``pool_maxsize``
+    :param verify: (optional), whether to verify TLS certificates or the
+        path of a CA bundle, default: True
+    :param client_options: (optional), further keyword arguments for
+        :class:`httpx.Client`
+
+    .. _httpx: https://www.python-httpx.org/
+    """
+
+    def __init__(self, http2=True, pool_maxsize=100, pool_keepalive=None,
+                 verify=True, **client_options):
+        super(HTTPXAdapter, self).__init__()
+        import httpx
+        self._httpx = httpx
+        if pool_keepalive is None:
+            pool_keepalive = pool_maxsize
+        #: Whether HTTP/2 is negotiated
+        self.http2 = http2
+        #: The :class:`httpx.Client` sending the requests
+        self.client = httpx.Client(
+            http2=http2, verify=verify, limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_keepalive,
+            ), **client_options
+        )
+
+    def __repr__(self):
+        return '<HTTPXAdapter [http2={0}]>'.format(self.http2)
+
+    def send(self, request, stream=False, timeout=None, verify=True,
+             cert=None, proxies=None):
+        httpx = self._httpx
+        outgoing = self.client.build_request(
+            request.method, request.url, headers=dict(request.headers),
+            content=request.body, timeout=self._timeout(timeout),
+        )
+        try:
+            response = self.client.send(outgoing, stream=stream)
+            if not stream:
+                response.read()
+        except httpx.ConnectTimeout as exc:
+            raise requests.exceptions.ConnectTimeout(exc, request=request)
+        except httpx.TimeoutException as exc:
+            raise requests.exceptions.ReadTimeout(exc, request=request)
+        except httpx.TransportError as exc:
+            raise requests.exceptions.ConnectionError(exc, request=request)
+        return self.build_response(request, response, stream)
+
+    def _timeout(self, timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self._httpx.Timeout(None, connect=connect, read=read)
+        return self._httpx.Timeout(timeout)
+
+    def build_response(self, request, incoming, stream):
+        """Turn a :class:`httpx.Response` into a :class:`requests.Response`.
+
+        Bodies are decompressed by httpx.
+        """
+        response = requests.Response()
+        response.status_code = incoming.status_code
+        response.headers = CaseInsensitiveDict(
+            (name, incoming.headers[name]) for name in incoming.headers
+        )
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = incoming.reason_phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        if stream:
+            response.raw = _StreamedBody(incoming)
+        else:
+            response._content = incoming.content
+            response._content_consumed = True
+        return response
+
+    def close(self):
+        self.client.close()
+
+
+class _StreamedBody(object):
+
+    """The part of urllib3's response interface requests streams from."""
+
+    def __init__(self, response):
+        self._response = response
+        self._buffer = b''
+        self._chunks = None
+
+    def stream(self, chunk_size, decode_content=True):
+        for chunk in self._response.iter_bytes(chunk_size):
+            yield chunk
+        self.close()
+
+    def read(self, amt=None, decode_content=True):
+        if self._chunks is None:
+            self._chunks = self._response.iter_bytes()
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if amt is None:
+            amt = len(self._buffer)
+        data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self):
+        self._response.close()
+
+    release_conn = close
+
+
+#: Transport adapters by name, see :func:`transport_for`
+TRANSPORTS = {
+    'requests': HTTPAdapter,
+    'httpx': HTTPXAdapter,
+}
+
+
+def transport_for(name, **options):
+    """Create the transport adapter registered as ``name``.
+
+    ``'requests'`` is requests' own HTTP/1.1 adapter, which accepts
+    ``pool_connections`` and ``pool_maxsize``. ``'httpx'`` is a
+    :class:`HTTPXAdapter`.
+
+    :param str name: ``'requests'`` or ``'httpx'``
+    :param options: (optional), keyword arguments for the adapter
+    :raises: ValueError if no transport has that name
+    :raises: ImportError if the library the transport uses is not installed
+    """
+    if name not in TRANSPORTS:
+        raise ValueError('Unknown transport: {0}'.format(name))
+    return TRANSPORTS[name](**options)
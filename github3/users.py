@@ -2,12 +2,11 @@
 """This module contains everything relating to Users."""
 from __future__ import unicode_literals
 
-from json import dumps
-
 from github3.auths import Authorization
 from uritemplate import URITemplate
 
 from . import models
+from .compact import CompactUser
 from .decorators import requires_auth
 from .events import Event
 
@@ -60,7 +59,9 @@ class Key(models.GitHubCore):
         json = None
         if title and key:
             data = {'title': title, 'key': key}
-            json = self._json(self._patch(self._api, data=dumps(data)), 200)
+            json = self._json(
+                self._patch(self._api, data=self._dumps(data)), 200
+            )
         if json:
             self._update_attributes(json)
             return True
@@ -509,7 +510,7 @@ class ShortUser(_User):
     .. versionadded:: 1.0.0
     """
 
-    pass
+    _compact_class = CompactUser
 
 
 class User(_User):
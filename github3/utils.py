@@ -65,6 +65,57 @@ class UTC(datetime.tzinfo):
         return self.ZERO
 
 
+#: The :class:`UTC` instance shared by every parsed timestamp
+utc = UTC()
+
+#: The format GitHub uses for timestamps
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+# Listings repeat the same timestamps often, e.g., every event in a push
+_timestamp_memo = {}
+_TIMESTAMP_MEMO_SIZE = 4096
+
+
+def parse_timestamp(time_str):
+    """Convert a timestamp in GitHub's format to an aware datetime object.
+
+    Timestamps of the form ``2016-02-19T12:34:56Z`` are decoded by slicing
+    the string, which is several times faster than
+    :meth:`datetime.datetime.strptime`. Any other string is handed to
+    ``strptime`` and raises the same :class:`ValueError` it would. Recently
+    parsed timestamps are remembered; the datetime objects are immutable and
+    shared.
+
+    :param str time_str: timestamp formatted as ``%Y-%m-%dT%H:%M:%SZ``
+    :returns: timezone-aware datetime object
+    :rtype: datetime
+    :raises: ValueError
+    """
+    dt = _timestamp_memo.get(time_str)
+    if dt is not None:
+        return dt
+
+    if (len(time_str) == 20 and time_str[4] == '-' and time_str[7] == '-' and
+            time_str[10] == 'T' and time_str[13] == ':' and
+            time_str[16] == ':' and time_str[19] == 'Z'):
+        try:
+            dt = datetime.datetime(
+                int(time_str[0:4]), int(time_str[5:7]), int(time_str[8:10]),
+                int(time_str[11:13]), int(time_str[14:16]),
+                int(time_str[17:19]), tzinfo=utc
+            )
+        except ValueError:
+            dt = None
+    if dt is None:
+        dt = datetime.datetime.strptime(time_str, TIMESTAMP_FORMAT)
+        dt = dt.replace(tzinfo=utc)
+
+    if len(_timestamp_memo) >= _TIMESTAMP_MEMO_SIZE:
+        _timestamp_memo.clear()
+    _timestamp_memo[time_str] = dt
+    return dt
+
+
 def stream_response_to_file(response, path=None):
     """Stream a response body to the specified file.
 
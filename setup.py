@@ -5,6 +5,7 @@ import os
 import re
 
 from setuptools import setup
+from setuptools.command.build_py import build_py
 from setuptools.command.test import test as TestCommand
 
 kwargs = {}
@@ -23,6 +24,26 @@ SNI_requirements = [
     'pyasn1'
 ]
 
+async_requirements = [
+    'aiohttp; python_version >= "3.5"',
+]
+
+orjson_requirements = [
+    'orjson',
+]
+
+ujson_requirements = [
+    'ujson',
+]
+
+http2_requirements = [
+    'httpx[http2]',
+]
+
+prometheus_requirements = [
+    'prometheus_client',
+]
+
 kwargs['tests_require'] = ['betamax >=0.2.0', 'pytest',
                            'betamax-matchers>=0.1.0']
 if sys.version_info < (3, 0):
@@ -35,6 +56,8 @@ if sys.argv[-1] in ("submit", "publish"):
     sys.exit()
 
 requires.extend(["requests >= 2.0", "uritemplate >= 3.0.0"])
+if sys.version_info < (3, 2):
+    requires.append("futures")
 
 __version__ = ''
 with open('github3/__about__.py', 'r') as fd:
@@ -49,6 +72,15 @@ if not __version__:
     raise RuntimeError('Cannot find version information')
 
 
+class BuildPy(build_py):
+    # github3.aio uses async and await, which older Pythons cannot compile
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        if sys.version_info < (3, 5):
+            modules = [m for m in modules if m[:2] != ('github3', 'aio')]
+        return modules
+
+
 class PyTest(TestCommand):
     def finalize_options(self):
         TestCommand.finalize_options(self)
@@ -91,7 +123,12 @@ setup(
     extras_require={
         'test': kwargs['tests_require'],
         'sni': SNI_requirements,
+        'async': async_requirements,
+        'orjson': orjson_requirements,
+        'ujson': ujson_requirements,
+        'prometheus': prometheus_requirements,
+        'http2': http2_requirements,
     },
-    cmdclass={'test': PyTest},
+    cmdclass={'build_py': BuildPy, 'test': PyTest},
     **kwargs
 )
@@ -255,6 +255,15 @@ class TestGitHub(IntegrationHelper):
             for u in self.gh.all_users(number=25):
                 assert isinstance(u, github3.users.ShortUser)
 
+    def test_all_users_streamed(self):
+        """Test the ability to stream the users of each page."""
+        cassette_name = self.cassette_name('iter_all_users')
+        with self.recorder.use_cassette(cassette_name):
+            users = self.gh.all_users(number=25)
+            users.stream = True
+            logins = [u.login for u in users]
+        assert len(logins) == 25
+
     def test_all_events(self):
         """Test the ability to iterate over all public events."""
         cassette_name = self.cassette_name('all_events')
@@ -482,6 +491,17 @@ class TestGitHub(IntegrationHelper):
 
         assert isinstance(repos, github3.structs.SearchIterator)
 
+    def test_search_repositories_streamed(self):
+        """Test the ability to stream repository search results."""
+        cassette_name = self.cassette_name('search_repositories')
+        with self.recorder.use_cassette(cassette_name):
+            repos = self.gh.search_repositories('github3 language:python')
+            repos.stream = True
+            assert isinstance(next(repos),
+                              github3.search.RepositorySearchResult)
+
+        assert repos.total_count > 0
+
     def test_search_repositories_with_text_match(self):
         """Test the ability to use the repository search endpoint."""
         self.token_login()
@@ -44,6 +44,11 @@ def build_url(self, *args, **kwargs):
     return github3.session.GitHubSession().build_url(*args, **kwargs)
 
 
+def build_route(self, *args, **kwargs):
+    """A function to proxy to the actual GitHubSession#build_route method."""
+    return github3.session.GitHubSession().build_route(*args, **kwargs)
+
+
 class UnitHelper(unittest.TestCase):
 
     """Base class for unittests."""
@@ -153,6 +158,7 @@ class UnitHelper(unittest.TestCase):
         # we can assert things about the call that will be attempted to the
         # internet
         self.described_class._build_url = build_url
+        self.described_class._build_route = build_route
         self.after_setup()
 
     def after_setup(self):
@@ -238,6 +244,7 @@ class UnitGitHubObjectHelper(UnitHelper):
         # we can assert things about the call that will be attempted to the
         # internet
         self.described_class._build_url = build_url
+        self.described_class._build_route = build_route
         self.after_setup()
         pass
 
@@ -255,6 +262,14 @@ class UnitGitHubEnterpriseHelper(UnitHelper):
             **kwargs
         )
 
+    def build_route(self, *args, **kwargs):
+        """A function to proxy to the actual GitHubSession#build_route."""
+        return github3.session.GitHubSession().build_route(
+            *args,
+            base_url=self.enterprise_url,
+            **kwargs
+        )
+
     def setUp(self):
         self.session = self.create_session_mock()
         self.instance = github3.GitHubEnterprise(self.enterprise_url)
@@ -263,6 +278,7 @@ class UnitGitHubEnterpriseHelper(UnitHelper):
         # we can assert things about the call that will be attempted to the
         # internet
         self.instance._build_url = self.build_url
+        self.instance._build_route = self.build_route
         self.after_setup()
 
 
@@ -0,0 +1,284 @@
+"""Unit tests for the asyncio transport."""
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+import asyncio  # noqa: E402
+
+from github3 import aio, exceptions, structs  # noqa: E402
+from github3.cache import DictCache  # noqa: E402
+from github3.ratelimit import RateLimitPolicy  # noqa: E402
+from github3.retry import RetryEngine, RetryPolicy  # noqa: E402
+from github3.search import RepositorySearchResult  # noqa: E402
+from github3.session import GitHubSession  # noqa: E402
+from github3.users import ShortUser  # noqa: E402
+
+from . import helper  # noqa: E402
+
+url_for = helper.create_url_helper('https://api.github.com/users')
+get_user_example_data = helper.create_example_data_helper('users_example')
+user_example_data = [get_user_example_data() for _ in range(3)]
+
+
+def build_response(body, status=200, links=None, **extra_headers):
+    headers = {'Content-Type': 'application/json', 'ETag': '"abc"'}
+    headers.update(extra_headers)
+    if links:
+        headers['Link'] = ', '.join(
+            '<{0}>; rel="{1}"'.format(url, rel) for rel, url in links.items()
+        )
+    return aio.AsyncGitHubSession._build_response(
+        'get', url_for(), status, 'OK', headers,
+        json.dumps(body).encode('utf-8')
+    )
+
+
+class AsyncHelper(object):
+    def setup_method(self, method):
+        self.loop = asyncio.new_event_loop()
+        self.session = aio.AsyncGitHubSession(GitHubSession())
+        self.calls = []
+
+    def teardown_method(self, method):
+        self.loop.close()
+
+    def respond_with(self, *responses):
+        responses = iter(responses)
+
+        def _send(method, url, **kwargs):
+            self.calls.append((method, url, kwargs))
+            future = self.loop.create_future()
+            future.set_result(next(responses))
+            return future
+
+        self.session._send = _send
+
+    def drain(self, iterator):
+        results = []
+        while True:
+            try:
+                results.append(
+                    self.loop.run_until_complete(iterator.__anext__())
+                )
+            except StopAsyncIteration:
+                return results
+
+
+class TestAsyncGitHubSession(AsyncHelper):
+    def test_copies_configuration(self):
+        """Show that headers and auth come from the synchronous session."""
+        sync = GitHubSession()
+        sync.token_auth('token-value')
+        session = aio.AsyncGitHubSession(sync)
+        assert session.headers['Authorization'] == 'token token-value'
+        assert session.base_url == sync.base_url
+        assert session.build_url('users') == 'https://api.github.com/users'
+
+    def test_build_response(self):
+        """Show that responses behave like requests responses."""
+        response = build_response([{'login': 'a'}],
+                                  links={'next': url_for('?page=2')})
+        assert response.json() == [{'login': 'a'}]
+        assert response.links['next']['url'] == url_for('?page=2')
+        assert response.headers['etag'] == '"abc"'
+
+    def test_request_counts(self):
+        """Show that each request bumps the counter."""
+        self.respond_with(build_response([]))
+        self.loop.run_until_complete(self.session.get(url_for()))
+        assert self.session.request_counter == 1
+
+    def test_token_pool(self):
+        """Show that tokens come from the pool and fail over when one is
+        exhausted."""
+        self.session.session.token_pool_auth(['a', 'b'])
+        self.respond_with(
+            build_response({'message': 'API rate limit exceeded'},
+                           status=403, **{'X-RateLimit-Limit': '5000',
+                                          'X-RateLimit-Remaining': '0',
+                                          'X-RateLimit-Reset': '1'}),
+            build_response([]),
+        )
+        response = self.loop.run_until_complete(self.session.get(url_for()))
+        assert response.status_code == 200
+        assert [c[2]['headers']['Authorization'] for c in self.calls] == [
+            'token a', 'token b'
+        ]
+
+    def test_rate_limits(self):
+        """Show that the policy is consulted and the tracker updated."""
+        policy = self.session.session.rate_limit_policy = RateLimitPolicy()
+        policy.delay = helper.mock.Mock(return_value=0)
+        self.respond_with(build_response([], **{
+            'X-RateLimit-Limit': '5000', 'X-RateLimit-Remaining': '4999',
+            'X-RateLimit-Reset': '1',
+        }))
+        self.loop.run_until_complete(self.session.get(url_for()))
+        assert policy.delay.call_count == 1
+        budget = self.session.session.rate_limits.budget('core')
+        assert budget.remaining == 4999
+
+    def test_retries(self):
+        """Show that the session's retry engine is used."""
+        engine = self.session.session.retry = RetryEngine(
+            RetryPolicy(backoff_factor=0)
+        )
+        self.respond_with(build_response({}, status=503),
+                          build_response([]))
+        response = self.loop.run_until_complete(self.session.get(url_for()))
+        assert response.status_code == 200
+        assert response.retries == 1
+        assert engine.stats.as_dict()['reasons'] == {'503': 1}
+
+    def test_retries_connection_errors(self):
+        self.session.session.retry = RetryEngine(
+            RetryPolicy(total=1, backoff_factor=0)
+        )
+
+        def _send(method, url, **kwargs):
+            self.calls.append(url)
+            raise aiohttp.ClientConnectionError('reset')
+
+        self.session._send = _send
+        with pytest.raises(aiohttp.ClientConnectionError):
+            self.loop.run_until_complete(self.session.get(url_for()))
+        assert len(self.calls) == 2
+
+    def test_cache(self):
+        """Show that cached responses are revalidated and served."""
+        self.session.session.cache = DictCache()
+        self.respond_with(build_response([{'login': 'a'}]),
+                          build_response(None, status=304))
+        self.loop.run_until_complete(self.session.get(url_for()))
+        response = self.loop.run_until_complete(self.session.get(url_for()))
+        assert response.status_code == 200
+        assert response.from_cache is True
+        assert response.json() == [{'login': 'a'}]
+        assert self.calls[1][2]['headers']['If-None-Match'] == '"abc"'
+
+    def test_request_hooks(self):
+        events = []
+        self.session.session.request_hooks.append(events.append)
+        self.respond_with(build_response([]))
+        self.loop.run_until_complete(self.session.get(url_for()))
+        assert [e.status_code for e in events] == [200]
+
+    def test_iterate_picks_search_iterator(self):
+        """Show that SearchIterators get an asynchronous search twin."""
+        search = structs.SearchIterator(-1, 'https://api.github.com/search',
+                                        RepositorySearchResult,
+                                        GitHubSession(), {'q': 'github3'})
+        iterator = self.session.iterate(search)
+        assert isinstance(iterator, aio.AsyncSearchIterator)
+        assert iterator.params == {'q': 'github3'}
+
+
+class TestAsyncGitHubIterator(AsyncHelper):
+    def test_paginates_and_builds_models(self):
+        """Show that pages are followed and models are constructed."""
+        self.respond_with(
+            build_response(user_example_data[:2],
+                           links={'next': url_for('?page=2')}),
+            build_response(user_example_data[2:3]),
+        )
+        iterator = aio.AsyncGitHubIterator(-1, url_for(), ShortUser,
+                                           self.session)
+        users = self.drain(iterator)
+
+        assert len(users) == 3
+        assert all(isinstance(u, ShortUser) for u in users)
+        assert users[0].session is self.session.session
+        assert self.calls[0][2]['params'] == {'per_page': 100}
+        assert self.calls[1][1] == url_for('?page=2')
+        assert self.calls[1][2]['params'] is None
+        assert iterator.etag == '"abc"'
+
+    def test_respects_count(self):
+        """Show that iteration stops once count items were produced."""
+        self.respond_with(build_response(user_example_data))
+        iterator = aio.AsyncGitHubIterator(2, url_for(), ShortUser,
+                                           self.session)
+        assert len(self.drain(iterator)) == 2
+        assert self.calls[0][2]['params'] == {'per_page': 2}
+
+    def test_from_iterator(self):
+        """Show that synchronous iterators can be converted."""
+        self.respond_with(build_response(user_example_data))
+        sync = structs.GitHubIterator(1, url_for(), ShortUser,
+                                      GitHubSession(), etag='"xyz"')
+        iterator = self.session.iterate(sync)
+        assert iterator.headers == {'If-None-Match': '"xyz"'}
+        assert len(self.drain(iterator)) == 1
+
+    def test_raises_error_for(self):
+        """Show that error responses are converted like synchronous ones."""
+        self.respond_with(build_response({'message': 'Oops'}, status=500))
+        iterator = aio.AsyncGitHubIterator(-1, url_for(), ShortUser,
+                                           self.session)
+        with pytest.raises(exceptions.ServerError):
+            self.drain(iterator)
+
+    def test_wraps_connection_errors(self):
+        """Show that aiohttp failures become github3 exceptions."""
+        def _send(method, url, **kwargs):
+            raise aiohttp.ClientConnectionError('reset')
+
+        self.session._send = _send
+        iterator = aio.AsyncGitHubIterator(-1, url_for(), ShortUser,
+                                           self.session)
+        with pytest.raises(exceptions.ConnectionError):
+            self.drain(iterator)
+
+
+class TestAsyncGitHubIteratorSession(AsyncHelper):
+    def build_iterator(self, session):
+        iterator = aio.AsyncGitHubIterator(-1, url_for(), ShortUser, session)
+        self.session = iterator.async_session
+        self.closed = []
+
+        async def close():
+            self.closed.append(True)
+
+        self.session.close = close
+        return iterator
+
+    def test_closes_the_session_it_created(self):
+        """Show that a session created from a synchronous one is closed when
+        iteration ends."""
+        iterator = self.build_iterator(GitHubSession())
+        self.respond_with(build_response(user_example_data))
+        assert len(self.drain(iterator)) == 3
+        assert self.closed == [True]
+
+    def test_aclose(self):
+        """Show that stopping early closes the session too."""
+        iterator = self.build_iterator(GitHubSession())
+        self.respond_with(build_response(user_example_data))
+        self.loop.run_until_complete(iterator.__anext__())
+        self.loop.run_until_complete(iterator.aclose())
+        assert self.closed
+
+    def test_leaves_given_sessions_open(self):
+        iterator = self.build_iterator(self.session)
+        self.respond_with(build_response(user_example_data))
+        self.drain(iterator)
+        self.loop.run_until_complete(iterator.aclose())
+        assert self.closed == []
+
+
+class TestAsyncSearchIterator(AsyncHelper):
+    def test_reads_items(self):
+        """Show that search results are read from the items key."""
+        self.respond_with(build_response({'total_count': 1, 'items': [
+            {'score': 1.0, 'url': 'https://api.github.com/repos/a/b'},
+        ]}))
+        iterator = aio.AsyncSearchIterator(
+            -1, 'https://api.github.com/search/repositories',
+            RepositorySearchResult, self.session, {'q': 'b'}
+        )
+        results = self.drain(iterator)
+        assert iterator.total_count == 1
+        assert len(results) == 1
+        assert isinstance(results[0], RepositorySearchResult)
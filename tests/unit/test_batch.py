@@ -0,0 +1,85 @@
+"""Unit tests for running lookups concurrently."""
+import threading
+import time
+
+import pytest
+
+from github3 import batch
+
+
+class TestRunBatch:
+    def test_ordered(self):
+        """Show that results follow the order of the keys."""
+        def lookup(key):
+            time.sleep(0.01 * (5 - key))
+            return key * 2
+
+        results = list(batch.run_batch(lookup, range(5), workers=5))
+        assert [(r.key, r.result) for r in results] == [
+            (k, k * 2) for k in range(5)
+        ]
+
+    def test_unordered(self):
+        """Show that results are yielded as soon as they are ready."""
+        release = threading.Event()
+
+        def lookup(key):
+            if key == 0:
+                release.wait(5)
+            return key
+
+        results = batch.run_batch(lookup, range(3), workers=3, ordered=False)
+        first = next(results)
+        release.set()
+        assert first.key != 0
+        assert sorted(r.key for r in [first] + list(results)) == [0, 1, 2]
+
+    def test_exceptions_do_not_stop_the_batch(self):
+        def lookup(key):
+            if key == 1:
+                raise ValueError(key)
+            return key
+
+        results = list(batch.run_batch(lookup, range(3)))
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].exception, ValueError)
+        assert results[1].result is None
+
+    def test_not_found(self):
+        """Show that None, i.e., a 404, is not ok but not an error."""
+        result = next(batch.run_batch(lambda key: None, ['missing']))
+        assert result.ok is False
+        assert result.exception is None
+
+    def test_bounded(self):
+        """Show that no more than ``workers`` lookups run at once."""
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def lookup(key):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.005)
+            with lock:
+                running[0] -= 1
+
+        list(batch.run_batch(lookup, range(30), workers=3))
+        assert running[1] <= 3
+
+    def test_consumes_keys_lazily(self):
+        consumed = []
+
+        def keys():
+            for key in range(1000):
+                consumed.append(key)
+                yield key
+
+        results = batch.run_batch(lambda key: key, keys(), workers=2)
+        next(results)
+        results.close()
+        assert len(consumed) < 10
+
+    def test_requires_a_worker(self):
+        with pytest.raises(ValueError):
+            next(batch.run_batch(lambda key: key, [1], workers=0))
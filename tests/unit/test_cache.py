@@ -0,0 +1,143 @@
+"""Unit tests for the response caches."""
+import requests
+
+from github3 import cache, session
+from .helper import mock
+
+
+def build_request(url='https://api.github.com/users/octocat', **headers):
+    headers.setdefault('Accept', 'application/vnd.github.v3.full+json')
+    return requests.Request('GET', url, headers=headers).prepare()
+
+
+def build_response(status_code=200, body=b'{"login": "octocat"}',
+                   **headers):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    response._content = body
+    response.url = 'https://api.github.com/users/octocat'
+    return response
+
+
+class TestCacheKey:
+    def test_depends_on_accept_header(self):
+        """Show that different media types are cached separately."""
+        full = build_request()
+        raw = build_request(Accept='application/vnd.github.v3.raw')
+        assert cache.cache_key(full) != cache.cache_key(raw)
+
+    def test_depends_on_credentials(self):
+        """Show that responses are not shared between identities."""
+        one = build_request(Authorization='token one')
+        two = build_request(Authorization='token two')
+        assert cache.cache_key(one) != cache.cache_key(two)
+
+    def test_does_not_contain_credentials(self):
+        """Show that the token cannot be recovered from the key."""
+        request = build_request(Authorization='token secret')
+        assert 'secret' not in cache.cache_key(request)
+
+
+class TestCacheEntry:
+    def test_conditional_headers(self):
+        """Show that both validators are sent when known."""
+        entry = cache.CacheEntry.from_response(build_response(
+            ETag='"abc"', **{'Last-Modified': 'Tue, 01 Mar 2016 00:00:00 GMT'}
+        ))
+        assert entry.conditional_headers() == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Tue, 01 Mar 2016 00:00:00 GMT',
+        }
+
+    def test_to_response(self):
+        """Show that a 304 is turned into the stored 200."""
+        entry = cache.CacheEntry.from_response(build_response(
+            ETag='"abc"', **{'X-RateLimit-Remaining': '10'}
+        ))
+        not_modified = build_response(304, b'', **{
+            'X-RateLimit-Remaining': '9'
+        })
+        response = entry.to_response(not_modified)
+        assert response.status_code == 200
+        assert response.json() == {'login': 'octocat'}
+        assert response.headers['ETag'] == '"abc"'
+        assert response.headers['X-RateLimit-Remaining'] == '9'
+        assert response.from_cache is True
+
+
+class TestSQLiteCache:
+    def test_round_trip(self, tmpdir):
+        """Show that entries survive reopening the database."""
+        path = str(tmpdir.join('cache.sqlite'))
+        entry = cache.CacheEntry.from_response(build_response(ETag='"a"'))
+        store = cache.SQLiteCache(path)
+        store.set('key', entry)
+        store.close()
+
+        stored = cache.SQLiteCache(path).get('key')
+        assert stored.etag == '"a"'
+        assert stored.body == entry.body
+        assert stored.url == entry.url
+
+    def test_delete_and_clear(self, tmpdir):
+        """Show that entries can be removed."""
+        store = cache.SQLiteCache(str(tmpdir.join('cache.sqlite')))
+        entry = cache.CacheEntry.from_response(build_response(ETag='"a"'))
+        store.set('one', entry)
+        store.set('two', entry)
+        store.delete('one')
+        assert store.get('one') is None
+        store.clear()
+        assert store.get('two') is None
+
+
+class TestGitHubSessionCache:
+    def build_session(self):
+        s = session.GitHubSession()
+        s.cache = cache.DictCache()
+        return s
+
+    @mock.patch.object(requests.Session, 'send')
+    def test_stores_responses_with_validators(self, send_mock):
+        """Show that successful responses with an ETag are stored."""
+        send_mock.return_value = build_response(ETag='"abc"')
+        s = self.build_session()
+        s.send(build_request())
+        assert len(s.cache._entries) == 1
+
+    @mock.patch.object(requests.Session, 'send')
+    def test_sends_conditional_requests(self, send_mock):
+        """Show that stored validators are sent and 304s are served."""
+        s = self.build_session()
+        send_mock.return_value = build_response(ETag='"abc"')
+        s.send(build_request())
+
+        send_mock.return_value = build_response(304, b'')
+        response = s.send(build_request())
+
+        request = send_mock.call_args[0][0]
+        assert request.headers['If-None-Match'] == '"abc"'
+        assert response.status_code == 200
+        assert response.json() == {'login': 'octocat'}
+
+    @mock.patch.object(requests.Session, 'send')
+    def test_leaves_caller_conditional_requests_alone(self, send_mock):
+        """Show that explicit conditional requests still see the 304."""
+        s = self.build_session()
+        send_mock.return_value = build_response(ETag='"abc"')
+        s.send(build_request())
+
+        send_mock.return_value = build_response(304, b'')
+        response = s.send(build_request(**{'If-None-Match': '"xyz"'}))
+        assert response.status_code == 304
+
+    @mock.patch.object(requests.Session, 'send')
+    def test_ignores_other_methods(self, send_mock):
+        """Show that only GET requests are cached."""
+        s = self.build_session()
+        send_mock.return_value = build_response(ETag='"abc"')
+        request = requests.Request('POST', 'https://api.github.com/gists',
+                                   data='{}').prepare()
+        s.send(request)
+        assert s.cache._entries == {}
@@ -0,0 +1,84 @@
+"""Unit tests for the JSON codecs."""
+import pytest
+
+from github3 import codec, session
+from github3.models import GitHubCore
+from .helper import mock
+
+
+class RecordingCodec(codec.JSONCodec):
+    name = 'recording'
+
+    def __init__(self):
+        self.decoded = []
+        self.encoded = []
+
+    def loads(self, data):
+        self.decoded.append(data)
+        return super(RecordingCodec, self).loads(data)
+
+    def dumps(self, obj):
+        self.encoded.append(obj)
+        return super(RecordingCodec, self).dumps(obj)
+
+
+class TestJSONCodec:
+    def test_loads_bytes_and_text(self):
+        json_codec = codec.JSONCodec()
+        assert json_codec.loads(b'{"a": [1, 2]}') == {'a': [1, 2]}
+        assert json_codec.loads('{"a": "b"}') == {'a': 'b'}
+
+    def test_dumps(self):
+        assert codec.JSONCodec().dumps({'a': 1}) == '{"a": 1}'
+
+    def test_codec_for(self):
+        assert isinstance(codec.codec_for('json'), codec.JSONCodec)
+        with pytest.raises(ValueError):
+            codec.codec_for('yaml')
+
+    def test_fastest_codec_is_available(self):
+        assert type(codec.fastest_codec()) in codec.CODECS
+
+
+class TestOrjsonCodec:
+    def test_round_trip(self):
+        pytest.importorskip('orjson')
+        orjson_codec = codec.OrjsonCodec()
+        assert orjson_codec.loads(b'{"a": 1}') == {'a': 1}
+        assert orjson_codec.dumps({'a': 1}) == '{"a":1}'
+
+
+class TestModelsUseSessionCodec:
+    def build_model(self):
+        s = session.GitHubSession()
+        s.codec = RecordingCodec()
+        return GitHubCore({'url': 'https://api.github.com/users/a'}, s)
+
+    def test_json_decodes_content(self):
+        """Show that responses are decoded from their content."""
+        model = self.build_model()
+        response = mock.Mock(status_code=200, content=b'{"login": "a"}',
+                             headers={})
+        assert model._json(response, 200) == {'login': 'a'}
+        assert model.session.codec.decoded == [b'{"login": "a"}']
+        assert response.json.called is False
+
+    def test_as_json_and_request_bodies(self):
+        model = self.build_model()
+        assert model.as_json() == '{"url": "https://api.github.com/users/a"}'
+        model._dumps({'body': 'text'})
+        assert model.session.codec.encoded[-1] == {'body': 'text'}
+
+    def test_from_json(self):
+        s = session.GitHubSession()
+        s.codec = RecordingCodec()
+        model = GitHubCore.from_json(b'{"url": "u"}', s)
+        assert model.session is s
+        assert s.codec.decoded == [b'{"url": "u"}']
+
+    def test_without_codec(self):
+        """Show that requests decodes the response without a codec."""
+        model = GitHubCore({}, session.GitHubSession())
+        response = mock.Mock(status_code=200, content=b'{}', headers={})
+        response.json.return_value = {'login': 'a'}
+        assert model._json(response, 200) == {'login': 'a'}
@@ -0,0 +1,106 @@
+"""Unit tests for the compact representations."""
+import pickle
+
+from github3 import compact
+from github3.events import Event
+from github3.issues import Issue
+from github3.search import RepositorySearchResult
+from github3.structs import GitHubIterator
+from github3.users import ShortUser
+
+from . import helper
+
+get_event_example_data = helper.create_example_data_helper('event_example')
+get_issue_example_data = helper.create_example_data_helper('issue_example')
+get_repo_example_data = helper.create_example_data_helper('repo_example')
+get_user_example_data = helper.create_example_data_helper('user_example')
+
+
+class TestCompactUser:
+    def test_has_no_instance_dict(self):
+        """Show that compact objects are slotted."""
+        user = compact.CompactUser(get_user_example_data())
+        assert not hasattr(user, '__dict__')
+        assert user.login == 'octocat'
+
+    def test_drops_json(self):
+        user = compact.CompactUser(get_user_example_data(), keep_json=False)
+        assert user._json_data is None
+
+    def test_equality_and_pickling(self):
+        data = get_user_example_data()
+        user = compact.CompactUser(data)
+        clone = pickle.loads(pickle.dumps(user))
+        assert clone == user
+        assert hash(clone) == hash(user)
+        assert clone.as_dict() == user.as_dict()
+
+
+class TestCompactEvent:
+    def test_attributes(self):
+        data = get_event_example_data()
+        event = compact.CompactEvent(data)
+        assert event.type == data['type']
+        assert event.actor.login == data['actor']['login']
+        assert event.repo == tuple(data['repo']['name'].split('/'))
+        assert event.created_at == Event(data).created_at
+        assert event.payload == data['payload']
+
+
+class TestCompactIssue:
+    def test_attributes(self):
+        data = get_issue_example_data()
+        issue = compact.CompactIssue(data)
+        assert issue.number == data['number']
+        assert issue.labels == tuple(label['name']
+                                     for label in data['labels'])
+        assert issue.milestone == data['milestone']['number']
+        assert issue.user.login == data['user']['login']
+        assert issue.as_dict()['user'] == issue.user.as_dict()
+
+
+class TestCompactRepositorySearchResult:
+    def test_attributes(self):
+        data = get_repo_example_data()
+        data['score'] = 12.5
+        result = compact.CompactRepositorySearchResult(data)
+        assert result.score == 12.5
+        assert result.full_name == data['full_name']
+        assert result.owner.login == data['owner']['login']
+
+
+class TestCompactClasses:
+    def test_high_volume_models_have_compact_classes(self):
+        assert ShortUser._compact_class is compact.CompactUser
+        assert Event._compact_class is compact.CompactEvent
+        assert Issue._compact_class is compact.CompactIssue
+        assert RepositorySearchResult._compact_class is (
+            compact.CompactRepositorySearchResult
+        )
+
+
+class TestGitHubIteratorCompact(helper.UnitHelper):
+    described_class = GitHubIterator
+
+    def create_instance_of_described_class(self):
+        return self.described_class(count=-1,
+                                    url='https://api.github.com/users',
+                                    cls=ShortUser, session=self.session)
+
+    def respond_with(self, items):
+        self.session.get.return_value = helper.mock.Mock(
+            status_code=200, json=lambda: items, links={}, headers={}
+        )
+
+    def test_yields_compact_objects(self):
+        """Show that compact mode yields compact representations."""
+        self.respond_with([get_user_example_data()])
+        self.instance.compact = True
+        self.instance.keep_json = False
+        users = list(self.instance)
+        assert isinstance(users[0], compact.CompactUser)
+        assert users[0]._json_data is None
+
+    def test_yields_full_models_by_default(self):
+        self.respond_with([get_user_example_data()])
+        assert isinstance(next(iter(self.instance)), ShortUser)
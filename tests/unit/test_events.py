@@ -1,3 +1,5 @@
+import json
+
 import github3
 from unittest import TestCase
 from .helper import UnitHelper
@@ -41,6 +43,65 @@ class TestEvent(UnitHelper):
         assert isinstance(event.org, github3.orgs.Organization)
 
 
+class TestEventPayload(TestCase):
+
+    def build_event(self, event_type='PullRequestEvent'):
+        json = get_example_data()
+        json['type'] = event_type
+        json['payload'] = {
+            'action': 'opened',
+            'pull_request': get_pull_request_example_data(),
+        }
+        return github3.events.Event(json)
+
+    def test_payload_is_converted_when_read(self):
+        """Show that payload objects are only built on access."""
+        event = self.build_event()
+        assert event.payload._pending == {'action', 'pull_request'}
+        pull = event.payload['pull_request']
+        assert isinstance(pull, github3.pulls.PullRequest)
+        assert event.payload['pull_request'] is pull
+        assert event.payload['action'] == 'opened'
+
+    def test_payload_does_not_modify_json(self):
+        """Show that the original JSON is left untouched."""
+        event = self.build_event()
+        event.payload['pull_request']
+        assert isinstance(event.as_dict()['payload']['pull_request'], dict)
+        assert event.payload.as_dict() is event.as_dict()['payload']
+
+    def test_payload_is_a_dict(self):
+        """Show that the payload can be serialized and modified in place."""
+        event = self.build_event()
+        payload = event.payload
+        assert isinstance(payload, dict)
+        payload['action'] = 'closed'
+        assert payload['action'] == 'closed'
+        del payload['action']
+        assert list(payload) == ['pull_request']
+        assert event.as_dict()['payload']['action'] == 'opened'
+        converted = payload.copy()
+        assert type(converted) is dict
+        assert isinstance(converted['pull_request'],
+                          github3.pulls.PullRequest)
+
+    def test_payload_copies_are_converted(self):
+        """Show that every way of reading the values converts them."""
+        def keywords(**kwargs):
+            return kwargs
+
+        copies = [dict, lambda p: keywords(**p), lambda p: dict(p.items()),
+                  lambda p: dict(zip(p, p.values()))]
+        for copy in copies:
+            pull = copy(self.build_event().payload)['pull_request']
+            assert isinstance(pull, github3.pulls.PullRequest)
+
+    def test_payload_is_serializable(self):
+        """Show that payloads without objects can be dumped as JSON."""
+        payload = self.build_event('WatchEvent').payload
+        assert json.loads(json.dumps(payload)) == payload.as_dict()
+
+
 class TestPayLoadHandlers(TestCase):
 
     def test_commitcomment(self):
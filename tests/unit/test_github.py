@@ -246,6 +246,15 @@ class TestGitHub(helper.UnitHelper):
             url_for('repos/owner/repo/issues/1')
         )
 
+    def test_issues_for(self):
+        """Test that many issues are retrieved in one batch."""
+        refs = [('owner', 'repo', 1), ('owner', 'repo', 2)]
+        results = list(self.instance.issues_for(refs))
+
+        assert [r.key for r in results] == refs
+        self.session.get.assert_any_call(url_for('repos/owner/repo/issues/2'))
+        assert self.session.get.call_count == 2
+
     def test_issue_requires_username(self):
         """Test GitHub#issue requires a non-None username."""
         self.instance.issue(None, 'foo', 1)
@@ -300,6 +309,17 @@ class TestGitHub(helper.UnitHelper):
             callback
         )
 
+    def test_mark_notifications(self):
+        """Verify the request for marking all notifications as read."""
+        self.instance.mark_notifications('2012-10-09T23:39:01Z')
+        self.put_called_with(
+            url_for('notifications'),
+            data={
+                'read': True,
+                'last_read_at': '2012-10-09T23:39:01Z'
+            }
+        )
+
     def test_markdown(self):
         """Verify the request for rendering a markdown document."""
         self.session.post.return_value = helper.mock.Mock(
@@ -535,6 +555,18 @@ class TestGitHub(helper.UnitHelper):
             headers={'Accept': 'application/vnd.github.drax-preview+json'}
         )
 
+    def test_repositories_for(self):
+        """Test that many repositories are retrieved in one batch."""
+        pairs = [('user', 'repo'), ('other', 'repo')]
+        results = list(self.instance.repositories_for(pairs, workers=2))
+
+        assert [r.key for r in results] == pairs
+        self.session.get.assert_any_call(
+            url_for('repos/other/repo'),
+            headers={'Accept': 'application/vnd.github.drax-preview+json'}
+        )
+        assert self.session.get.call_count == 2
+
     def test_repository_with_invalid_repo(self):
         """Verify there is no call made for invalid repo combos."""
         self.instance.repository('user', None)
@@ -643,6 +675,14 @@ class TestGitHub(helper.UnitHelper):
             url_for('users/username'),
         )
 
+    def test_users_for(self):
+        """Test that many users are retrieved in one batch."""
+        results = list(self.instance.users_for(['a', 'b'], ordered=False))
+
+        assert sorted(r.key for r in results) == ['a', 'b']
+        self.session.get.assert_any_call(url_for('users/a'))
+        self.session.get.assert_any_call(url_for('users/b'))
+
     def test_user_with_id(self):
         """Test that any user's information can be retrieved by id."""
         self.instance.user_with_id(10)
@@ -672,6 +712,13 @@ class TestGitHub(helper.UnitHelper):
             'User-Agent': 'github3py'
         })
 
+    def test_sharded_search(self):
+        """Verify that sharded searches split along the given qualifier."""
+        search = self.instance.sharded_search('repositories', 'org:github',
+                                              'stars')
+        assert search.url == url_for('search/repositories')
+        assert str(search.root) == 'stars:0..*'
+
     def test_star_required_username_and_repo(self):
         assert self.instance.star(username='', repo='') is False
 
@@ -1296,6 +1343,10 @@ class TestGitHubRequiresAuthentication(
         """Show that one needs to authenticate to use #keys."""
         self.assert_requires_auth(self.instance.keys)
 
+    def test_mark_notifications(self):
+        """Show that GitHub#mark_notifications requires authentication."""
+        self.assert_requires_auth(self.instance.mark_notifications)
+
     def test_me(self):
         """Show that GitHub#me requires authentication."""
         self.assert_requires_auth(self.instance.me)
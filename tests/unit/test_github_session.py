@@ -40,9 +40,38 @@ class TestGitHubSession:
         """Test that building a URL caches it"""
         s = self.build_session()
         url = s.build_url('gists', '123456', 'history')
-        url_parts = ('https://api.github.com', 'gists', '123456', 'history')
-        assert url_parts in session.__url_cache__
-        assert url in session.__url_cache__.values()
+        key = ('https://api.github.com', ('gists', '123456', 'history'))
+        assert key in s.url_cache
+        assert s.url_cache.misses == 1
+        assert s.build_url('gists', '123456', 'history') == url
+        assert s.url_cache.hits == 1
+
+    def test_build_url_caches_per_session(self):
+        """Test that sessions do not share their URL caches"""
+        s = self.build_session()
+        s.build_url('gists', '123456', 'history')
+        assert len(self.build_session().url_cache) == 0
+
+    def test_url_cache_evicts_least_recently_used(self):
+        """Test that the URL cache does not grow past its maximum size"""
+        cache = session.URLCache(maxsize=2)
+        cache.get('a', lambda: 'a')
+        cache.get('b', lambda: 'b')
+        cache.get('a', lambda: 'a')
+        cache.get('c', lambda: 'c')
+        assert len(cache) == 2
+        assert 'a' in cache
+        assert 'b' not in cache
+
+    def test_build_route(self):
+        """Test that routes are expanded against the base URL"""
+        s = self.build_session('https://enterprise.customer.com')
+        route = session.Route('repos/{owner}/{repo}/issues/{number}')
+        url = s.build_route(route, owner='o', repo='r', number=5)
+        assert url == 'https://enterprise.customer.com/repos/o/r/issues/5'
+        url = s.build_route(route, owner='o', repo='r', number=5,
+                            base_url='https://api.github.com')
+        assert url == 'https://api.github.com/repos/o/r/issues/5'
 
     def test_build_url_uses_a_different_base(self):
         """Test that you can pass in a different base URL to build_url"""
@@ -251,3 +280,23 @@ class TestGitHubSession:
 
         assert loaded.base_url == s.base_url
         assert loaded.two_factor_auth_cb == s.two_factor_auth_cb
+
+    def test_pickled_sessions_work(self):
+        """Show that unpickled sessions build URLs and send requests."""
+        s = self.build_session()
+        s.token_pool_auth(['a', 'b'])
+        s.request_hooks.append(mock.Mock())
+        loaded = pickle.loads(pickle.dumps(s, pickle.HIGHEST_PROTOCOL))
+
+        assert loaded.build_url('users') == 'https://api.github.com/users'
+        assert loaded.token_pool.tokens == ['a', 'b']
+        assert loaded.request_hooks == []
+        response = mock.Mock(status_code=200, headers={}, history=[])
+        with mock.patch.object(requests.Session, 'send',
+                               return_value=response) as send:
+            assert loaded.request('GET', 'https://api.github.com/users') is (
+                response
+            )
+        request = send.call_args[0][0]
+        assert request.headers['Authorization'] in ('token a', 'token b')
+        assert loaded.request_counter == 1
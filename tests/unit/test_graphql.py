@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for looking objects up with GitHub's GraphQL API."""
+import pytest
+
+from github3 import exceptions, graphql
+from github3.standin import StandInServer
+
+OWNER = {
+    '__typename': 'User',
+    'login': 'sigmavirus24',
+    'databaseId': 240830,
+    'avatarUrl': 'https://avatars.githubusercontent.com/u/240830',
+    'url': 'https://github.com/sigmavirus24',
+}
+
+REPOSITORY = {
+    'databaseId': 3710711,
+    'name': 'github3.py',
+    'nameWithOwner': 'sigmavirus24/github3.py',
+    'description': 'Python library for interfacing with the GitHub APIv3',
+    'url': 'https://github.com/sigmavirus24/github3.py',
+    'isPrivate': False,
+    'isFork': False,
+    'createdAt': '2012-03-13T19:58:53Z',
+    'forkCount': 180,
+    'owner': OWNER,
+    'primaryLanguage': {'name': 'Python'},
+    'defaultBranchRef': {'name': 'develop'},
+    'stargazers': {'totalCount': 620},
+    'watchers': {'totalCount': 40},
+    'issues': {'totalCount': 70},
+    'pullRequests': {'totalCount': 12},
+    'latestRelease': {
+        'databaseId': 76677,
+        'name': 'v0.9.5',
+        'tagName': 'v0.9.5',
+        'isDraft': False,
+        'isPrerelease': False,
+        'publishedAt': '2016-02-04T01:48:21Z',
+        'url': 'https://github.com/sigmavirus24/github3.py/releases/v0.9.5',
+    },
+    'languages': {'edges': [
+        {'size': 820000, 'node': {'name': 'Python'}},
+        {'size': 1200, 'node': {'name': 'Makefile'}},
+    ]},
+}
+
+ISSUE = {
+    'databaseId': 28,
+    'number': 1,
+    'title': 'Migrate to the new API',
+    'state': 'CLOSED',
+    'url': 'https://github.com/sigmavirus24/github3.py/issues/1',
+    'author': OWNER,
+    'assignees': {'nodes': [OWNER]},
+    'labels': {'nodes': [{'name': 'bug', 'color': 'fc2929'}]},
+    'milestone': {'number': 2, 'title': '1.0', 'state': 'OPEN'},
+    'comments': {'totalCount': 3},
+}
+
+
+def not_found(path):
+    return {
+        'type': 'NOT_FOUND',
+        'path': path,
+        'message': 'Could not resolve to a Repository.',
+    }
+
+
+class TestBuildQuery:
+    def test_aliases_and_variables(self):
+        """Show that every key gets an alias and its own variables."""
+        query, variables = graphql.build_query(
+            graphql.REPOSITORIES, [('a', 'b'), ('c', 'd')], languages=3
+        )
+        assert variables == {'languages': 3, 'owner0': 'a', 'name0': 'b',
+                             'owner1': 'c', 'name1': 'd'}
+        assert query.startswith(
+            'query($languages: Int!, $owner0: String!, $name0: String!, '
+            '$owner1: String!, $name1: String!) {'
+        )
+        assert 'r1: repository(owner: $owner1, name: $name1)' in query
+        assert 'fragment repository on Repository' in query
+        assert 'fragment actor on Actor' in query
+
+    def test_single_values(self):
+        query, variables = graphql.build_query(graphql.USERS, ['octocat'])
+        assert variables == {'login0': 'octocat'}
+        assert 'r0: user(login: $login0) { ...user }' in query
+        assert 'fragment actor' not in query
+
+
+class TestGraphQLURL:
+    @pytest.mark.parametrize('base_url, url', [
+        ('https://api.github.com', 'https://api.github.com/graphql'),
+        ('https://example.com/api/v3', 'https://example.com/api/graphql'),
+    ])
+    def test_urls(self, base_url, url):
+        assert graphql.graphql_url(base_url) == url
+
+
+class TestHydrate:
+    def setup_method(self, method):
+        self.server = StandInServer()
+        self.server.start()
+        self.gh = self.server.github('token')
+
+    def teardown_method(self, method):
+        self.gh.session.close()
+        self.server.stop()
+
+    def respond(self, data, errors=None):
+        document = {'data': data}
+        if errors:
+            document['errors'] = errors
+        self.server.add('/graphql', document, method='POST')
+
+    def test_repositories(self):
+        """Show that repositories come with their sub-resources."""
+        self.respond({'r0': REPOSITORY, 'r1': None},
+                     [not_found(['r1'])])
+        results = list(self.gh.hydrate_repositories(
+            [('sigmavirus24', 'github3.py'), ('sigmavirus24', 'missing')]
+        ))
+        assert self.server.request_count == 1
+        assert [r.key for r in results] == [
+            ('sigmavirus24', 'github3.py'), ('sigmavirus24', 'missing')
+        ]
+
+        repository = results[0].result
+        assert repository.full_name == 'sigmavirus24/github3.py'
+        assert repository._api == (
+            self.server.url + '/repos/sigmavirus24/github3.py'
+        )
+        assert repository.owner.login == 'sigmavirus24'
+        assert repository.stargazers_count == 620
+        assert repository.open_issues_count == 82
+        assert repository.open_pull_requests_count == 12
+        assert repository.recent_release.tag_name == 'v0.9.5'
+        assert repository.top_languages == [('Python', 820000),
+                                            ('Makefile', 1200)]
+        assert results[1].result is None
+        assert results[1].exception is None
+
+    def test_issues(self):
+        self.respond({'r0': {'issue': ISSUE}})
+        result, = self.gh.hydrate_issues([('sigmavirus24', 'github3.py', 1)])
+        issue = result.result
+        assert issue.number == 1
+        assert issue.state == 'closed'
+        assert issue.repository == ('sigmavirus24', 'github3.py')
+        assert issue.user.login == 'sigmavirus24'
+        assert [label.name for label in issue.original_labels] == ['bug']
+        assert issue.milestone.number == 2
+        assert issue.comments_count == 3
+
+    def test_pull_requests(self):
+        pull = dict(ISSUE, state='MERGED', merged=True, mergeable='MERGEABLE',
+                    url='https://github.com/sigmavirus24/github3.py/pull/1',
+                    baseRefName='develop', baseRepository=REPOSITORY)
+        self.respond({'r0': {'pullRequest': pull}})
+        result, = self.gh.hydrate_pull_requests(
+            [('sigmavirus24', 'github3.py', 1)]
+        )
+        pull = result.result
+        assert pull.state == 'closed'
+        assert pull.merged is True
+        assert pull.mergeable is True
+        assert pull.base.ref == 'develop'
+        assert pull.repository == ('sigmavirus24', 'github3.py')
+        assert pull._api.endswith('/repos/sigmavirus24/github3.py/pulls/1')
+
+    def test_users(self):
+        self.respond({'r0': dict(OWNER, name='Ian Cordasco', email='',
+                                 followers={'totalCount': 900})})
+        result, = self.gh.hydrate_users(['sigmavirus24'])
+        user = result.result
+        assert user.login == 'sigmavirus24'
+        assert user.name == 'Ian Cordasco'
+        assert user.email is None
+        assert user.followers_count == 900
+
+    def test_chunks(self):
+        """Show that a query is sent per chunk of keys."""
+        self.respond({'r0': dict(OWNER, name='Ian Cordasco')})
+        results = list(self.gh.hydrate_users(['a', 'b', 'c'], chunk_size=2))
+        assert self.server.request_count == 2
+        assert [r.key for r in results] == ['a', 'b', 'c']
+        assert [r.ok for r in results] == [True, False, True]
+
+    def test_errors_of_one_object(self):
+        """Show that errors are reported for the object they concern."""
+        self.respond({'r0': None, 'r1': dict(OWNER, name='Ian Cordasco')}, [{
+            'type': 'FORBIDDEN',
+            'path': ['r0'],
+            'message': 'Resource protected by organization SAML',
+        }])
+        first, second = self.gh.hydrate_users(['a', 'b'])
+        assert isinstance(first.exception, exceptions.GraphQLError)
+        assert first.exception.msg == 'Resource protected by organization SAML'
+        assert second.ok
+
+    def test_errors_of_the_query(self):
+        """Show that every object of a failed query gets its error."""
+        self.respond(None, [{'message': 'Parse error'}])
+        results = list(self.gh.hydrate_users(['a', 'b']))
+        assert [str(r.exception.msg) for r in results] == ['Parse error'] * 2
+
+    def test_graphql(self):
+        self.respond({'viewer': {'login': 'sigmavirus24'}})
+        data = self.gh.graphql('{ viewer { login } }')
+        assert data == {'viewer': {'login': 'sigmavirus24'}}
+
+    def test_graphql_errors(self):
+        self.respond({'r0': None}, [not_found(['r0'])])
+        with pytest.raises(exceptions.GraphQLError):
+            self.gh.graphql('{ r0: repository(owner: "a", name: "b") { id } }')
+
+    def test_requires_auth(self):
+        gh = self.server.github()
+        with pytest.raises(exceptions.AuthenticationFailed):
+            gh.hydrate_users(['sigmavirus24'])
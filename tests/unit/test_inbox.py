@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the notification inbox."""
+import pytest
+
+from github3 import exceptions, inbox
+from github3.github import GitHub
+from github3.models import GitHubCore
+from github3.repos import Repository
+from github3.standin import StandInServer
+from .helper import mock
+
+
+def thread(id, updated_at, repository='a/b'):
+    return {
+        'id': str(id),
+        'url': 'https://api.github.com/notifications/threads/{0}'.format(id),
+        'unread': True,
+        'reason': 'mention',
+        'updated_at': '2016-01-0{0}T00:00:00Z'.format(updated_at),
+        'last_read_at': None,
+        'subject': {'title': 'Thread {0}'.format(id)},
+        'repository': {
+            'id': 1,
+            'name': repository.split('/')[1],
+            'full_name': repository,
+            'owner': {'login': repository.split('/')[0]},
+            'url': 'https://api.github.com/repos/' + repository,
+        },
+    }
+
+
+class TestInbox:
+    @pytest.fixture(autouse=True)
+    def server(self, monkeypatch):
+        # Other unit tests replace GitHub._build_url
+        monkeypatch.setattr(GitHub, '_build_url', GitHubCore._build_url)
+        self.server = StandInServer(poll_interval=30, per_page=2)
+        self.server.add('/notifications', [thread(1, 1), thread(2, 2),
+                                           thread(3, 3, 'a/c')])
+        for path in ('/notifications', '/repos/a/b/notifications'):
+            self.server.add(path, {}, method='PUT', status=205)
+        self.server.start()
+        self.gh = self.server.github('token')
+        yield
+        self.gh.session.close()
+        self.server.stop()
+
+    def test_syncs_conditionally(self):
+        """Show that every page is indexed and unchanged listings are
+        answered with 304."""
+        received = []
+        box = inbox.Inbox(self.gh)
+        box.callbacks.append(lambda t: received.append(t.id))
+
+        assert [t.id for t in box.sync()] == ['1', '2', '3']
+        assert received == ['1', '2', '3']
+        assert sorted(box.unread) == ['1', '2', '3']
+        assert box.interval == 30
+        assert box.last_modified is not None
+
+        count = self.server.request_count
+        assert box.sync() == []
+        assert self.server.request_count == count + 1
+        assert self.server.status_counts[304] == 1
+
+    def test_indexes_changes(self):
+        """Show that updated threads are dispatched again and read ones
+        leave the index."""
+        box = inbox.Inbox(self.gh)
+        box.sync()
+        self.server.add('/notifications', [thread(1, 4), thread(3, 3, 'a/c')])
+        assert [t.id for t in box.sync()] == ['1']
+        assert sorted(box.unread) == ['1', '3']
+
+    def test_marks_everything_at_once(self):
+        box = inbox.Inbox(self.gh)
+        box.sync()
+        count = self.server.request_count
+        assert len(box.mark_read()) == 3
+        assert self.server.request_count == count + 1
+        assert box.unread == {}
+
+        # Marked threads GitHub still lists are not indexed again
+        assert box.sync() == []
+        assert box.unread == {}
+
+    def test_marks_repositories_in_bulk(self):
+        """Show that threads are marked per repository up to the last of
+        them."""
+        box = inbox.Inbox(self.gh)
+        box.sync()
+        selected = [box.unread['1'], box.unread['2']]
+        with mock.patch.object(Repository, 'mark_notifications',
+                               return_value=True) as mark:
+            assert box.mark_read(selected) == selected
+        mark.assert_called_once_with('2016-01-02T00:00:00Z')
+        assert list(box.unread) == ['3']
+
+    def test_marks_threads_one_by_one_when_needed(self):
+        """Show that bulk marking never marks threads not selected."""
+        box = inbox.Inbox(self.gh)
+        box.sync()
+        selected = box.unread['2']
+        with mock.patch.object(Repository, 'mark_notifications') as bulk:
+            with mock.patch.object(selected, 'mark',
+                                   return_value=True) as mark:
+                assert box.mark_read([selected]) == [selected]
+        assert bulk.called is False
+        mark.assert_called_once_with()
+
+    def test_participating_inboxes_mark_threads_one_by_one(self):
+        """Show that bulk marking is not used when the index does not hold
+        every notification it would mark."""
+        box = inbox.Inbox(self.gh, participating=True)
+        box.sync()
+        with mock.patch.object(GitHub, 'mark_notifications') as everything:
+            with mock.patch.object(Repository,
+                                   'mark_notifications') as bulk:
+                with mock.patch('github3.notifications.Thread.mark',
+                                return_value=True) as mark:
+                    assert len(box.mark_read()) == 3
+        assert everything.called is False
+        assert bulk.called is False
+        assert mark.call_count == 3
+
+    def test_repository_inbox(self):
+        self.server.add('/repos/a/b/notifications', [thread(1, 1)])
+        repository = Repository(thread(1, 1)['repository'], self.gh)
+        repository._api = self.server.url + '/repos/a/b'
+        box = inbox.Inbox(self.gh, repository)
+        box.sync()
+        assert box.url == self.server.url + '/repos/a/b/notifications'
+        assert len(box.mark_read()) == 1
+
+    def test_failed_syncs_raise(self):
+        self.server.add('/notifications', {'message': 'Nope'}, status=401)
+        with pytest.raises(exceptions.AuthenticationFailed):
+            inbox.Inbox(self.gh).sync()
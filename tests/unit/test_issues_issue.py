@@ -89,6 +89,13 @@ class TestIssue(helper.UnitHelper):
     described_class = github3.issues.Issue
     example_data = get_issue_example_data()
 
+    def test_labels_urlt(self):
+        """Verify that the labels URL template is built when used."""
+        assert 'labels_urlt' not in vars(self.instance)
+        assert self.instance.labels_urlt.expand(name='bug') == url_for(
+            'labels/bug'
+        )
+
     def test_add_labels(self):
         """Verify the request for adding a label."""
         self.instance.add_labels('enhancement')
@@ -0,0 +1,164 @@
+"""Unit tests for request instrumentation."""
+import pytest
+import requests
+
+from github3 import metrics, session
+from .helper import mock
+
+
+def build_response(status_code=200, body=b'{"login": "octocat"}',
+                   **headers):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    response._content = body
+    response.url = 'https://api.github.com/users/octocat'
+    return response
+
+
+class TestNormalizeRoute:
+    @pytest.mark.parametrize('path, route', [
+        ('/repos/a/b', '/repos/{owner}/{repo}'),
+        ('/repos/a/b/issues/1', '/repos/{owner}/{repo}/issues/{number}'),
+        ('/repos/a/b/issues/comments/12',
+         '/repos/{owner}/{repo}/issues/comments/{id}'),
+        ('/repos/a/b/branches/main',
+         '/repos/{owner}/{repo}/branches/{branch}'),
+        ('/repos/a/b/contents/docs/index.rst',
+         '/repos/{owner}/{repo}/contents/{path}'),
+        ('/repos/a/b/git/refs/heads/master',
+         '/repos/{owner}/{repo}/git/refs/{ref}'),
+        ('/repos/a/b/commits/' + 'f' * 40,
+         '/repos/{owner}/{repo}/commits/{sha}'),
+        ('/users/octocat/repos', '/users/{username}/repos'),
+        ('/orgs/github/members/octocat', '/orgs/{org}/members/{username}'),
+        ('/user/starred/a/b', '/user/starred/{owner}/{repo}'),
+        ('/gists/public', '/gists/public'),
+        ('/gists/aa5a315d61ae9438b18d', '/gists/{gist_id}'),
+        ('/search/repositories', '/search/repositories'),
+        ('/api/v3/repos/a/b', '/repos/{owner}/{repo}'),
+    ])
+    def test_routes(self, path, route):
+        url = 'https://api.github.com{0}?per_page=100'.format(path)
+        assert metrics.normalize_route(url) == route
+
+
+class TestRequestEvent:
+    def test_reads_the_response(self):
+        response = build_response(**{
+            'X-RateLimit-Limit': '5000',
+            'X-RateLimit-Remaining': '4999',
+            'X-RateLimit-Reset': '1372700873',
+        })
+        response.retries = 2
+        event = metrics.RequestEvent(
+            'get', 'https://api.github.com/users/octocat', response, 0.5
+        )
+        assert event.method == 'GET'
+        assert event.route == '/users/{username}'
+        assert event.status_code == 200
+        assert event.bytes_received == len(response.content)
+        assert event.retries == 2
+        assert event.rate_limit == 5000
+        assert event.rate_limit_remaining == 4999
+        assert event.rate_limit_reset == 1372700873
+        assert event.resource == 'core'
+        assert event.quota_spent == 1
+
+    def test_not_modified(self):
+        """Show that responses from the cache do not spend quota."""
+        response = build_response()
+        response.from_cache = True
+        event = metrics.RequestEvent(
+            'GET', 'https://api.github.com/users/octocat', response
+        )
+        assert event.not_modified is True
+        assert event.quota_spent == 0
+
+    def test_does_not_read_streamed_bodies(self):
+        response = mock.Mock(status_code=200, headers={'Content-Length': '9'})
+        event = metrics.RequestEvent(
+            'GET', 'https://api.github.com/users', response, stream=True
+        )
+        assert event.bytes_received == 9
+
+
+class TestRequestStats:
+    def test_aggregates_by_route(self):
+        stats = metrics.RequestStats(buckets=(0.1, 1.0))
+        for number, elapsed in [(1, 0.05), (2, 0.5)]:
+            stats(metrics.RequestEvent(
+                'GET', 'https://api.github.com/repos/a/b/issues/{0}'.format(
+                    number
+                ), build_response(**{'X-RateLimit-Remaining': '10'}), elapsed
+            ))
+        stats(metrics.RequestEvent('GET', 'https://api.github.com/users',
+                                   exception=ValueError()))
+
+        endpoint = stats.endpoints[
+            ('GET', '/repos/{owner}/{repo}/issues/{number}')
+        ]
+        assert endpoint.count == 2
+        assert endpoint.statuses == {200: 2}
+        assert endpoint.bucket_counts == [1, 1]
+        assert endpoint.mean_latency == pytest.approx(0.275)
+        assert endpoint.quota_spent == 2
+        assert stats.endpoints[('GET', '/users')].statuses == {None: 1}
+        assert stats.rate_limit_remaining == {'core': 10}
+        assert 'GET /users' in stats.as_dict()
+
+
+class TestGitHubSessionHooks:
+    @mock.patch.object(requests.Session, 'request')
+    def test_emits_events(self, request_mock):
+        """Show that every hook receives an event for every request."""
+        request_mock.return_value = build_response()
+        s = session.GitHubSession()
+        events = []
+        s.request_hooks.append(events.append)
+        s.request('GET', 'https://api.github.com/users/octocat')
+        assert len(events) == 1
+        assert events[0].route == '/users/{username}'
+        assert events[0].status_code == 200
+        assert events[0].elapsed >= 0
+
+    @mock.patch.object(requests.Session, 'request')
+    def test_emits_events_for_exceptions(self, request_mock):
+        request_mock.side_effect = requests.exceptions.ConnectionError()
+        s = session.GitHubSession()
+        events = []
+        s.request_hooks.append(events.append)
+        with pytest.raises(requests.exceptions.ConnectionError):
+            s.request('GET', 'https://api.github.com/users/octocat')
+        assert isinstance(events[0].exception,
+                          requests.exceptions.ConnectionError)
+        assert events[0].status_code is None
+
+    @mock.patch.object(requests.Session, 'request')
+    def test_failing_hooks_do_not_fail_requests(self, request_mock):
+        request_mock.return_value = build_response()
+        s = session.GitHubSession()
+        s.request_hooks.append(mock.Mock(side_effect=ValueError))
+        response = s.request('GET', 'https://api.github.com/users/octocat')
+        assert response.status_code == 200
+
+
+class TestPrometheusMetrics:
+    def test_exports_events(self):
+        prometheus = pytest.importorskip('prometheus_client')
+        registry = prometheus.CollectorRegistry()
+        hook = metrics.PrometheusMetrics(registry=registry)
+        hook(metrics.RequestEvent(
+            'GET', 'https://api.github.com/users/octocat',
+            build_response(**{'X-RateLimit-Remaining': '10'}), 0.2
+        ))
+        labels = {'method': 'GET', 'route': '/users/{username}'}
+        assert registry.get_sample_value(
+            'github3_requests_total', dict(labels, status='200')
+        ) == 1
+        assert registry.get_sample_value(
+            'github3_request_duration_seconds_count', labels
+        ) == 1
+        assert registry.get_sample_value(
+            'github3_rate_limit_remaining', {'resource': 'core'}
+        ) == 10
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for tree mirroring."""
+import base64
+import os
+
+import pytest
+
+from github3 import mirror
+from github3.repos import Repository
+from github3.standin import StandInServer
+
+FILES = {
+    'README.md': b'# Config\n',
+    'config/app.yml': b'debug: false\n',
+    'config/copy.yml': b'debug: false\n',
+    'bin/deploy': b'#!/bin/sh\n',
+}
+
+
+def entry(path, data, mode='100644'):
+    return {'path': path, 'mode': mode, 'type': 'blob', 'size': len(data),
+            'sha': mirror.blob_sha(data)}
+
+
+def blob(data):
+    return {'sha': mirror.blob_sha(data), 'size': len(data),
+            'encoding': 'base64',
+            'content': base64.b64encode(data).decode('ascii')}
+
+
+class TestBlobSha:
+    def test_matches_git(self):
+        """Show that SHAs are those of ``git hash-object``."""
+        assert mirror.blob_sha(b'hello\n') == (
+            'ce013625030ba8dba906f756967f9e9ca394464a'
+        )
+
+
+class TestTreeMirror:
+    @pytest.fixture(autouse=True)
+    def server(self, tmpdir):
+        self.server = StandInServer()
+        self.server.start()
+        self.gh = self.server.github()
+        self.repository = Repository({
+            'id': 1, 'name': 'b', 'full_name': 'a/b',
+            'owner': {'login': 'a'}, 'default_branch': 'master',
+            'url': self.server.url + '/repos/a/b',
+        }, self.gh)
+        self.destination = str(tmpdir.join('mirror'))
+        self.serve(FILES)
+        yield
+        self.gh.session.close()
+        self.server.stop()
+
+    def serve(self, files, modes=None):
+        modes = modes or {'bin/deploy': mirror.EXECUTABLE_MODE}
+        self.server.add('/repos/a/b/git/trees/master', {
+            'sha': 'tree', 'truncated': False,
+            'tree': [entry(path, data, modes.get(path, '100644'))
+                     for path, data in sorted(files.items())],
+        })
+        for data in files.values():
+            self.server.add('/repos/a/b/git/blobs/' + mirror.blob_sha(data),
+                            blob(data))
+
+    def read(self, path):
+        with open(os.path.join(self.destination, path), 'rb') as fd:
+            return fd.read()
+
+    def test_mirrors_the_tree(self):
+        """Show that every file is written with one request per blob."""
+        report = mirror.TreeMirror(self.repository, self.destination).sync()
+        assert report.ok
+        assert report.written == sorted(FILES)
+        assert self.server.request_count == 4
+        for path, data in FILES.items():
+            assert self.read(path) == data
+        if os.name == 'posix':
+            assert os.stat(os.path.join(self.destination, 'bin/deploy')
+                           ).st_mode & 0o111
+
+    def test_only_fetches_changes(self):
+        """Show that files whose SHA matches are not downloaded again."""
+        tree = mirror.TreeMirror(self.repository, self.destination)
+        tree.sync()
+        self.serve(dict(FILES, **{'config/app.yml': b'debug: true\n'}))
+        count = self.server.request_count
+        report = tree.sync()
+        assert report.written == ['config/app.yml']
+        assert report.unchanged == 3
+        assert self.server.request_count == count + 2
+        assert self.read('config/app.yml') == b'debug: true\n'
+
+    def test_repairs_local_changes(self):
+        tree = mirror.TreeMirror(self.repository, self.destination)
+        tree.sync()
+        with open(os.path.join(self.destination, 'README.md'), 'wb') as fd:
+            fd.write(b'edited')
+        assert tree.sync().written == ['README.md']
+        assert self.read('README.md') == FILES['README.md']
+
+    def test_copies_known_blobs(self):
+        """Show that renamed files are copied instead of downloaded."""
+        tree = mirror.TreeMirror(self.repository, self.destination)
+        tree.sync()
+        files = dict(FILES, **{'config/renamed.yml': b'# Config\n'})
+        self.serve(files)
+        count = self.server.request_count
+        assert tree.sync().written == ['config/renamed.yml']
+        assert self.server.request_count == count + 1
+
+    def test_patterns(self):
+        report = self.repository.mirror(self.destination,
+                                        patterns=['config/*'])
+        assert report.written == ['config/app.yml', 'config/copy.yml']
+        assert not os.path.exists(os.path.join(self.destination,
+                                               'README.md'))
+
+    def test_delete(self):
+        tree = mirror.TreeMirror(self.repository, self.destination,
+                                 delete=True)
+        tree.sync()
+        files = dict(FILES)
+        del files['config/copy.yml']
+        self.serve(files)
+        assert tree.sync().deleted == ['config/copy.yml']
+        assert not os.path.exists(os.path.join(self.destination,
+                                               'config/copy.yml'))
+
+    def test_failures_are_reported(self):
+        """Show that a blob that cannot be fetched does not stop the
+        others."""
+        files = dict(FILES, missing=b'gone')
+        self.serve(files)
+        self.server.add('/repos/a/b/git/blobs/' + mirror.blob_sha(b'gone'),
+                        {'message': 'Not Found'}, status=404)
+        report = mirror.TreeMirror(self.repository, self.destination).sync()
+        assert list(report.failed) == ['missing']
+        assert report.written == sorted(FILES)
+
+    def test_truncated_trees(self):
+        """Show that trees too large to list at once are walked."""
+        self.server.add('/repos/a/b/git/trees/master', {
+            'sha': 'root', 'truncated': True, 'tree': [],
+        })
+        self.server.add('/repos/a/b/git/trees/root', {'sha': 'root', 'tree': [
+            entry('README.md', FILES['README.md']),
+            {'path': 'config', 'type': 'tree', 'sha': 'config',
+             'mode': '040000'},
+        ]})
+        self.server.add('/repos/a/b/git/trees/config', {
+            'sha': 'config', 'tree': [entry('app.yml',
+                                            FILES['config/app.yml'])],
+        })
+        report = mirror.TreeMirror(self.repository, self.destination).sync()
+        assert report.sha == 'root'
+        assert report.written == ['README.md', 'config/app.yml']
+
+    @pytest.mark.skipif(not hasattr(os, 'symlink'), reason='No symlinks')
+    def test_never_writes_through_links(self, tmpdir):
+        """Show that a link left by an earlier tree is replaced by the
+        directory a later tree needs."""
+        outside = tmpdir.mkdir('outside')
+        tree = mirror.TreeMirror(self.repository, self.destination)
+        self.serve({'config': str(outside).encode('utf-8')},
+                   {'config': mirror.SYMLINK_MODE})
+        tree.sync()
+        assert os.path.islink(os.path.join(self.destination, 'config'))
+
+        self.serve(FILES)
+        report = tree.sync()
+        assert report.ok
+        assert outside.listdir() == []
+        assert not os.path.islink(os.path.join(self.destination, 'config'))
+        assert self.read('config/app.yml') == FILES['config/app.yml']
+        assert not [name for name in os.listdir(self.destination)
+                    if name.startswith(mirror.TEMPORARY_PREFIX)]
+
+    def test_unsafe_paths(self):
+        self.serve({'../escape': b'x'})
+        report = mirror.TreeMirror(self.repository, self.destination).sync()
+        assert list(report.failed) == ['../escape']
+        assert report.written == []
@@ -5,7 +5,7 @@ import requests
 
 from datetime import datetime, timedelta
 from github3 import exceptions, GitHubError
-from github3.models import GitHubCore
+from github3.models import GitHubCore, LazyAttribute, lazy_strptime_attribute
 from unittest import TestCase
 from . import helper
 
@@ -19,6 +19,19 @@ class MyTestRefreshClass(GitHubCore):
         self.etag = example_data['etag']
 
 
+class MyLazyClass(GitHubCore):
+    """Subclass for testing lazily computed attributes."""
+    created_at = lazy_strptime_attribute('created_at')
+
+    @LazyAttribute
+    def title(self, json):
+        return json['title'].upper()
+
+    def _update_attributes(self, json):
+        self._reset_lazy_attributes(json)
+        self.id = json['id']
+
+
 class TestGitHubError(TestCase):
     """Test methods on GitHubError class."""
 
@@ -237,3 +250,37 @@ class TestGitHubCoreIssue672(helper.UnitHelper):
         """Verify that _api property contains URL query"""
         assert '?' in self.instance._api
         assert self.instance._api == self.url
+
+
+class TestLazyAttribute(helper.UnitHelper):
+
+    described_class = MyLazyClass
+    example_data = {
+        'id': 1,
+        'title': 'first',
+        'created_at': '2016-02-19T12:34:56Z',
+    }
+
+    def test_not_computed_until_read(self):
+        """Verify that lazy attributes are left alone by the constructor."""
+        assert 'title' not in self.instance.__dict__
+        assert 'created_at' not in self.instance.__dict__
+
+    def test_computed_once(self):
+        """Verify that the computed value is stored on the instance."""
+        created_at = self.instance.created_at
+        assert created_at == datetime(2016, 2, 19, 12, 34, 56,
+                                      tzinfo=created_at.tzinfo)
+        assert self.instance.__dict__['created_at'] is created_at
+        assert self.instance.created_at is created_at
+
+    def test_recomputed_after_update(self):
+        """Verify that new JSON discards previously computed values."""
+        assert self.instance.title == 'FIRST'
+        self.instance._update_attributes({'id': 2, 'title': 'second'})
+        assert self.instance.title == 'SECOND'
+        assert self.instance.created_at is None
+
+    def test_class_access(self):
+        """Verify that the descriptor itself is returned from the class."""
+        assert isinstance(MyLazyClass.title, LazyAttribute)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the event poller."""
+try:
+    import queue
+except ImportError:  # (No coverage)
+    import Queue as queue
+
+import pytest
+
+from github3 import exceptions, poller
+from github3.standin import StandInServer
+
+
+def events(*ids):
+    """Build an event listing, newest first like GitHub's."""
+    return [{'id': str(i), 'type': 'WatchEvent', 'repo': {'name': 'a/b'},
+             'payload': {}} for i in sorted(ids, reverse=True)]
+
+
+class TestEventWindow:
+    def test_forgets_the_oldest_ids(self):
+        window = poller.EventWindow(size=2)
+        assert window.add('1') is True
+        assert window.add('1') is False
+        window.add('2')
+        window.add('3')
+        assert '1' not in window
+        assert len(window) == 2
+
+
+class TestEventPoller:
+    def setup_method(self, method):
+        self.server = StandInServer(poll_interval=30)
+        self.server.add('/repos/a/b/events', events(1, 2))
+        self.server.start()
+        self.gh = self.server.github()
+        self.url = self.server.url + '/repos/a/b/events'
+
+    def teardown_method(self, method):
+        self.gh.session.close()
+        self.server.stop()
+
+    def test_polls_conditionally(self):
+        """Show that only new events are dispatched and unchanged feeds are
+        answered with 304."""
+        received = []
+        p = poller.EventPoller(self.gh)
+        p.callbacks.append(lambda event, feed: received.append(event.id))
+        feed = p.watch(self.url)
+
+        assert p.poll(feed) == []
+        assert feed.interval == 30
+        assert feed.etag is not None
+        assert p.poll(feed) == []
+        assert feed.not_modified == 1
+
+        self.server.add('/repos/a/b/events', events(1, 2, 3, 4))
+        assert [e.id for e in p.poll(feed)] == ['3', '4']
+        assert received == ['3', '4']
+
+    def test_follows_pages_of_new_events(self):
+        """Show that events pushed off the first page between two polls are
+        not lost."""
+        p = poller.EventPoller(self.gh, per_page=2)
+        feed = p.watch(self.url)
+        p.poll(feed)
+        count = self.server.request_count
+
+        self.server.add('/repos/a/b/events', events(*range(1, 8)))
+        assert [e.id for e in p.poll(feed)] == ['3', '4', '5', '6', '7']
+        # The third page holds events seen before, the fourth is not read
+        assert self.server.request_count == count + 3
+
+    def test_backlog(self):
+        p = poller.EventPoller(self.gh, backlog=True)
+        assert [e.id for e in p.poll(p.watch(self.url))] == ['1', '2']
+
+    def test_dedupes_across_feeds(self):
+        """Show that the same event is dispatched once."""
+        self.server.add('/orgs/a/events', events(1, 2))
+        p = poller.EventPoller(self.gh, backlog=True)
+        p.poll(p.watch(self.url))
+        assert p.poll(p.watch(self.server.url + '/orgs/a/events')) == []
+
+    def test_watch_is_idempotent(self):
+        p = poller.EventPoller(self.gh)
+        assert p.watch(self.url) is p.watch(self.url)
+        assert len(p.feeds) == 1
+
+    def test_failed_polls_raise(self):
+        p = poller.EventPoller(self.gh)
+        with pytest.raises(exceptions.NotFoundError):
+            p.poll(p.watch(self.server.url + '/repos/a/missing/events'))
+
+    def test_run(self):
+        """Show that running pollers put new events on the queue and back
+        off from failing feeds."""
+        events_queue = queue.Queue()
+        errors = []
+        p = poller.EventPoller(self.gh, backlog=True, queue=events_queue)
+        p.error_callbacks.append(lambda exc, feed: errors.append(feed))
+        p.watch(self.url)
+        missing = p.watch(self.server.url + '/repos/a/missing/events')
+        p.start()
+        try:
+            received = [events_queue.get(timeout=5) for _ in range(2)]
+        finally:
+            p.stop()
+        assert [(event.id, feed.url) for event, feed in received] == [
+            ('1', self.url), ('2', self.url)
+        ]
+        assert errors == [missing]
+        assert missing.failures == 1
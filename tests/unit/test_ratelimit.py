@@ -0,0 +1,229 @@
+"""Unit tests for rate limit tracking and throttling."""
+import pytest
+import requests
+
+from github3 import ratelimit, session
+from .helper import mock
+
+
+def build_response(remaining=10, limit=60, reset=1000, resource=None,
+                   url='https://api.github.com/users/octocat'):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers.update({
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Reset': str(reset),
+    })
+    if resource:
+        response.headers['X-RateLimit-Resource'] = resource
+    return response
+
+
+def tracker_with(**kwargs):
+    tracker = ratelimit.RateLimitTracker()
+    tracker.update(build_response(**kwargs))
+    return tracker
+
+
+class TestResourceFor:
+    def test_search(self):
+        url = 'https://api.github.com/search/repositories?q=github3'
+        assert ratelimit.resource_for(url) == 'search'
+
+    def test_graphql(self):
+        assert ratelimit.resource_for('https://api.github.com/graphql') == (
+            'graphql'
+        )
+
+    def test_core(self):
+        url = 'https://api.github.com/repos/sigmavirus24/github3.py'
+        assert ratelimit.resource_for(url) == 'core'
+
+
+class TestRateLimitTracker:
+    def test_update_parses_headers(self):
+        """Show that budgets are read from the response headers."""
+        tracker = tracker_with(remaining=42, limit=5000, reset=1234)
+        budget = tracker.budget('core')
+        assert (budget.limit, budget.remaining, budget.reset) == (
+            5000, 42, 1234
+        )
+
+    def test_update_prefers_resource_header(self):
+        """Show that the X-RateLimit-Resource header wins over the URL."""
+        tracker = tracker_with(resource='search')
+        assert tracker.budget('search') is not None
+        assert tracker.budget('core') is None
+
+    def test_update_ignores_responses_without_headers(self):
+        """Show that responses without rate limit headers are skipped."""
+        tracker = ratelimit.RateLimitTracker()
+        response = requests.Response()
+        assert tracker.update(response) is None
+        assert tracker.budgets() == {}
+
+    def test_consume(self):
+        """Show that consuming spends from the known budget."""
+        tracker = tracker_with(remaining=2)
+        tracker.consume('core')
+        assert tracker.budget('core').remaining == 1
+
+    def test_available_after_reset(self):
+        """Show that the full limit is available once the window reset."""
+        budget = ratelimit.Budget('core', 60, 0, 1000)
+        assert budget.available(now=999) == 0
+        assert budget.available(now=1000) == 60
+
+
+class TestBlockingPolicy:
+    def test_no_delay_with_budget_left(self):
+        policy = ratelimit.BlockingPolicy()
+        assert policy.delay(tracker_with(remaining=1), 'core', 900) == 0
+
+    def test_waits_for_reset_when_exhausted(self):
+        policy = ratelimit.BlockingPolicy()
+        tracker = tracker_with(remaining=0, reset=1000)
+        assert policy.delay(tracker, 'core', 900) == 100
+
+    def test_respects_reserve(self):
+        policy = ratelimit.BlockingPolicy(reserve=5)
+        tracker = tracker_with(remaining=5, reset=1000)
+        assert policy.delay(tracker, 'core', 900) == 100
+
+
+class TestPacingPolicy:
+    def test_spreads_budget_over_window(self):
+        """Show that successive requests are given evenly spaced slots."""
+        policy = ratelimit.PacingPolicy()
+        tracker = tracker_with(remaining=10, reset=1000)
+        delays = [policy.delay(tracker, 'core', 900) for _ in range(3)]
+        assert delays == [0, 10, 20]
+
+    def test_unknown_budget(self):
+        """Show that nothing is delayed before the first response."""
+        policy = ratelimit.PacingPolicy()
+        assert policy.delay(ratelimit.RateLimitTracker(), 'core', 900) == 0
+
+    @mock.patch('github3.ratelimit.time')
+    def test_wait_sleeps(self, time_mock):
+        """Show that wait sleeps for the computed delay."""
+        time_mock.time.return_value = 900
+        policy = ratelimit.PacingPolicy()
+        tracker = tracker_with(remaining=0, reset=1000)
+        policy.wait(tracker, 'core')
+        time_mock.sleep.assert_called_once_with(100)
+
+
+class TestGitHubSessionRateLimits:
+    @mock.patch.object(requests.Session, 'request')
+    def test_request_updates_tracker(self, request_mock):
+        """Show that every response updates the session's budgets."""
+        request_mock.return_value = build_response(
+            remaining=7, url='https://api.github.com/search/code?q=a'
+        )
+        s = session.GitHubSession()
+        s.get('https://api.github.com/search/code?q=a')
+        assert s.rate_limits.budget('search').remaining == 7
+
+    @mock.patch.object(requests.Session, 'request')
+    def test_request_consults_policy(self, request_mock):
+        """Show that the policy is asked to wait before each request."""
+        request_mock.return_value = build_response()
+        s = session.GitHubSession()
+        s.rate_limit_policy = mock.Mock()
+        s.get('https://api.github.com/users/octocat')
+        s.rate_limit_policy.wait.assert_called_once_with(s.rate_limits,
+                                                         'core')
+
+
+class TestTokenPool:
+    def test_requires_tokens(self):
+        with pytest.raises(ValueError):
+            ratelimit.TokenPool([None, ''])
+
+    def test_prefers_unused_tokens(self):
+        """Show that tokens without a known budget are tried first."""
+        pool = ratelimit.TokenPool(['one', 'two'])
+        pool.tracker('one').update(build_response(remaining=4000,
+                                                  reset=2 ** 40))
+        assert pool.acquire('core') == 'two'
+
+    def test_rotates_unused_tokens(self):
+        """Show that concurrent first requests are spread over the tokens
+        whose budget is unknown."""
+        pool = ratelimit.TokenPool(['one', 'two', 'three'])
+        assert [pool.acquire('core') for _ in range(4)] == [
+            'one', 'two', 'three', 'one'
+        ]
+        pool.tracker('two').update(build_response(remaining=4000,
+                                                  reset=2 ** 40))
+        tokens = set(pool.acquire('core') for _ in range(4))
+        assert tokens == {'one', 'three'}
+
+    def test_picks_most_remaining(self):
+        """Show that the token with the largest budget is chosen."""
+        pool = ratelimit.TokenPool(['one', 'two', 'three'])
+        for token, remaining in [('one', 10), ('two', 30), ('three', 20)]:
+            pool.tracker(token).update(build_response(remaining=remaining,
+                                                      reset=2 ** 40))
+        assert pool.acquire('core') == 'two'
+        assert pool.acquire('core', exclude={'two'}) == 'three'
+
+    def test_all_exhausted(self):
+        """Show that the token resetting first is used when all are spent."""
+        pool = ratelimit.TokenPool(['one', 'two'])
+        pool.tracker('one').update(build_response(remaining=0,
+                                                  reset=2 ** 40 + 5))
+        pool.tracker('two').update(build_response(remaining=0,
+                                                  reset=2 ** 40))
+        assert pool.acquire('core') == 'two'
+        assert pool.acquire('core', exclude={'one', 'two'}) is None
+
+
+class TestGitHubSessionTokenPool:
+    def build_session(self):
+        s = session.GitHubSession()
+        s.token_pool_auth(['one', 'two'])
+        return s
+
+    def test_token_pool_auth(self):
+        """Show that the pool replaces other credentials."""
+        s = session.GitHubSession()
+        s.token_auth('single')
+        s.token_pool_auth(['one', 'two'])
+        assert 'Authorization' not in s.headers
+        assert s.has_auth()
+        s.token_auth('single')
+        assert s.token_pool is None
+
+    @mock.patch.object(requests.Session, 'request')
+    def test_sends_selected_token(self, request_mock):
+        """Show that each request carries one of the pooled tokens."""
+        request_mock.return_value = build_response(reset=2 ** 40)
+        s = self.build_session()
+        s.get('https://api.github.com/users/octocat')
+        headers = request_mock.call_args[1]['headers']
+        assert headers['Authorization'] in ('token one', 'token two')
+
+    @mock.patch.object(requests.Session, 'request')
+    def test_fails_over_when_exhausted(self, request_mock):
+        """Show that an exhausted token is replaced by another one."""
+        exhausted = build_response(remaining=0, reset=2 ** 40)
+        exhausted.status_code = 403
+        request_mock.side_effect = [exhausted,
+                                    build_response(reset=2 ** 40)]
+        s = self.build_session()
+        response = s.get('https://api.github.com/users/octocat')
+
+        assert response.status_code == 200
+        used = [c[1]['headers']['Authorization']
+                for c in request_mock.call_args_list]
+        assert sorted(used) == ['token one', 'token two']
+
+    def test_no_auth_disables_pool(self):
+        s = self.build_session()
+        with s.no_auth():
+            assert s.token_pool is None
+        assert s.token_pool is not None
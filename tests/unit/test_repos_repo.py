@@ -68,6 +68,21 @@ class TestRepository(helper.UnitHelper):
     described_class = Repository
     example_data = repo_example_data
 
+    def test_url_templates(self):
+        """Verify that each URL template expands its own URL."""
+        json = dict(repo_example_data, review_comment_url=(
+            'https://api.github.com/repos/octocat/Hello-World/pulls/'
+            'comments{/number}'
+        ))
+        repository = Repository(json, self.session)
+        assert repository.issue_events_urlt.expand(number=1) == (
+            'http://api.github.com/repos/octocat/Hello-World/issues/events/1'
+        )
+        assert repository.review_comment_urlt.expand(number=1) == (
+            'https://api.github.com/repos/octocat/Hello-World/pulls/'
+            'comments/1'
+        )
+
     def test_add_collaborator(self):
         """Verify the request to add a collaborator to a repository."""
         self.instance.add_collaborator('sigmavirus24')
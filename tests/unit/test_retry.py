@@ -0,0 +1,148 @@
+"""Unit tests for the retry engine."""
+import pytest
+import requests
+
+from github3 import retry, session
+from .helper import mock
+
+url = 'https://api.github.com/repos/sigmavirus24/github3.py'
+
+
+def build_response(status_code=200, **headers):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers.update(headers)
+    return response
+
+
+def fixed_policy(**kwargs):
+    kwargs.setdefault('jitter', False)
+    return retry.RetryPolicy(**kwargs)
+
+
+class TestRetryAfter:
+    def test_seconds(self):
+        assert retry.retry_after(build_response(403, **{
+            'Retry-After': '30'
+        })) == 30
+
+    def test_http_date_in_the_past(self):
+        assert retry.retry_after(build_response(403, **{
+            'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'
+        })) == 0
+
+    def test_missing_or_invalid(self):
+        assert retry.retry_after(build_response(403)) is None
+        assert retry.retry_after(build_response(403, **{
+            'Retry-After': 'soon'
+        })) is None
+
+
+class TestRetryPolicy:
+    def test_retries_gateway_errors_for_idempotent_methods(self):
+        policy = fixed_policy()
+        assert policy.response_reason('get', build_response(502)) == '502'
+        assert policy.response_reason('post', build_response(502)) is None
+
+    def test_retries_secondary_rate_limits_for_any_method(self):
+        policy = fixed_policy()
+        response = build_response(403, **{'Retry-After': '60'})
+        assert policy.response_reason('post', response) == (
+            'secondary_rate_limit'
+        )
+
+    def test_does_not_retry_plain_403(self):
+        policy = fixed_policy()
+        assert policy.response_reason('get', build_response(403)) is None
+
+    def test_error_reason(self):
+        policy = fixed_policy()
+        reset = requests.exceptions.ConnectionError('reset')
+        assert policy.error_reason('get', reset) == 'connection'
+        assert policy.error_reason('post', reset) is None
+        timeout = requests.exceptions.ReadTimeout('slow')
+        assert policy.error_reason('get', timeout) == 'timeout'
+
+    def test_delay_backs_off_exponentially(self):
+        policy = fixed_policy(backoff_factor=1, backoff_max=5)
+        assert [policy.delay(a) for a in range(4)] == [1, 2, 4, 5]
+
+    def test_delay_prefers_retry_after(self):
+        policy = fixed_policy()
+        response = build_response(403, **{'Retry-After': '42'})
+        assert policy.delay(0, response) == 42
+
+    def test_jitter_stays_within_backoff(self):
+        policy = retry.RetryPolicy(backoff_factor=1)
+        assert all(0 <= policy.delay(2) <= 4 for _ in range(20))
+
+
+@mock.patch('github3.retry.time')
+class TestRetryEngine:
+    def test_retries_until_success(self, time_mock):
+        engine = retry.RetryEngine(fixed_policy())
+        send = mock.Mock(side_effect=[build_response(502),
+                                      build_response(503),
+                                      build_response(200)])
+        response = engine.send('GET', url, send)
+
+        assert response.status_code == 200
+        assert response.retries == 2
+        assert send.call_count == 3
+        assert time_mock.sleep.call_count == 2
+        assert engine.stats.as_dict() == {
+            'requests': 1, 'retries': 2, 'exhausted': 0,
+            'reasons': {'502': 1, '503': 1},
+        }
+
+    def test_closes_discarded_responses(self, time_mock):
+        """Show that retried responses release their connection."""
+        engine = retry.RetryEngine(fixed_policy(total=1))
+        responses = [build_response(502), build_response(502)]
+        for response in responses:
+            response.raw = mock.Mock()
+        response = engine.send('GET', url, mock.Mock(side_effect=responses))
+
+        assert response is responses[1]
+        assert responses[0].raw.close.called is True
+        assert responses[1].raw.close.called is False
+
+    def test_gives_up_after_total(self, time_mock):
+        engine = retry.RetryEngine(fixed_policy(total=1))
+        send = mock.Mock(return_value=build_response(504))
+        response = engine.send('GET', url, send)
+
+        assert response.status_code == 504
+        assert send.call_count == 2
+        assert engine.stats.exhausted == 1
+
+    def test_reraises_connection_errors(self, time_mock):
+        engine = retry.RetryEngine(fixed_policy(total=2))
+        send = mock.Mock(
+            side_effect=requests.exceptions.ConnectionError('reset')
+        )
+        with pytest.raises(requests.exceptions.ConnectionError):
+            engine.send('GET', url, send)
+        assert send.call_count == 3
+
+    def test_overrides(self, time_mock):
+        engine = retry.RetryEngine(fixed_policy())
+        patient = fixed_policy(total=10)
+        engine.override(r'/stats/', patient)
+        assert engine.policy_for(url + '/stats/contributors') is patient
+        assert engine.policy_for(url) is engine.policy
+
+
+class TestGitHubSessionRetry:
+    @mock.patch('github3.retry.time')
+    @mock.patch.object(requests.Session, 'request')
+    def test_request_uses_retry_engine(self, request_mock, time_mock):
+        """Show that the session retries through its engine."""
+        request_mock.side_effect = [build_response(502),
+                                    build_response(200)]
+        s = session.GitHubSession()
+        s.retry = retry.RetryEngine(fixed_policy())
+        response = s.get(url)
+        assert response.status_code == 200
+        assert request_mock.call_count == 2
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for sharded searches."""
+import datetime
+import re
+
+import pytest
+
+from github3 import sharding
+from github3.github import GitHub
+from github3.ratelimit import BlockingPolicy
+from .helper import mock
+
+START = datetime.datetime(2016, 1, 1)
+
+
+def repositories(count, step=datetime.timedelta(hours=1)):
+    return [{
+        'id': i,
+        'name': 'r{0}'.format(i),
+        'full_name': 'a/r{0}'.format(i),
+        'url': 'https://api.github.com/repos/a/r{0}'.format(i),
+        'created_at': (START + step * i).strftime(sharding.TIMESTAMP_FORMAT),
+    } for i in range(count)]
+
+
+class FakeSearch(object):
+    """Answers searches restricted by ``created:`` from a list of
+    repositories and records the queries."""
+
+    def __init__(self, items, extra=None):
+        self.items = items
+        self.extra = extra
+        self.queries = []
+
+    def get(self, url, params=None, headers=None):
+        if params is not None:
+            query, page, per_page = params['q'], 1, params['per_page']
+        else:
+            query, page, per_page = url.split('|')
+            page, per_page = int(page), int(per_page)
+        self.queries.append((query, page))
+        low, high = re.search(r'created:(\S+)\.\.(\S+)', query).groups()
+        matches = [i for i in self.items if low <= i['created_at'] <= high]
+        found = matches[:sharding.RESULT_CAP]
+        items = found[(page - 1) * per_page:page * per_page]
+        if self.extra is not None:
+            items.append(self.extra)
+        links = {}
+        if page * per_page < len(found):
+            links['next'] = {
+                'url': '{0}|{1}|{2}'.format(query, page + 1, per_page)
+            }
+        response = mock.Mock(status_code=200, content=b'{}', headers={},
+                             links=links)
+        response.json.return_value = {'total_count': len(matches),
+                                      'incomplete_results': False,
+                                      'items': items}
+        return response
+
+
+class TestShardedSearch:
+    def setup_method(self, method):
+        self.gh = GitHub()
+
+    def search(self, fake, query='org:a', **kwargs):
+        search = sharding.ShardedSearch(self.gh, 'repositories', query,
+                                        **kwargs)
+        with mock.patch.object(self.gh, '_get', side_effect=fake.get):
+            results = list(search)
+        return search, results
+
+    def test_retrieves_every_result(self):
+        """Show that queries matching more than the cap are split until
+        every shard fits."""
+        fake = FakeSearch(repositories(2500))
+        search, results = self.search(fake)
+        assert sorted(r.repository.id for r in results) == list(range(2500))
+        assert search.total_count == 2500
+        assert search.truncated == []
+        assert sum(s.total_count for s in search.shards) == 2500
+        assert all(q.startswith('org:a created:') for q, _ in fake.queries)
+
+    def test_small_searches_are_not_split(self):
+        fake = FakeSearch(repositories(150))
+        search, results = self.search(fake)
+        assert len(results) == 150
+        assert [page for _, page in fake.queries] == [1, 2]
+        assert search.shards == [search.root]
+
+    def test_deduplicates(self):
+        """Show that a result listed by several shards is yielded once."""
+        items = repositories(1500)
+        fake = FakeSearch(items, extra=items[0])
+        _, results = self.search(fake)
+        assert len(results) == 1500
+
+    def test_truncated_shards(self):
+        """Show that shards of a single second are not split further."""
+        fake = FakeSearch(repositories(1200, datetime.timedelta(0)))
+        search, results = self.search(fake)
+        assert len(results) == sharding.RESULT_CAP
+        assert [str(s) for s in search.truncated] == [
+            'created:2016-01-01T00:00:00Z..2016-01-01T00:00:00Z'
+        ]
+
+    def test_paces_requests(self):
+        """Show that requests are paced unless the session has a policy."""
+        fake = FakeSearch(repositories(10))
+        with mock.patch.object(sharding.PacingPolicy, 'wait') as wait:
+            self.search(fake)
+            assert wait.call_count == 1
+            self.gh.session.rate_limit_policy = BlockingPolicy()
+            self.search(fake)
+            assert wait.call_count == 1
+
+    @pytest.mark.parametrize('query, qualifier, low, high', [
+        ('created:2016-01-02', 'created', '2016-01-02T00:00:00Z',
+         '2016-01-02T23:59:59Z'),
+        ('created:2016-01-02..*', 'created', '2016-01-02T00:00:00Z', None),
+        ('created:>2016-01-02', 'created', '2016-01-03T00:00:00Z', None),
+        ('created:<2016-01-02', 'created', '2007-10-01T00:00:00Z',
+         '2016-01-01T23:59:59Z'),
+        ('stars:>=10', 'stars', 10, None),
+        ('stars:<10', 'stars', 0, 9),
+        ('stars:10..20', 'stars', 10, 20),
+    ])
+    def test_restricted_queries(self, query, qualifier, low, high):
+        """Show that the range in the query is the range searched."""
+        search = sharding.ShardedSearch(self.gh, 'repositories',
+                                        'a ' + query + ' b', qualifier)
+        assert search.query == 'a b'
+        assert sharding._format(search.root.low) == str(low)
+        if high is not None:
+            assert sharding._format(search.root.high) == str(high)
+
+    def test_invalid_searches(self):
+        with pytest.raises(ValueError):
+            sharding.ShardedSearch(self.gh, 'gists', 'a')
+        with pytest.raises(ValueError):
+            sharding.ShardedSearch(self.gh, 'issues', 'a', 'language')
+
+
+class TestShard:
+    def test_split_dates(self):
+        shard = sharding.Shard('created', START,
+                               START + datetime.timedelta(seconds=9))
+        halves = shard.split()
+        assert [str(s) for s in halves] == [
+            'created:2016-01-01T00:00:00Z..2016-01-01T00:00:04Z',
+            'created:2016-01-01T00:00:05Z..2016-01-01T00:00:09Z',
+        ]
+        assert len(shard.split(20)) == 10
+
+    def test_split_open_ranges(self):
+        shard = sharding.Shard('stars', 4, None)
+        assert [str(s) for s in shard.split()] == ['stars:4..9',
+                                                   'stars:10..*']
+
+    def test_single_values_cannot_be_split(self):
+        assert sharding.Shard('stars', 3, 3).split() == []
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the local stand-in for GitHub's API."""
+import json
+import os
+
+import pytest
+
+from github3 import exceptions
+from github3.standin import StandInServer
+from github3.structs import GitHubIterator
+from github3.users import ShortUser
+
+from . import helper
+
+get_user_example_data = helper.create_example_data_helper('user_example')
+
+CASSETTES = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'cassettes')
+
+
+def get(server, url, **headers):
+    status, headers, body = server.respond('GET', url, headers)
+    return status, headers, json.loads(body.decode('utf-8')) if body else None
+
+
+class TestStandInServer:
+    def setup_method(self, method):
+        self.server = StandInServer(per_page=2, rate_limit=10)
+        self.server.add('/users', [{'id': i} for i in range(5)])
+        self.server.add('/users/octocat', {
+            'login': 'octocat',
+            'url': 'https://api.github.com/users/octocat',
+        })
+
+    def test_paginates_arrays(self):
+        """Show that arrays are sliced and linked like GitHub does."""
+        status, headers, items = get(self.server, '/users?page=2')
+        assert status == 200
+        assert items == [{'id': 2}, {'id': 3}]
+        link = headers['Link']
+        assert '/users?page=3>; rel="next"' in link
+        assert '/users?page=3>; rel="last"' in link
+        assert '/users?page=1>; rel="first"' in link
+        assert '/users?page=1>; rel="prev"' in link
+
+    def test_per_page(self):
+        """Show that the requested page size is honoured."""
+        status, headers, items = get(self.server, '/users?per_page=100')
+        assert len(items) == 5
+        assert 'Link' not in headers
+
+    def test_rewrites_urls(self):
+        """Show that links point at the stand-in."""
+        _, _, user = get(self.server, '/users/octocat')
+        assert user['url'] == self.server.url + '/users/octocat'
+
+    def test_not_found(self):
+        status, _, body = get(self.server, '/users/nobody')
+        assert status == 404
+        assert body['message'] == 'Not Found'
+
+    def test_conditional_requests(self):
+        """Show that a matching ETag is answered with a free 304."""
+        _, headers, _ = get(self.server, '/users/octocat')
+        remaining = int(headers['X-RateLimit-Remaining'])
+        status, headers, body = get(self.server, '/users/octocat',
+                                    **{'If-None-Match': headers['ETag']})
+        assert status == 304
+        assert body is None
+        assert int(headers['X-RateLimit-Remaining']) == remaining
+
+    def test_last_modified(self):
+        """Show that documents unchanged since If-Modified-Since are
+        answered with 304."""
+        _, headers, _ = get(self.server, '/users/octocat')
+        since = {'If-Modified-Since': headers['Last-Modified']}
+        status, _, _ = get(self.server, '/users/octocat', **since)
+        assert status == 304
+        self.server.add('/users/octocat', {'login': 'octocat'})
+        status, _, _ = get(self.server, '/users/octocat', **since)
+        assert status == 200
+
+    def test_raw_blobs(self):
+        """Show that base64 encoded documents can be requested raw."""
+        self.server.add('/repos/a/b/git/blobs/abc', {
+            'sha': 'abc', 'encoding': 'base64', 'content': 'aGVsbG8K',
+        })
+        status, headers, body = self.server.respond(
+            'GET', '/repos/a/b/git/blobs/abc',
+            {'Accept': 'application/vnd.github.v3.raw'}
+        )
+        assert status == 200
+        assert body == b'hello\n'
+        assert headers['Content-Type'] == 'application/vnd.github.v3.raw'
+
+    def test_enforces_rate_limits(self):
+        """Show that requests are refused once the budget is spent."""
+        for remaining in range(9, -1, -1):
+            status, headers, _ = get(self.server, '/users/octocat')
+            assert status == 200
+            assert headers['X-RateLimit-Remaining'] == str(remaining)
+        status, headers, body = get(self.server, '/users/octocat')
+        assert status == 403
+        assert headers['X-RateLimit-Remaining'] == '0'
+        assert 'rate limit' in body['message']
+
+        # Other credentials have their own budget
+        status, _, _ = get(self.server, '/users/octocat',
+                           Authorization='token other')
+        assert status == 200
+
+        self.server.reset_rate_limits()
+        assert get(self.server, '/users/octocat')[0] == 200
+
+    def test_search_rate_limit(self):
+        server = StandInServer(search_rate_limit=1)
+        server.add('/search/repositories', {'total_count': 0, 'items': []})
+        status, headers, _ = get(server, '/search/repositories?q=github3')
+        assert status == 200
+        assert headers['X-RateLimit-Resource'] == 'search'
+        assert get(server, '/search/repositories?q=github3')[0] == 403
+
+    def test_rate_limit_endpoint(self):
+        """Show that /rate_limit reports budgets without spending them."""
+        get(self.server, '/users/octocat')
+        for _ in range(2):
+            status, _, body = get(self.server, '/rate_limit')
+            assert status == 200
+            assert body['resources']['core']['remaining'] == 9
+
+    def test_statistics_are_pending(self):
+        """Show that statistics are served after a 202."""
+        server = StandInServer(stats_pending=2)
+        path = '/repos/octocat/Hello-World/stats/contributors'
+        server.add(path, [{'total': 1}])
+        assert get(server, path)[0] == 202
+        assert get(server, path)[0] == 202
+        assert get(server, path)[:3:2] == (200, [{'total': 1}])
+
+    def test_injected_errors(self):
+        server = StandInServer(error_rate=1, error_status=503)
+        server.add('/users/octocat', {'login': 'octocat'})
+        assert get(server, '/users/octocat')[0] == 503
+        assert server.status_counts == {503: 1}
+        assert server.request_count == 1
+
+    def test_add_cassette(self):
+        """Show that recorded, gzipped responses are served."""
+        self.server.add_cassette(
+            os.path.join(CASSETTES, 'GitHub_repository.json')
+        )
+        status, _, repository = get(self.server,
+                                    '/repos/sigmavirus24/github3.py')
+        assert status == 200
+        assert repository['full_name'] == 'sigmavirus24/github3.py'
+
+
+class TestStandInServerHTTP:
+    def test_github_client(self):
+        """Show that a client talks to the stand-in over HTTP."""
+        server = StandInServer(per_page=2, rate_limit=4)
+        user = get_user_example_data()
+        server.add('/users', [dict(user, id=i) for i in range(5)])
+        with server:
+            gh = server.github()
+            assert gh.session.base_url == server.url
+
+            def users():
+                return GitHubIterator(-1, server.url + '/users', ShortUser,
+                                      gh, params={'per_page': 2})
+
+            assert [u.id for u in users()] == list(range(5))
+            assert server.status_counts == {200: 3}
+            with pytest.raises(exceptions.ForbiddenError):
+                list(users())
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for incremental JSON parsing."""
+import itertools
+import json
+
+import pytest
+
+from github3 import exceptions, streaming
+from github3.structs import GitHubIterator, SearchIterator
+from github3.users import ShortUser
+
+from . import helper
+
+get_user_example_data = helper.create_example_data_helper('user_example')
+
+
+def chunked(document, size):
+    body = json.dumps(document, ensure_ascii=False).encode('utf-8')
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class TestJSONArrayStream:
+    documents = [
+        [],
+        [1, 2.5, -3, True, None, 'four'],
+        [{'a': u'é "quoted" ] } [', 'b': [1, {'c': None}]}, 12345],
+        [{'index': i, 'text': u'ü' * i} for i in range(30)],
+    ]
+
+    @pytest.mark.parametrize('size', [1, 3, 64, 1 << 20])
+    def test_arrays(self, size):
+        """Show that elements survive any chunk boundary."""
+        for document in self.documents:
+            stream = streaming.JSONArrayStream(chunked(document, size))
+            assert list(stream) == document
+
+    def test_yields_before_the_end(self):
+        """Show that elements are yielded before the array is complete."""
+        chunks = iter([b'[{"a": 1}, ', b'{"b"'])
+        stream = iter(streaming.JSONArrayStream(chunks))
+        assert next(stream) == {'a': 1}
+
+    @pytest.mark.parametrize('size', [1, 7, 1 << 20])
+    def test_array_in_object(self, size):
+        document = {'total_count': 2, 'incomplete_results': False,
+                    'items': [{'id': 1}, {'id': 2}], 'after': [3]}
+        stream = streaming.JSONArrayStream(chunked(document, size), 'items')
+        assert list(stream) == document['items']
+        assert stream.members == {'total_count': 2,
+                                  'incomplete_results': False,
+                                  'after': [3]}
+
+    @pytest.mark.parametrize('body', [b'[1, 2', b'{"a": 1}', b'[1 2]',
+                                      b'[1],'])
+    def test_invalid_documents(self, body):
+        with pytest.raises(ValueError):
+            list(streaming.JSONArrayStream([body]))
+
+
+def streamed_response(document, status_code=200):
+    response = helper.mock.Mock(status_code=status_code, links={},
+                                headers={})
+    response.iter_content.return_value = chunked(document, 10)
+    return response
+
+
+class TestGitHubIteratorStream(helper.UnitHelper):
+    described_class = GitHubIterator
+
+    def create_instance_of_described_class(self):
+        instance = self.described_class(count=-1,
+                                        url='https://api.github.com/users',
+                                        cls=ShortUser, session=self.session)
+        instance.stream = True
+        return instance
+
+    def test_streams_pages(self):
+        """Show that pages are requested and parsed as streams."""
+        response = streamed_response([get_user_example_data()] * 3)
+        self.session.get.return_value = response
+        users = list(self.instance)
+
+        assert [u.login for u in users] == ['octocat'] * 3
+        assert self.session.get.call_args[1]['stream'] is True
+        assert response.close.called is True
+
+    def test_stopping_early_closes_the_response(self):
+        """Show that the response is closed when the consumer stops before
+        the end of the page."""
+        response = streamed_response([get_user_example_data()] * 3)
+        self.session.get.return_value = response
+        # Keep the streams alive so that closing them depends on the
+        # iterator rather than on garbage collection
+        streams = []
+        original = streaming.stream_array
+
+        def stream_array(*args):
+            streams.append(original(*args))
+            return streams[-1]
+
+        with helper.mock.patch.object(streaming, 'stream_array',
+                                      side_effect=stream_array):
+            users = iter(self.instance)
+            assert [u.login for u in itertools.islice(users, 1)] == [
+                'octocat'
+            ]
+            assert response.close.called is False
+
+            users.close()
+        assert response.close.called is True
+
+    def test_invalid_body(self):
+        self.session.get.return_value = streamed_response({'a': 1})
+        with pytest.raises(exceptions.UnprocessableResponseBody):
+            list(self.instance)
+
+
+class TestSearchIteratorStream(helper.UnitHelper):
+    described_class = SearchIterator
+
+    def create_instance_of_described_class(self):
+        instance = self.described_class(
+            count=-1, url='https://api.github.com/search/users',
+            cls=ShortUser, session=self.session
+        )
+        instance.stream = True
+        return instance
+
+    def test_streams_items(self):
+        """Show that items are streamed and total_count is read."""
+        self.session.get.return_value = streamed_response({
+            'total_count': 2,
+            'items': [get_user_example_data(), get_user_example_data()],
+        })
+        users = list(self.instance)
+
+        assert len(users) == 2
+        assert self.instance.total_count == 2
+        assert self.instance.items == []
@@ -1,3 +1,5 @@
+import time
+
 from .helper import UnitHelper, mock
 from github3.structs import GitHubIterator
 
@@ -61,3 +63,142 @@ class TestGitHubIterator(UnitHelper):
     def test_str(self):
         """Show that instance string is formatted correctly."""
         assert str(self.instance).startswith('<GitHubIterator')
+
+
+class TestGitHubIteratorEventTypes(UnitHelper):
+    described_class = GitHubIterator
+
+    def create_instance_of_described_class(self):
+        return self.described_class(count=-1,
+                                    url='https://api.github.com/events',
+                                    cls=dict, session=self.session)
+
+    def test_skips_other_event_types(self):
+        """Show that only events of the requested types are returned."""
+        events = [{'id': '1', 'type': 'PushEvent'},
+                  {'id': '2', 'type': 'WatchEvent'},
+                  {'id': '3', 'type': 'PushEvent'}]
+        self.session.get.return_value = mock.Mock(
+            status_code=200, json=lambda: events, links={}, headers={}
+        )
+        self.instance.event_types = {'PushEvent'}
+        assert [e['id'] for e in self.instance] == ['1', '3']
+
+    def test_skips_items_that_are_not_events(self):
+        """Show that items other than JSON objects are skipped."""
+        self.session.get.return_value = mock.Mock(
+            status_code=200, links={}, headers={},
+            json=lambda: ['PushEvent', {'id': '1', 'type': 'PushEvent'}]
+        )
+        self.instance.event_types = {'PushEvent'}
+        assert [e['id'] for e in self.instance] == ['1']
+
+
+class TestGitHubIteratorRaw(UnitHelper):
+    described_class = GitHubIterator
+
+    def create_instance_of_described_class(self):
+        self.cls = mock.Mock()
+        instance = self.described_class(count=3,
+                                        url='https://api.github.com/users',
+                                        cls=self.cls, session=self.session)
+        instance.raw = True
+        return instance
+
+    def test_yields_dictionaries(self):
+        """Show that raw mode skips creating objects but keeps the rest."""
+        items = [{'id': i} for i in range(5)]
+        self.session.get.return_value = mock.Mock(
+            status_code=200, json=lambda: items, links={},
+            headers={'ETag': '"abc"'}
+        )
+        assert list(self.instance) == items[:3]
+        assert self.cls.called is False
+        assert self.instance.etag == '"abc"'
+        assert self.instance.count == 0
+
+
+class TestGitHubIteratorPrefetch(UnitHelper):
+    described_class = GitHubIterator
+
+    def create_instance_of_described_class(self):
+        self.url = 'https://api.github.com/users'
+        instance = self.described_class(count=-1, url=self.url,
+                                        cls=int,
+                                        session=self.session)
+        instance.prefetch = 3
+        return instance
+
+    def page_url(self, page):
+        return '{0}?page={1}&per_page=2'.format(self.url, page)
+
+    def respond_with_pages(self, last_page):
+        def get(url, params=None, headers=None):
+            page = 1
+            if '?' in url:
+                page = int(url.split('page=')[1].split('&')[0])
+            links = {'last': {'url': self.page_url(last_page)}}
+            if page < last_page:
+                links['next'] = {'url': self.page_url(page + 1)}
+            items = [page * 10, page * 10 + 1]
+            response = mock.Mock(status_code=200, json=lambda: items,
+                                 links=links, headers={})
+            self.responses[page] = response
+            return response
+
+        self.responses = {}
+
+        self.session.get.side_effect = get
+
+    def requested_urls(self):
+        return [c[0][0] for c in self.session.get.call_args_list]
+
+    def test_remaining_page_urls(self):
+        """Show that page URLs are derived from the last link."""
+        response = mock.Mock(links={
+            'next': {'url': self.page_url(2)},
+            'last': {'url': self.page_url(4)},
+        })
+        urls = GitHubIterator._remaining_page_urls(response)
+        assert urls == [self.page_url(2), self.page_url(3),
+                        self.page_url(4)]
+
+    def test_remaining_page_urls_without_last(self):
+        """Show that nothing is prefetched without a last link."""
+        response = mock.Mock(links={'next': {'url': self.page_url(2)}})
+        assert GitHubIterator._remaining_page_urls(response) == []
+
+    def test_yields_items_in_order(self):
+        """Show that prefetched pages are yielded in page order."""
+        self.respond_with_pages(5)
+        assert list(self.instance) == [10, 11, 20, 21, 30, 31, 40, 41,
+                                       50, 51]
+        assert sorted(self.requested_urls()[1:]) == [
+            self.page_url(p) for p in range(2, 6)
+        ]
+
+    def test_stops_prefetching_at_count(self):
+        """Show that no more pages are requested than count needs."""
+        self.respond_with_pages(50)
+        self.instance.count = self.instance.original = 5
+        assert list(self.instance) == [10, 11, 20, 21, 30]
+        assert len(self.requested_urls()) == 3
+
+    def test_closes_unconsumed_pages(self):
+        """Show that pages fetched ahead are closed when iteration stops
+        early."""
+        def wait_for(condition):
+            deadline = time.time() + 5
+            while not condition() and time.time() < deadline:
+                time.sleep(0.01)
+
+        self.respond_with_pages(5)
+        iterator = iter(self.instance)
+        assert [next(iterator) for _ in range(3)] == [10, 11, 20]
+        # Pages 3 and 4 were requested ahead and will never be yielded
+        wait_for(lambda: 3 in self.responses and 4 in self.responses)
+        iterator.close()
+
+        wait_for(lambda: all(self.responses[p].close.called for p in (3, 4)))
+        assert self.responses[3].close.called is True
+        assert self.responses[4].close.called is True
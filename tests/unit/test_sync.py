@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for incremental synchronization."""
+import pytest
+
+from github3 import sync
+from .helper import mock
+
+
+def model(id, updated_at):
+    return mock.Mock(id=id, updated_at=updated_at)
+
+
+class FakeScope(object):
+    """Serves a different listing on every run and records ``since``."""
+
+    def __init__(self, *runs):
+        self.runs = list(runs)
+        self.since = []
+
+    def fetch(self, since):
+        self.since.append(since)
+        return iter(self.runs.pop(0))
+
+
+RESOURCE = sync.Resource(
+    'things', lambda scope, since: scope.fetch(since),
+    lambda thing: thing.updated_at, scope_key=lambda scope: 'scope',
+)
+
+
+class TestSyncEngine:
+    def setup_method(self, method):
+        self.engine = sync.SyncEngine()
+
+    def test_fetches_the_delta(self):
+        """Show that the next run starts at the high-water mark."""
+        scope = FakeScope([model(1, '2016-01-01T00:00:00Z'),
+                           model(2, '2016-01-02T00:00:00Z')], [])
+        assert [m.id for m in self.engine.changes(RESOURCE, scope)] == [1, 2]
+        assert list(self.engine.changes(RESOURCE, scope)) == []
+        assert scope.since == [None, '2016-01-02T00:00:00Z']
+        assert self.engine.high_water_mark(RESOURCE, scope) == (
+            '2016-01-02T00:00:00Z'
+        )
+
+    def test_skips_objects_seen_at_the_mark(self):
+        """Show that since includes the mark but only new objects are
+        yielded."""
+        mark = '2016-01-02T00:00:00Z'
+        scope = FakeScope([model(1, mark)],
+                          [model(1, mark), model(2, mark),
+                           model(3, '2016-01-03T00:00:00Z')],
+                          [model(3, '2016-01-03T00:00:00Z')])
+        list(self.engine.changes(RESOURCE, scope))
+        assert [m.id for m in self.engine.changes(RESOURCE, scope)] == [2, 3]
+        assert list(self.engine.changes(RESOURCE, scope)) == []
+
+    def test_merges_by_id(self):
+        """Show that an object is yielded again only when it changed."""
+        scope = FakeScope([model(1, '2016-01-01T00:00:00Z'),
+                           model(2, '2016-01-01T00:00:00Z'),
+                           model(1, '2016-01-01T00:00:00Z'),
+                           model(2, '2016-01-05T00:00:00Z')])
+        changes = [(m.id, m.updated_at)
+                   for m in self.engine.changes(RESOURCE, scope)]
+        assert changes == [(1, '2016-01-01T00:00:00Z'),
+                           (2, '2016-01-01T00:00:00Z'),
+                           (2, '2016-01-05T00:00:00Z')]
+
+    def test_interrupted_runs_keep_the_mark(self):
+        scope = FakeScope([model(1, '2016-01-01T00:00:00Z'),
+                           model(2, '2016-01-02T00:00:00Z')])
+        changes = self.engine.changes(RESOURCE, scope)
+        next(changes)
+        changes.close()
+        assert self.engine.high_water_mark(RESOURCE, scope) is None
+
+    def test_reset(self):
+        scope = FakeScope([model(1, '2016-01-01T00:00:00Z')], [])
+        list(self.engine.changes(RESOURCE, scope))
+        self.engine.reset(RESOURCE, scope)
+        list(self.engine.changes(RESOURCE, scope))
+        assert scope.since == [None, None]
+
+    def test_changes_for(self):
+        scopes = [FakeScope([model(1, '2016-01-01T00:00:00Z')])
+                  for _ in range(3)]
+        resource = sync.Resource('things', RESOURCE.fetch, RESOURCE.mark,
+                                 scope_key=id)
+        results = list(self.engine.changes_for(resource, scopes, workers=2))
+        assert [len(r.result) for r in results] == [1, 1, 1]
+
+    def test_unknown_resource(self):
+        with pytest.raises(ValueError):
+            list(self.engine.changes('carrier-pigeons', None))
+
+
+class TestResources:
+    def test_issues(self):
+        """Show that issues are listed in the order they were updated."""
+        repository = mock.Mock()
+        repository.__str__ = mock.Mock(return_value='sigmavirus24/github3.py')
+        repository.issues.return_value = iter([])
+        engine = sync.SyncEngine()
+        list(engine.changes('issues', repository))
+        repository.issues.assert_called_once_with(
+            state='all', sort='updated', direction='asc', since=None
+        )
+
+    def test_users(self):
+        """Show that users are tracked by id."""
+        github = mock.Mock()
+        github.session.base_url = 'https://api.github.com'
+        github.all_users.side_effect = [iter([mock.Mock(id=3)]), iter([])]
+        engine = sync.SyncEngine()
+        list(engine.changes('users', github))
+        list(engine.changes('users', github))
+        assert github.all_users.call_args_list == [
+            mock.call(since=None), mock.call(since=3)
+        ]
+
+
+class TestSQLiteStateStore:
+    def test_persists(self, tmpdir):
+        path = str(tmpdir.join('sync.db'))
+        store = sync.SQLiteStateStore(path)
+        store.set('issues', 'a/b', {'mark': 'x', 'seen': [1]})
+        store.close()
+
+        store = sync.SQLiteStateStore(path)
+        assert store.get('issues', 'a/b') == {'mark': 'x', 'seen': [1]}
+        store.delete('issues', 'a/b')
+        assert store.get('issues', 'a/b') is None
+        store.close()
@@ -0,0 +1,69 @@
+"""Unit tests for the pluggable transport adapters."""
+import pytest
+import requests
+
+from github3 import session, transport
+from github3.standin import StandInServer
+from .helper import mock
+
+
+class TestTransportFor:
+    def test_requests(self):
+        adapter = transport.transport_for('requests', pool_maxsize=64)
+        assert isinstance(adapter, requests.adapters.HTTPAdapter)
+        assert adapter._pool_maxsize == 64
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            transport.transport_for('carrier-pigeon')
+
+
+class TestUseTransport:
+    def test_mounts_the_adapter(self):
+        """Show that both schemes use the adapter and old ones are closed."""
+        s = session.GitHubSession()
+        old = s.adapters['https://'] = mock.Mock()
+        adapter = requests.adapters.HTTPAdapter()
+        s.use_transport(adapter)
+        assert s.get_adapter('https://api.github.com/users') is adapter
+        assert s.get_adapter('http://localhost/users') is adapter
+        old.close.assert_called_once_with()
+
+
+class TestHTTPXAdapter:
+    def setup_method(self, method):
+        pytest.importorskip('httpx')
+        self.server = StandInServer(per_page=2)
+        self.server.add('/users/octocat', {'login': 'octocat'})
+        self.server.add('/users', [{'id': i} for i in range(3)])
+        self.server.start()
+        self.session = session.GitHubSession()
+        self.session.use_transport(transport.HTTPXAdapter(http2=False))
+
+    def teardown_method(self, method):
+        self.session.close()
+        self.server.stop()
+
+    def test_send(self):
+        response = self.session.get(self.server.url + '/users/octocat')
+        assert response.status_code == 200
+        assert response.json() == {'login': 'octocat'}
+        assert response.headers['x-ratelimit-resource'] == 'core'
+        assert response.encoding == 'utf-8'
+
+    def test_links(self):
+        """Show that pagination sees the Link header."""
+        response = self.session.get(self.server.url + '/users')
+        assert response.links['next']['url'].endswith('/users?page=2')
+
+    def test_stream(self):
+        response = self.session.get(self.server.url + '/users', stream=True)
+        body = b''.join(response.iter_content(4))
+        assert body == b'[{"id": 0}, {"id": 1}]'
+
+    def test_connection_errors(self):
+        """Show that httpx's exceptions are translated."""
+        url = self.server.url + '/users'
+        self.server.stop()
+        with pytest.raises(requests.exceptions.ConnectionError):
+            self.session.get(url)
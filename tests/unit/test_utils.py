@@ -1,5 +1,6 @@
 from datetime import datetime
-from github3.utils import stream_response_to_file, timestamp_parameter
+from github3.utils import (parse_timestamp, stream_response_to_file,
+                           timestamp_parameter, utc)
 
 import io
 import mock
@@ -56,6 +57,29 @@ def response():
     return r
 
 
+class TestParseTimestamp:
+    def test_parses_github_timestamps(self):
+        dt = parse_timestamp('2015-06-18T19:53:04Z')
+        assert dt == datetime(2015, 6, 18, 19, 53, 4, tzinfo=utc)
+        assert dt.tzinfo is utc
+
+    def test_matches_strptime(self):
+        for timestamp in ('2000-01-01T00:00:00Z', '2016-02-29T23:59:59Z',
+                          '1999-12-31T12:00:00Z'):
+            expected = datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%SZ')
+            assert parse_timestamp(timestamp) == expected.replace(tzinfo=utc)
+
+    def test_reuses_parsed_timestamps(self):
+        first = parse_timestamp('2014-03-04T05:06:07Z')
+        assert parse_timestamp('2014-03-04T05:06:07Z') is first
+
+    def test_invalid_timestamps(self):
+        for timestamp in ('2015-02-30T00:00:00Z', '2015-06-18 19:53:04Z',
+                          '2016-01-14T10:57:56-08:00', 'fish'):
+            with pytest.raises(ValueError):
+                parse_timestamp(timestamp)
+
+
 class OpenFile:
     def __init__(self):
         self.data = b''